@@ -7,5 +7,6 @@ setup(
     author_email='kylebgorman@gmail.com',
     packages=['textgrid'],
     test_suite='tests',
+    entry_points={'console_scripts': ['textgrid = textgrid.cli:main']},
     description='Praat TextGrid manipulation.'
 )
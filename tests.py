@@ -516,6 +516,17 @@ class TestIntervalTier(unittest.TestCase):
         self.assertEqual(repr(temp[-1]), 'Interval(3.3, 3.5, None)')
         self.assertEqual(repr(temp[2]), 'Interval(2.4, 2.7, None)')
 
+    def test_iter_filled(self):
+        foo = textgrid.textgrid.IntervalTier('foo', maxTime=3.5)
+        foo.add(1.3, 2.4, 'bar')
+        foo.add(2.7, 3.3, 'baz')
+
+        self.assertListEqual(list(foo.iterFilled('null')),
+                             [(0.0, 1.3, 'null'), (1.3, 2.4, 'bar'),
+                              (2.4, 2.7, 'null'), (2.7, 3.3, 'baz'),
+                              (3.3, 3.5, 'null')])
+        self.assertEqual(foo._countFilled(), 5)
+
 
 class TestTextGrid(unittest.TestCase):
 
@@ -575,6 +586,1170 @@ class TestReadTextGrid(unittest.TestCase):
         assert abs(tg.tiers[0][0].maxTime - 1361.8925) < 0.01
 
 
+class TestDiff(unittest.TestCase):
+
+    def setUp(self):
+        self.a = textgrid.TextGrid('a')
+        words = textgrid.IntervalTier('words')
+        words.add(0.0, 1.0, 'spam')
+        words.add(1.0, 2.0, 'eggs')
+        words.add(3.0, 4.0, 'ham')
+        points = textgrid.PointTier('points')
+        points.add(0.5, 'foo')
+        points.add(1.5, 'bar')
+        self.a.append(words)
+        self.a.append(points)
+
+        self.b = textgrid.TextGrid('b')
+        words = textgrid.IntervalTier('words')
+        words.add(0.0, 1.00001, 'spam')
+        words.add(1.00001, 2.5, 'eggs')
+        words.add(5.0, 6.0, 'toast')
+        points = textgrid.PointTier('points')
+        points.add(0.5, 'baz')
+        points.add(1.75, 'bar')
+        self.b.append(words)
+        self.b.append(points)
+
+    def test_diff(self):
+        kinds = [(kind, k) for (kind, k, x, y) in
+                 textgrid.diff(self.a, self.b, tol=0.001)]
+        self.assertListEqual(kinds, [('shifted', 0), ('deleted', 0),
+                                     ('inserted', 0), ('relabeled', 1),
+                                     ('shifted', 1)])
+
+    def test_diff_tolerance(self):
+        kinds = [kind for (kind, k, x, y) in textgrid.diff(self.a, self.b)]
+        self.assertEqual(kinds[:2], ['shifted', 'shifted'])
+
+    def test_diff_equal(self):
+        self.assertListEqual(textgrid.diff(self.a, self.a), [])
+        self.assertListEqual(textgrid.diff(self.a, self.b, first=True),
+                             [('shifted', 0, self.a[0][0], self.b[0][0])])
+
+    def test_diff_missing_tier(self):
+        self.b = textgrid.TextGrid('b')
+        self.b.append(self.a[0])
+        self.assertListEqual(textgrid.diff(self.a, self.b),
+                             [('tier', 1, self.a[1], None)])
+        self.assertNotEqual(self.a, self.b)
+
+
+class TestBatchInsertion(unittest.TestCase):
+
+    def test_add_intervals(self):
+        foo = textgrid.IntervalTier('foo', maxTime=5.0)
+        foo.add(1.0, 2.0, 'bar')
+        foo.addIntervals([(3.0, 4.0, 'baz'),
+                          textgrid.Interval(0.0, 1.0, 'spam'),
+                          (2.0, 2.5, 'eggs')])
+
+        self.assertEqual(repr(foo), 'IntervalTier(foo, [Interval(0.0, 1.0, spam), Interval(1.0, 2.0, bar), Interval(2.0, 2.5, eggs), Interval(3.0, 4.0, baz)])')
+
+    def test_add_intervals_conflicts(self):
+        foo = textgrid.IntervalTier('foo', maxTime=5.0)
+        foo.add(1.0, 2.0, 'bar')
+
+        with self.assertRaises(ValueError) as cm:
+            foo.addIntervals([(1.5, 3.0, 'baz'), (4.0, 6.0, 'spam'),
+                              (3.5, 4.5, 'eggs')])
+        self.assertEqual(len(cm.exception.args[0]), 3)
+        self.assertEqual(len(foo), 1)
+
+        with self.assertRaises(ValueError) as cm:
+            foo.addIntervals([(3.0, 3.0, 'null'), (1.5, 3.0, 'baz'),
+                              [4.5, 4.0, 'backwards']])
+        self.assertListEqual(cm.exception.args[0][:2], [(3.0, 3.0, 'null'), (4.5, 4.0, 'backwards')])
+        self.assertEqual(len(cm.exception.args[0]), 3)
+        self.assertEqual(len(foo), 1)
+
+    def test_add_intervals_nested(self):
+        foo = textgrid.IntervalTier('foo')
+        with self.assertRaises(ValueError) as cm:
+            foo.addIntervals([(0.0, 10.0, 'a'), (1.0, 2.0, 'b'),
+                              (3.0, 4.0, 'c'), (5.0, 6.0, 'd')])
+        self.assertListEqual([y.mark for (x, y) in cm.exception.args[0]], ['b', 'c', 'd'])
+        self.assertTrue(all(x.mark == 'a' for (x, y) in cm.exception.args[0]))
+
+    def test_add_intervals_not_strict(self):
+        foo = textgrid.IntervalTier('foo')
+        foo.strict = False
+        foo.addIntervals([(1.5, 3.0, 'baz'), (1.0, 2.0, 'bar')])
+        self.assertEqual(len(foo), 2)
+        self.assertRaises(ValueError, foo.addIntervals, [(1.0, 2.0, 'bar')])
+
+    def test_add_points(self):
+        foo = textgrid.PointTier('foo')
+        foo.add(2.0, 'bar')
+        foo.addPoints([(4.0, 'baz'), textgrid.Point(1.0, 'spam')])
+
+        self.assertEqual(repr(foo), 'PointTier(foo, [Point(1.0, spam), Point(2.0, bar), Point(4.0, baz)])')
+
+        with self.assertRaises(ValueError) as cm:
+            foo.addPoints([(2.0, 'eggs'), (4.0, 'ham')])
+        self.assertEqual(len(cm.exception.args[0]), 2)
+        self.assertEqual(len(foo), 3)
+
+
+class TestAsyncIO(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        import os
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        cls.short_textgrid_path = os.path.join(base_dir, 'tests', 'data', 'short_format.TextGrid')
+        cls.long_textgrid_path = os.path.join(base_dir, 'tests', 'data', 'long_format.TextGrid')
+
+    def test_read_write(self):
+        import asyncio
+        from textgrid import aio
+
+        async def roundtrip():
+            tg = await aio.read(self.long_textgrid_path)
+            await aio.write(tg, 'test_aio.TextGrid')
+            return tg, await aio.read('test_aio.TextGrid')
+
+        tg, tg_copy = asyncio.run(roundtrip())
+        remove('test_aio.TextGrid')
+        self.assertEqual(repr(tg), repr(tg_copy))
+
+    def test_read_many(self):
+        import asyncio
+        from textgrid import aio
+
+        paths = [self.short_textgrid_path, self.long_textgrid_path] * 3
+        grids = asyncio.run(aio.readMany(paths, concurrency=2))
+        self.assertEqual(len(grids), 6)
+        self.assertEqual(repr(grids[0]), repr(grids[2]))
+        self.assertEqual(grids[1].tiers[0].name, 'phone')
+
+
+class TestCrop(unittest.TestCase):
+
+    def setUp(self):
+        self.tg = textgrid.TextGrid('foo', maxTime=4.0)
+        words = textgrid.IntervalTier('words', maxTime=4.0)
+        words.add(0.0, 1.0, 'spam')
+        words.add(1.0, 2.0, 'eggs')
+        words.add(2.5, 3.5, 'ham')
+        points = textgrid.PointTier('points', maxTime=4.0)
+        points.add(0.5, 'bar')
+        points.add(1.5, 'baz')
+        points.add(3.0, 'qux')
+        self.tg.append(words)
+        self.tg.append(points)
+
+    def test_crop_truncate(self):
+        it = self.tg[0].crop(0.5, 3.0)
+        self.assertEqual(repr(it), 'IntervalTier(words, [Interval(0.5, 1.0, spam), Interval(1.0, 2.0, eggs), Interval(2.5, 3.0, ham)])')
+        self.assertIs(it[1], self.tg[0][1])
+        self.assertEqual(it.bounds(), (0.5, 3.0))
+
+    def test_crop_contained(self):
+        it = self.tg[0].crop(0.5, 3.0, mode='contained')
+        self.assertEqual(repr(it), 'IntervalTier(words, [Interval(1.0, 2.0, eggs)])')
+        self.assertEqual(len(self.tg[0].crop(1.0, 2.0, mode='contained')), 1)
+
+    def test_crop_overlapping(self):
+        it = self.tg[0].crop(1.0, 2.5, mode='overlapping')
+        self.assertEqual(repr(it), 'IntervalTier(words, [Interval(1.0, 2.0, eggs)])')
+        it = self.tg[0].crop(0.5, 3.0, mode='overlapping')
+        self.assertEqual(len(it), 3)
+        self.assertEqual(it.bounds(), (0.0, 3.5))
+
+    def test_crop_rebase(self):
+        tg = self.tg.crop(1.0, 3.0, rebase=True)
+        self.assertEqual(repr(tg[0]), 'IntervalTier(words, [Interval(0.0, 1.0, eggs), Interval(1.5, 2.0, ham)])')
+        self.assertEqual(repr(tg[1]), 'PointTier(points, [Point(0.5, baz), Point(2.0, qux)])')
+        self.assertEqual((tg.minTime, tg.maxTime), (0.0, 2.0))
+
+    def test_crop_bad_window(self):
+        self.assertRaises(ValueError, self.tg.crop, 2.0, 1.0)
+        self.assertRaises(ValueError, self.tg.crop, 1.0, 2.0, 'bogus')
+
+
+class TestShiftScaleConcat(unittest.TestCase):
+
+    def setUp(self):
+        self.tg = textgrid.TextGrid('foo', maxTime=2.0)
+        words = textgrid.IntervalTier('words', maxTime=2.0)
+        words.add(0.0, 1.0, 'spam')
+        words.add(1.0, 1.5, 'eggs')
+        points = textgrid.PointTier('points', maxTime=2.0)
+        points.add(0.5, 'bar')
+        self.tg.append(words)
+        self.tg.append(points)
+
+    def test_iadd(self):
+        interval = textgrid.Interval(0.0, 1.0, 'spam')
+        interval += 1.0
+        self.assertEqual(repr(interval), 'Interval(1.0, 2.0, spam)')
+        point = textgrid.Point(1.0, 'bar')
+        point -= 0.5
+        self.assertEqual(repr(point), 'Point(0.5, bar)')
+
+    def test_shift(self):
+        interval = self.tg[0][0]
+        self.tg.shift(1.0)
+        self.assertEqual(repr(self.tg[0]), 'IntervalTier(words, [Interval(1.0, 2.0, spam), Interval(2.0, 2.5, eggs)])')
+        self.assertEqual(repr(self.tg[1]), 'PointTier(points, [Point(1.5, bar)])')
+        self.assertEqual((self.tg.minTime, self.tg.maxTime), (1.0, 3.0))
+        self.assertEqual(interval.minTime, 0.0)
+
+    def test_scale(self):
+        self.tg.scale(2)
+        self.assertEqual(repr(self.tg[0]), 'IntervalTier(words, [Interval(0.0, 2.0, spam), Interval(2.0, 3.0, eggs)])')
+        self.assertEqual(self.tg[1].bounds(), (0.0, 4.0))
+        self.assertRaises(ValueError, self.tg.scale, 0)
+
+    def test_concat(self):
+        other = textgrid.TextGrid('bar', maxTime=1.0)
+        words = textgrid.IntervalTier('words', maxTime=1.0)
+        words.add(0.0, 1.0, 'ham')
+        phones = textgrid.IntervalTier('phones', maxTime=1.0)
+        phones.add(0.5, 1.0, 'AH')
+        other.append(words)
+        other.append(phones)
+
+        tg = textgrid.TextGrid.concat([self.tg, other, self.tg])
+        self.assertListEqual(tg.getNames(), ['words', 'points', 'phones'])
+        self.assertEqual((tg.minTime, tg.maxTime), (0.0, 5.0))
+        self.assertEqual(repr(tg[0]), 'IntervalTier(words, [Interval(0.0, 1.0, spam), Interval(1.0, 1.5, eggs), Interval(2.0, 3.0, ham), Interval(3.0, 4.0, spam), Interval(4.0, 4.5, eggs)])')
+        self.assertEqual(repr(tg[1]), 'PointTier(points, [Point(0.5, bar), Point(3.5, bar)])')
+        self.assertEqual(repr(tg[2]), 'IntervalTier(phones, [Interval(2.5, 3.0, AH)])')
+        self.assertEqual(tg[2].bounds(), (2.0, 5.0))
+        self.assertEqual(len(self.tg[0]), 2)
+
+    def test_concat_same_names(self):
+        tg = textgrid.TextGrid('foo', maxTime=2.0)
+        for (minTime, maxTime) in [(0.0, 1.0), (0.5, 1.5)]:
+            words = textgrid.IntervalTier('words', maxTime=2.0)
+            words.add(minTime, maxTime, 'spam')
+            tg.append(words)
+        concat = textgrid.TextGrid.concat([tg, tg])
+        self.assertListEqual(concat.getNames(), ['words', 'words'])
+        self.assertEqual(repr(concat[0]), 'IntervalTier(words, [Interval(0.0, 1.0, spam), Interval(2.0, 3.0, spam)])')
+        self.assertEqual(repr(concat[1]), 'IntervalTier(words, [Interval(0.5, 1.5, spam), Interval(2.5, 3.5, spam)])')
+
+    def test_concat_seam(self):
+        other = textgrid.TextGrid('bar', minTime=1.0, maxTime=3.0)
+        words = textgrid.IntervalTier('words', minTime=1.0, maxTime=3.0)
+        words.add(1.0, 2.0, 'ham')
+        other.append(words)
+        self.tg.maxTime = 1.2
+        self.assertRaises(ValueError, textgrid.TextGrid.concat, [self.tg, other])
+
+
+class TestVocabulary(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open('baz.mlf', 'w') as mlf_file:
+            mlf_file.write(mlf_data)
+        cls.mlf = textgrid.MLF('baz.mlf')
+        remove('baz.mlf')
+
+    def test_encode_decode(self):
+        vocabulary = textgrid.Vocabulary(['sil'])
+        self.assertEqual(vocabulary.encode('sil'), 0)
+        self.assertEqual(vocabulary.encode('AH'), 1)
+        self.assertEqual(vocabulary.decode(1), 'AH')
+        self.assertIn('AH', vocabulary)
+        self.assertEqual(len(vocabulary), 2)
+
+    def test_interned_marks(self):
+        foo, bar = self.mlf
+        self.assertIs(foo[0][0].mark, bar[0][0].mark)
+        self.assertIs(foo[0].vocabulary, self.mlf.vocabulary)
+
+    def test_encode_marks(self):
+        phones = self.mlf[0][0]
+        codes, vocabulary = phones.encodeMarks()
+        self.assertIs(vocabulary, self.mlf.vocabulary)
+        self.assertEqual(len(codes), len(phones))
+        self.assertListEqual([vocabulary.decode(c) for c in codes],
+                             [p.mark for p in phones])
+        sil = vocabulary.encode('sil')
+        self.assertEqual(list(codes).count(sil), 2)
+
+    def test_derived_tiers(self):
+        import os
+        vocabulary = textgrid.Vocabulary()
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        tg = textgrid.TextGrid()
+        tg.read(os.path.join(base_dir, 'tests', 'data', 'long_format.TextGrid'), vocabulary=vocabulary)
+        cropped = tg.crop(1362.0, 1363.0)
+        codes, cropped_vocabulary = cropped[0].encodeMarks()
+        self.assertIs(cropped_vocabulary, vocabulary)
+        self.assertListEqual(list(codes), [vocabulary.encode(x.mark) for x in cropped[0]])
+        derived = [textgrid.TextGrid.concat([cropped, cropped])[0],
+                   textgrid.IntervalTier.merge([cropped[0], cropped[0]])]
+        points = textgrid.PointTier('bells', maxTime=2.0)
+        points.vocabulary = vocabulary
+        points.add(1.0, 'ding')
+        derived += [points.crop(0.0, 2.0), textgrid.PointTier.merge([points])]
+        for tier in derived:
+            self.assertIs(tier.encodeMarks()[1], vocabulary)
+
+    def test_empty_shared_vocabulary(self):
+        import os
+        vocabulary = textgrid.Vocabulary()
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        tg = textgrid.TextGrid()
+        tg.read(os.path.join(base_dir, 'tests', 'data', 'long_format.TextGrid'), vocabulary=vocabulary)
+        self.assertIs(tg[0].vocabulary, vocabulary)
+        self.assertTrue(len(vocabulary))
+        empty = textgrid.Vocabulary()
+        self.assertIs(tg[0].encodeMarks(empty)[1], empty)
+
+
+class TestMarkIndex(unittest.TestCase):
+
+    def setUp(self):
+        import os
+        import shutil
+        import tempfile
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        self.directory = tempfile.mkdtemp()
+        self.long_path = os.path.join(self.directory, 'long.TextGrid')
+        self.short_path = os.path.join(self.directory, 'short.TextGrid')
+        shutil.copy(os.path.join(base_dir, 'tests', 'data', 'long_format.TextGrid'), self.long_path)
+        shutil.copy(os.path.join(base_dir, 'tests', 'data', 'short_format.TextGrid'), self.short_path)
+        self.index_path = os.path.join(self.directory, 'index.db')
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.directory)
+
+    def test_query(self):
+        from textgrid.corpus import MarkIndex
+        with MarkIndex(self.index_path) as index:
+            self.assertEqual(index.update(self.directory), 2)
+            hits = index.query('sil', tier='phone')
+            self.assertEqual(hits[0][0], self.long_path)
+            self.assertEqual(hits[0][1:3], (0, 0))
+            self.assertAlmostEqual(hits[0][3], 1358.8925)
+            self.assertEqual(len(hits), index.marks('phone')['sil'])
+            self.assertListEqual(index.query('sil', tier='bogus'), [])
+
+    def test_incremental_update(self):
+        import os
+        from textgrid.corpus import MarkIndex
+        with MarkIndex(self.index_path) as index:
+            index.update(self.directory)
+            n = len(index.query('sil'))
+        with MarkIndex(self.index_path) as index:
+            self.assertEqual(index.update(self.directory), 0)
+            remove(self.short_path)
+            self.assertEqual(index.update(self.directory), 0)
+            self.assertEqual(len(index), 1)
+            self.assertEqual(len(index.query('sil')), n // 2)
+
+
+class TestCorpusStore(unittest.TestCase):
+
+    def setUp(self):
+        import os
+        import shutil
+        import tempfile
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        self.directory = tempfile.mkdtemp()
+        self.long_path = os.path.join(self.directory, 'long.TextGrid')
+        shutil.copy(os.path.join(base_dir, 'tests', 'data', 'long_format.TextGrid'), self.long_path)
+        with open(os.path.join(self.directory, 'baz.mlf'), 'w') as mlf_file:
+            mlf_file.write(mlf_data)
+        self.store_path = os.path.join(self.directory, 'store.db')
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.directory)
+
+    def test_ingest(self):
+        from textgrid.store import CorpusStore
+        with CorpusStore(self.store_path) as store:
+            self.assertEqual(store.ingest(self.directory, processes=2), 2)
+            self.assertEqual(len(store), 3)
+            # nothing has changed, so nothing is ingested again
+            self.assertEqual(store.ingest(self.directory, processes=1), 0)
+            self.assertEqual(len(store), 3)
+
+    def test_rebuild(self):
+        from textgrid.store import CorpusStore
+        with CorpusStore(self.store_path) as store:
+            store.ingest(self.directory, processes=1)
+            tg = textgrid.TextGrid.fromFile(self.long_path)
+            tg_copy = store.getTextGrids(self.long_path)[0]
+            self.assertListEqual(textgrid.diff(tg, tg_copy), [])
+
+    def test_intervals(self):
+        from textgrid.store import CorpusStore
+        with CorpusStore(self.store_path) as store:
+            store.ingest(self.directory, processes=1)
+            columns = store.intervals(tier='words', mark='sil',
+                                      min_duration=1.0)
+            self.assertListEqual(columns['xmin'], [20.1])
+            self.assertListEqual(columns['mark'], ['sil'])
+            counts = store.query('SELECT mark, COUNT(*) FROM intervals '
+                                 'WHERE mark = ? GROUP BY mark', ('sp',))
+            tg = textgrid.TextGrid.fromFile(self.long_path)
+            n = sum(x.mark == 'sp' for tier in tg for x in tier)
+            self.assertListEqual(counts, [('sp', n + 10)])
+
+
+class TestSharedCorpus(unittest.TestCase):
+
+    def test_shared_corpus(self):
+        import os
+        from textgrid.shm import SharedCorpus
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        grids = [textgrid.TextGrid.fromFile(os.path.join(base_dir, 'tests', 'data', 'long_format.TextGrid')),
+                 textgrid.TextGrid.fromFile(os.path.join(base_dir, 'tests', 'data', 'short_format.TextGrid'))]
+        corpus = SharedCorpus.create(grids)
+        try:
+            with SharedCorpus(corpus.name) as attached:
+                self.assertEqual(len(attached), 2)
+                for (tg, view) in zip(grids, attached):
+                    self.assertListEqual(textgrid.diff(tg, view), [])
+                phones = attached[0][0]
+                self.assertEqual(phones.intervalContaining(1360.0).mark, 'sil')
+                self.assertRaises(TypeError, phones.removeInterval, phones[0])
+        finally:
+            corpus.close()
+            corpus.unlink()
+
+
+class TestValidate(unittest.TestCase):
+
+    def test_validate_interval_tier(self):
+        foo = textgrid.IntervalTier('foo', maxTime=3.0)
+        foo.intervals = [textgrid.Interval(0.0, 0.1, 'ham'),
+                         textgrid.Interval(0.0, 1.0, 'bar'),
+                         textgrid.Interval(0.5, 1.5, 'baz'),
+                         textgrid.Interval(0.2, 0.4, 'spam'),
+                         textgrid.Interval(2.5, 3.5, 'eggs')]
+        foo.intervals[0].maxTime = 0.0
+
+        self.assertListEqual([(kind, i) for (kind, i, x) in foo.validate()],
+                             [('duration', 0), ('overlap', 2), ('order', 3),
+                              ('bounds', 4)])
+
+    def test_validate_point_tier(self):
+        foo = textgrid.PointTier('foo')
+        foo.points = [textgrid.Point(1.0, 'bar'), textgrid.Point(1.0, 'baz'),
+                      textgrid.Point(0.5, 'spam'), textgrid.Point(-1.0, 'eggs')]
+
+        self.assertListEqual([(kind, i) for (kind, i, x) in foo.validate()],
+                             [('duplicate', 1), ('order', 2), ('bounds', 3),
+                              ('order', 3)])
+
+    def test_validate_textgrid(self):
+        import os
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        path = os.path.join(base_dir, 'tests', 'data', 'long_format.TextGrid')
+        tg = textgrid.TextGrid()
+        tg.read(path, check=False)
+        self.assertListEqual(tg.validate(), [])
+        self.assertEqual(repr(tg), repr(textgrid.TextGrid.fromFile(path)))
+
+        tier = textgrid.IntervalTier('foo', 0.0, 2000.0)
+        tg.tiers.append(tier)
+        self.assertListEqual(tg.validate(), [('bounds', 4, None, tier)])
+
+
+class TestPointQueries(unittest.TestCase):
+
+    def setUp(self):
+        self.foo = textgrid.PointTier('foo')
+        self.foo.addPoints([(1.0, 'a'), (2.0, 'b'), (2.5, 'c'), (4.0, 'd')])
+
+    def test_nearest(self):
+        self.assertEqual(self.foo.indexNearest(0.0), 0)
+        self.assertEqual(self.foo.indexNearest(1.5), 0)
+        self.assertEqual(self.foo.indexNearest(2.3), 2)
+        self.assertEqual(self.foo.indexNearest(9.0), 3)
+        self.assertEqual(repr(self.foo.pointNearest(3.5)), 'Point(4.0, d)')
+        self.assertIsNone(textgrid.PointTier('bar').indexNearest(1.0))
+
+    def test_k_nearest(self):
+        self.assertListEqual(self.foo.indicesNearest(2.1, 3), [1, 2, 0])
+        self.assertListEqual(self.foo.indicesNearest(5.0, 9), [3, 2, 1, 0])
+        self.assertEqual([p.mark for p in self.foo.pointsNearest(0.0, 2)],
+                         ['a', 'b'])
+
+    def test_within(self):
+        self.assertEqual(list(self.foo.indicesWithin(2.0, 0.5)), [1, 2])
+        self.assertListEqual(self.foo.pointsWithin(3.0, 0.1), [])
+
+    def test_cache(self):
+        self.assertEqual(self.foo.indexNearest(3.0), 2)
+        self.foo.add(3.0, 'e')
+        self.assertEqual(self.foo.indexNearest(3.0), 3)
+        self.foo.shift(1.0)
+        self.assertEqual(self.foo.indexNearest(3.0), 1)
+        # moving a Point keeps the list and its length
+        self.foo.removePoint(self.foo[2])
+        self.foo.add(2.5, 'f')
+        self.assertListEqual([p.mark for p in self.foo.pointsWithin(2.5, 0.01)], ['f'])
+
+    def test_batch(self):
+        times = [0.0, 1.5, 2.3, 9.0]
+        self.assertListEqual(self.foo.indexNearestEach(times), [0, 0, 2, 3])
+        self.assertListEqual(self.foo.indexNearestEach(times[::-1]),
+                             [3, 2, 0, 0])
+        ranges = self.foo.indicesWithinEach([2.0, 3.0, 4.0], 0.5)
+        self.assertListEqual([list(r) for r in ranges], [[1, 2], [2], [3]])
+        ranges = self.foo.indicesWithinEach([4.0, 2.0], 0.5)
+        self.assertListEqual([list(r) for r in ranges], [[3], [1, 2]])
+
+
+class TestFrames(unittest.TestCase):
+
+    def setUp(self):
+        self.foo = textgrid.IntervalTier('foo', maxTime=1.0)
+        self.foo.add(0.0, 0.3, 'a')
+        self.foo.add(0.3, 0.5, 'b')
+        self.foo.add(0.7, 1.0, 'a')
+
+    def test_to_frames(self):
+        codes, vocabulary = self.foo.toFrames(0.1)
+        self.assertListEqual([vocabulary.decode(c) for c in codes],
+                             ['a', 'a', 'a', 'b', 'b', '', '', 'a', 'a', 'a'])
+        codes, vocabulary = self.foo.toFrames(0.1, window=0.25, null='sil')
+        self.assertListEqual([vocabulary.decode(c) for c in codes],
+                             ['a', 'a', 'b', 'b', 'sil', 'sil', 'a', 'a'])
+
+    def test_round_trip(self):
+        codes, vocabulary = self.foo.toFrames(0.01)
+        self.assertEqual(len(codes), 100)
+        bar = textgrid.IntervalTier.fromFrames(codes, vocabulary, 0.01, name='foo')
+        self.assertEqual(repr(bar), repr(self.foo))
+        self.assertEqual(bar.bounds(), self.foo.bounds())
+
+    def test_round_trip_window(self):
+        codes, vocabulary = self.foo.toFrames(0.01, window=0.025)
+        bar = textgrid.IntervalTier.fromFrames(codes, vocabulary, 0.01,
+                                               window=0.025, name='foo')
+        self.assertEqual(len(bar), 3)
+        for (x, y) in zip(bar, self.foo):
+            self.assertAlmostEqual(x.minTime, y.minTime, delta=0.01)
+            self.assertAlmostEqual(x.maxTime, y.maxTime, delta=0.01)
+            self.assertEqual(x.mark, y.mark)
+
+
+class TestWriteMLF(unittest.TestCase):
+
+    def setUp(self):
+        with open('baz.mlf', 'w') as mlf_file:
+            mlf_file.write(mlf_data)
+
+    def tearDown(self):
+        remove('baz.mlf')
+        remove('baz_copy.mlf')
+
+    def test_roundtrip(self):
+        mlf = textgrid.MLF('baz.mlf')
+        self.assertEqual(textgrid.MLF.writeMLF('baz_copy.mlf', iter(mlf)), 2)
+        mlf_copy = textgrid.MLF('baz_copy.mlf')
+        self.assertEqual(repr(mlf), repr(mlf_copy))
+
+        with open('baz_copy.mlf') as mlf_file:
+            lines = mlf_file.read().splitlines()
+        self.assertListEqual(lines[:6], ['#!MLF!#', '"foo.lab"',
+                                         '0 5000000 sil sil',
+                                         '5000000 7000000 SH SHOW',
+                                         '7000000 11000000 OW',
+                                         '11000000 17000000 M ME'])
+        self.assertIn('19000000 20000000 sp', lines)
+
+    def test_missing_tier(self):
+        mlf = textgrid.MLF('baz.mlf')
+        with self.assertRaises(ValueError) as cm:
+            textgrid.MLF.writeMLF('baz_copy.mlf', mlf, word_tier='word')
+        self.assertEqual(str(cm.exception), 'TextGrid foo.lab has no tier word')
+
+
+class TestJSON(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        import os
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        cls.tg = textgrid.TextGrid.fromFile(os.path.join(base_dir, 'tests', 'data', 'long_format.TextGrid'))
+        with open('test_json.TextGrid', 'w') as tg_file:
+            tg_file.write(tg_with_quotes)
+        cls.tg_with_quotes = textgrid.TextGrid.fromFile('test_json.TextGrid')
+        remove('test_json.TextGrid')
+
+    def test_json(self):
+        for tg in (self.tg, self.tg_with_quotes):
+            tg_copy = textgrid.TextGrid.fromJSON(tg.toJSON())
+            self.assertEqual(repr(tg), repr(tg_copy))
+            self.assertEqual(tg[0].bounds(), tg_copy[0].bounds())
+            self.assertListEqual(tg_copy.validate(), [])
+
+    def test_columns(self):
+        data = self.tg_with_quotes.toDict()
+        self.assertListEqual(data['tiers'][0]['xmins'], [0.0, 0.5])
+        self.assertListEqual(data['tiers'][1]['marks'], ['"event"', '"event" with quotes again'])
+
+    def test_jsonl(self):
+        grids = [self.tg, self.tg_with_quotes, self.tg]
+        self.assertEqual(textgrid.writeJSONL('test.jsonl', iter(grids)), 3)
+        grids_copy = list(textgrid.iterJSONL('test.jsonl'))
+        remove('test.jsonl')
+        self.assertEqual(repr(grids), repr(grids_copy))
+        self.assertIs(grids_copy[0][0][0].mark, grids_copy[2][0][0].mark)
+
+
+class TestParallelRead(unittest.TestCase):
+
+    def setUp(self):
+        import os
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        self.paths = [os.path.join(base_dir, 'tests', 'data', name) for name in
+                      ('long_format.TextGrid', 'short_format.TextGrid')]
+        with open('test_parallel.TextGrid', 'w') as tg_file:
+            tg_file.write(tg_with_quotes)
+        self.paths.append('test_parallel.TextGrid')
+
+    def tearDown(self):
+        remove('test_parallel.TextGrid')
+
+    def test_parallel_read(self):
+        for path in self.paths:
+            tg = textgrid.TextGrid()
+            tg.read(path)
+            tg_parallel = textgrid.TextGrid()
+            tg_parallel.read(path, processes=2)
+            self.assertEqual(repr(tg), repr(tg_parallel))
+            self.assertListEqual([tier.bounds() for tier in tg],
+                                 [tier.bounds() for tier in tg_parallel])
+
+    def test_split_tiers(self):
+        tg = textgrid.TextGrid()
+        tg.read(self.paths[1])
+        with open(self.paths[1]) as source:
+            text = source.read()
+        text = text[text.index('"IntervalTier"'):]
+        chunks = textgrid.textgrid._splitTiers(text, True, len(tg))
+        self.assertEqual(len(chunks), len(tg))
+        self.assertEqual(''.join(chunks), text)
+
+
+class TestTicks(unittest.TestCase):
+
+    def setUp(self):
+        self.foo = textgrid.IntervalTier('foo', maxTime=1.0)
+        self.foo.add(0.0, 0.3, 'a')
+        self.foo.add(0.3, 0.51234, 'b')
+        self.foo.add(0.7, 1.0, 'a')
+        self.bar = textgrid.PointTier('bar', maxTime=1.0)
+        self.bar.add(0.1, 'x')
+        self.bar.add(0.7, 'y')
+
+    def test_ticks(self):
+        self.assertListEqual(list(textgrid.toTicks([0.3, 0.1 + 0.2])), [3000000, 3000000])
+        self.assertListEqual(textgrid.fromTicks([3000000, 5123400]), [0.3, 0.51234])
+        self.assertListEqual(list(textgrid.toTicks([0.3], 0.01)), [30])
+        self.assertRaises(ValueError, textgrid.toTicks, [0.3], 0.3)
+
+    def test_round_trip(self):
+        starts, ends = self.foo.toTicks()
+        self.assertListEqual(list(ends), [3000000, 5123400, 10000000])
+        codes, vocabulary = self.foo.encodeMarks()
+        foo = textgrid.IntervalTier.fromTicks(starts, ends, codes, vocabulary,
+                                              name='foo', maxTime=1.0)
+        self.assertEqual(foo, self.foo)
+        times = self.bar.toTicks(0.001)
+        self.assertListEqual(list(times), [100, 700])
+        codes, vocabulary = self.bar.encodeMarks()
+        bar = textgrid.PointTier.fromTicks(times, codes, vocabulary, 0.001,
+                                           name='bar', maxTime=1.0)
+        self.assertEqual(bar, self.bar)
+
+    def test_tick_interval_tier(self):
+        foo = textgrid.TickIntervalTier.fromIntervalTier(self.foo)
+        self.assertListEqual(list(foo.ends), [3000000, 5123400, 10000000])
+        self.assertEqual(repr(foo[1]), 'Interval(0.3, 0.51234, b)')
+        foo.add(0.6, 0.1 + 0.2 + 0.4, 'c')  # 0.7000000000000001
+        self.assertListEqual(list(foo.starts), [0, 3000000, 6000000, 7000000])
+        self.assertRaises(ValueError, foo.add, 0.5, 0.65, 'd')
+        self.assertEqual(foo.indexContaining(0.55), None)
+        self.assertEqual(foo.indexContaining(0.1 + 0.2), 0)
+        self.assertEqual(foo.intervalContaining(0.8).mark, 'a')
+        foo.remove(0.6, 0.7, 'c')
+        self.assertEqual(foo.toIntervalTier(), self.foo)
+        self.assertListEqual(list(foo.iterFilled('')), list(self.foo.iterFilled('')))
+        self.assertEqual(foo._countFilled(), self.foo._countFilled())
+        self.assertListEqual(list(foo.toTicks(0.01)[0]), [0, 30, 70])
+        self.assertListEqual(foo.validate(), [])
+
+    def test_tick_point_tier(self):
+        bar = textgrid.TickPointTier.fromPointTier(self.bar)
+        bar.add(0.1 + 0.2, 'z')
+        self.assertRaises(ValueError, bar.add, 0.3, 'z')
+        self.assertEqual(bar.indexNearest(0.45), 1)
+        self.assertEqual(bar.indicesWithin(0.2, 0.1), range(0, 2))
+        self.assertEqual(bar.pointNearest(1.0).mark, 'y')
+        bar.remove(0.3, 'z')
+        self.assertEqual(bar.toPointTier(), self.bar)
+
+    def test_read_ticks(self):
+        import os
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests', 'data', 'long_format.TextGrid')
+        tg = textgrid.TextGrid.fromFile(path)
+        tick_tg = textgrid.TextGrid()
+        tick_tg.read(path, resolution=1e-5)
+        self.assertIsInstance(tick_tg[0], textgrid.TickIntervalTier)
+        self.assertEqual(repr(tick_tg), repr(tg).replace('IntervalTier', 'TickIntervalTier'))
+        # at 100ns, the file has overlaps hidden by rounding
+        self.assertRaises(ValueError, textgrid.TextGrid().read, path, resolution=1e-7)
+        tick_tg = textgrid.TextGrid()
+        tick_tg.read(path, resolution=1e-7, check=False)
+        self.assertListEqual([(kind, k, i) for (kind, k, i, item) in tick_tg.validate()],
+                             [('overlap', 0, 12), ('overlap', 0, 85)])
+        self.assertEqual(tick_tg[0].ends[11], 13726225001)
+        # tick tiers are always strict
+        self.assertRaises(ValueError, textgrid.TextGrid(strict=False).read, path, resolution=1e-7)
+        for method in (lambda: tick_tg.crop(0, 1), lambda: tick_tg.scale(2), tick_tg.fingerprint,
+                       tick_tg.memoryUsage, lambda: textgrid.TextGrid.concat([tick_tg, tick_tg]),
+                       lambda: textgrid.diff(tick_tg, tick_tg),
+                       lambda: textgrid.IntervalTier.merge([tick_tg[0]])):
+            with self.assertRaises(TypeError) as cm:
+                method()
+            self.assertIn('toIntervalTier()', str(cm.exception))
+        self.assertEqual(textgrid.TextGrid.fromJSON(tick_tg.toJSON()).fingerprint(),
+                         textgrid.TextGrid.fromJSON(tg.toJSON()).fingerprint())
+        tick_tg.write('test_ticks.TextGrid')
+        tick_copy = textgrid.TextGrid()
+        tick_copy.read('test_ticks.TextGrid', resolution=1e-7, check=False)
+        tick_parallel = textgrid.TextGrid()
+        tick_parallel.read('test_ticks.TextGrid', resolution=1e-7, check=False, processes=2)
+        remove('test_ticks.TextGrid')
+        self.assertListEqual(list(tick_parallel), list(tick_copy))
+        # the times are written exactly (the gaps being filled in)
+        self.assertListEqual([(x.minTime, x.maxTime, x.mark) for x in tick_copy[0] if x.mark],
+                             [(x.minTime, x.maxTime, x.mark) for x in tick_tg[0] if x.mark])
+
+
+class TestMemoryUsage(unittest.TestCase):
+
+    def setUp(self):
+        import os
+        self.data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests', 'data')
+        self.tg = textgrid.TextGrid.fromFile(os.path.join(self.data_dir, 'long_format.TextGrid'))
+
+    def test_memory_usage(self):
+        usage = self.tg.memoryUsage()
+        self.assertEqual(usage['count'], sum(len(tier) for tier in self.tg))
+        self.assertEqual(len(usage['tiers']), len(self.tg))
+        self.assertEqual(usage['total'], usage['objects'] + usage['times'] + usage['marks'])
+        self.assertGreater(usage['total'], sum(tier['total'] for tier in usage['tiers']))
+        shallow = self.tg.memoryUsage(deep=False)
+        self.assertEqual(shallow['marks'], 0)
+        self.assertEqual(shallow['total'], usage['objects'])
+
+    def test_shared_marks(self):
+        tier = textgrid.IntervalTier('foo')
+        tier.add(0.0, 1.0, 'a' * 100)
+        tier.add(1.0, 2.0, tier[0].mark)
+        self.assertLess(tier.memoryUsage()['marks'], 200)
+
+    def test_memory_report(self):
+        from textgrid.corpus import memoryReport
+        report = memoryReport(self.data_dir)
+        self.assertEqual(report['files'], 2)
+        grids = [textgrid.TextGrid.fromFile(path) for path in textgrid.corpus.iterPaths(self.data_dir)]
+        self.assertEqual(report['count'], sum(len(tier) for tg in grids for tier in tg))
+        self.assertEqual(report['tiers']['phone']['count'], sum(len(tg[0]) for tg in grids))
+        self.assertEqual(report['largest'][1], max(tg.memoryUsage()['total'] for tg in grids))
+
+
+class TestChronological(unittest.TestCase):
+
+    def setUp(self):
+        with open('test_chronological.TextGrid', 'w') as tg_file:
+            tg_file.write(tg_with_quotes)
+        self.tg = textgrid.TextGrid.fromFile('test_chronological.TextGrid')
+
+    def tearDown(self):
+        remove('test_chronological.TextGrid')
+
+    def test_iter_events(self):
+        events = list(self.tg.iterEvents())
+        self.assertEqual(len(events), sum(len(tier) for tier in self.tg))
+        self.assertListEqual(events, sorted(events, key=lambda e: e[:2]))
+        for (time, k, item) in events:
+            self.assertIn(item, self.tg[k])
+
+    def test_round_trip(self):
+        self.tg.write('test_chronological.TextGrid', format='chronological')
+        with open('test_chronological.TextGrid') as tg_file:
+            self.assertEqual(tg_file.readline().strip(), textgrid.textgrid.CHRONOLOGICAL_HEADER)
+        tg = textgrid.TextGrid.fromFile('test_chronological.TextGrid')
+        self.assertEqual(repr(tg), repr(self.tg))
+        self.assertListEqual([tier.bounds() for tier in tg],
+                             [tier.bounds() for tier in self.tg])
+        self.assertRaises(ValueError, self.tg.write, 'test_chronological.TextGrid', format='binary')
+
+    def test_unnamed_tier(self):
+        tg = textgrid.TextGrid(maxTime=1.0)
+        tier = textgrid.IntervalTier(maxTime=1.0)
+        tier.add(0.0, 0.5, 'spam')
+        tg.append(tier)
+        tg.write('test_chronological.TextGrid', format='chronological')
+        chronological = textgrid.TextGrid.fromFile('test_chronological.TextGrid')
+        tg.write('test_chronological.TextGrid')
+        self.assertEqual(repr(chronological), repr(textgrid.TextGrid.fromFile('test_chronological.TextGrid')))
+
+    def test_read(self):
+        with open('test_chronological.TextGrid', 'w') as tg_file:
+            tg_file.write('"Praat chronological TextGrid text file"\n'
+                          '0 2   ! Time domain.\n2   ! Number of tiers.\n'
+                          '"IntervalTier" "words" 0 2\n"TextTier" "bells" 0 2\n\n'
+                          '1 0 1.5\n"foo ""bar""\n!baz"\n\n2 0.5 "ding"\n\n1 1.5 2\n""\n')
+        tg = textgrid.TextGrid.fromFile('test_chronological.TextGrid')
+        self.assertEqual(repr(tg), 'TextGrid(None, [IntervalTier(words, [Interval(0.0, 1.5, foo "bar"\n!baz), '
+                                   'Interval(1.5, 2.0, None)]), PointTier(bells, [Point(0.5, ding)])])')
+
+
+class TestMerge(unittest.TestCase):
+
+    def setUp(self):
+        self.a = textgrid.IntervalTier('words', maxTime=3.0)
+        self.a.add(0.0, 1.0, 'a')
+        self.a.add(1.5, 3.0, 'c')
+        self.b = textgrid.IntervalTier('words', maxTime=3.0)
+        self.b.add(1.0, 1.5, 'b')
+        self.b.add(2.0, 2.5, 'd')
+
+    def merged(self, on_conflict):
+        tier = textgrid.IntervalTier.merge([self.a, self.b], on_conflict=on_conflict)
+        return [(x.minTime, x.maxTime, x.mark) for x in tier]
+
+    def test_merge(self):
+        self.assertListEqual(self.merged('first'), [(0.0, 1.0, 'a'), (1.0, 1.5, 'b'), (1.5, 3.0, 'c')])
+        self.assertListEqual(self.merged('longest'), [(0.0, 1.0, 'a'), (1.0, 1.5, 'b'), (1.5, 3.0, 'c')])
+        self.assertListEqual(self.merged('split'), [(0.0, 1.0, 'a'), (1.0, 1.5, 'b'), (1.5, 2.0, 'c'),
+                                                    (2.0, 2.5, 'd'), (2.5, 3.0, 'c')])
+        self.b.add(2.5, 3.0, 'e')
+        self.assertListEqual(self.merged('split')[-2:], [(2.0, 2.5, 'd'), (2.5, 3.0, 'e')])
+        self.assertListEqual(self.merged('longest')[-1:], [(1.5, 3.0, 'c')])
+        self.b.removeInterval(self.b[2])
+        self.b.removeInterval(self.b[1])
+        self.b.add(1.5, 3.0, 'f')
+        self.assertListEqual(self.merged('split')[-1:], [(1.5, 3.0, 'f')])
+        try:
+            self.merged('collect')
+        except ValueError as err:
+            self.assertEqual(len(err.args[0]), 1)
+        else:
+            self.fail('conflicts not reported')
+        self.assertRaises(ValueError, self.merged, 'last')
+
+    def test_merge_collect(self):
+        a = textgrid.IntervalTier('words', maxTime=10.0)
+        a.add(0.0, 4.0, 'a')
+        a.add(4.0, 10.0, 'b')
+        b = textgrid.IntervalTier('words', maxTime=10.0)
+        b.add(1.0, 2.0, 'c')
+        b.add(3.0, 5.0, 'd')
+        with self.assertRaises(ValueError) as cm:
+            textgrid.IntervalTier.merge([a, b], on_conflict='collect')
+        self.assertListEqual([(x.mark, y.mark) for (x, y) in cm.exception.args[0]],
+                             [('a', 'c'), ('a', 'd'), ('d', 'b')])
+
+    def test_merge_points(self):
+        a = textgrid.PointTier('bells', maxTime=2.0)
+        a.add(0.5, 'ding')
+        a.add(1.0, 'dong')
+        b = textgrid.PointTier('bells', maxTime=3.0)
+        b.add(1.0, 'dang')
+        b.add(2.5, 'ding')
+        pt = textgrid.PointTier.merge([a, b])
+        self.assertListEqual([(p.time, p.mark) for p in pt], [(0.5, 'ding'), (1.0, 'dong'), (2.5, 'ding')])
+        self.assertEqual(pt.bounds(), (0.0, 3.0))
+        self.assertRaises(ValueError, textgrid.PointTier.merge, [a, b], on_conflict='collect')
+        self.assertRaises(ValueError, textgrid.PointTier.merge, [a, b], on_conflict='split')
+        with self.assertRaises(ValueError) as cm:
+            textgrid.PointTier.merge([a, b, b], on_conflict='collect')
+        self.assertEqual(len(cm.exception.args[0]), 4)
+
+
+class TestCopy(unittest.TestCase):
+
+    def setUp(self):
+        import os
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        self.tg = textgrid.TextGrid.fromFile(os.path.join(base_dir, 'tests', 'data', 'long_format.TextGrid'))
+
+    def test_copy(self):
+        tg = self.tg.copy()
+        self.assertEqual(repr(tg), repr(self.tg))
+        self.assertIs(tg[0].intervals, self.tg[0].intervals)
+        tg[0].removeInterval(tg[0][0])
+        self.assertEqual(len(tg[0]), len(self.tg[0]) - 1)
+        self.assertIsNot(tg[0].intervals, self.tg[0].intervals)
+        self.assertIs(tg[1].intervals, self.tg[1].intervals)
+        tg[1].shift(1.0)
+        self.assertNotEqual(tg[1][0].minTime, self.tg[1][0].minTime)
+        tg.pop()
+        self.assertEqual(len(tg), len(self.tg) - 1)
+
+    def test_copy_points(self):
+        pt = textgrid.PointTier('bells', maxTime=2.0)
+        pt.add(0.5, 'ding')
+        copy = pt.copy()
+        pt.add(1.0, 'dong')
+        self.assertEqual(len(copy), 1)
+        copy.add(1.5, 'dang')
+        self.assertListEqual([p.mark for p in pt], ['ding', 'dong'])
+        self.assertListEqual([p.mark for p in copy], ['ding', 'dang'])
+
+
+class TestFingerprint(unittest.TestCase):
+
+    def setUp(self):
+        import os
+        self.data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests', 'data')
+        self.tg = textgrid.TextGrid.fromFile(os.path.join(self.data_dir, 'long_format.TextGrid'))
+
+    def test_fingerprint(self):
+        fingerprint = self.tg.fingerprint()
+        self.assertEqual(textgrid.TextGrid.fromJSON(self.tg.toJSON()).fingerprint(), fingerprint)
+        tg = self.tg.copy()
+        tier_fingerprint = tg[0].fingerprint()
+        tg[0].shift(1e-7)
+        self.assertNotEqual(tg[0].fingerprint(10), self.tg[0].fingerprint(10))
+        self.assertEqual(tg[0].fingerprint(5), tier_fingerprint)
+        tg[1].removeInterval(tg[1][0])
+        self.assertNotEqual(tg.fingerprint(), fingerprint)
+        self.assertEqual(self.tg.fingerprint(), fingerprint)
+        tg = self.tg.copy()
+        tg[1].name = 'words'
+        self.assertNotEqual(tg.fingerprint(), fingerprint)
+
+    def test_fingerprint_cache(self):
+        tier = self.tg[0]
+        fingerprint = tier.fingerprint()
+        tier[0].mark = 'spam'
+        relabeled = tier.fingerprint()
+        self.assertNotEqual(relabeled, fingerprint)
+        self.assertEqual(tier.fingerprint(cache=True), relabeled)
+        self.assertListEqual(list(tier._fingerprints.values()), [relabeled])
+        tier.removeInterval(tier[0])
+        self.assertEqual(tier._fingerprints, {})
+
+    def test_find_duplicates(self):
+        import os
+        import shutil
+        import tempfile
+        from textgrid.corpus import findDuplicates
+        directory = tempfile.mkdtemp()
+        try:
+            for name in ('long_format.TextGrid', 'short_format.TextGrid'):
+                shutil.copy(os.path.join(self.data_dir, name), directory)
+            self.tg.write(os.path.join(directory, 'copy.TextGrid'))
+            groups = findDuplicates(directory)
+            self.assertListEqual([[os.path.basename(path) for path in paths] for paths in groups],
+                                 [['copy.TextGrid', 'long_format.TextGrid']])
+        finally:
+            shutil.rmtree(directory)
+
+
+class TestBlockedList(unittest.TestCase):
+
+    def test_blocked_list(self):
+        import bisect
+        import random
+        rng = random.Random(48)
+        items = []
+        blocked = textgrid.BlockedList(key=float, load=2)
+        for n in range(500):
+            if items and rng.random() < 0.3:
+                i = rng.randrange(len(items))
+                del items[i]
+                del blocked[i]
+            else:
+                i = rng.randint(0, len(items))
+                items.insert(i, n)
+                blocked.insert(i, n)
+            self.assertEqual(len(blocked), len(items))
+        self.assertListEqual(list(blocked), items)
+        self.assertListEqual([blocked[i] for i in range(-len(items), len(items))], items + items)
+        self.assertListEqual(blocked[3:-3], items[3:-3])
+        self.assertListEqual(blocked[::5], items[::5])
+        self.assertRaises(IndexError, blocked.__getitem__, len(items))
+        items.sort()
+        blocked = textgrid.BlockedList(items, key=float, load=3)
+        for x in (-1, 0, 10, 10.5, 1000):
+            self.assertEqual(blocked.bisect_left(x), bisect.bisect_left(items, x))
+            self.assertEqual(blocked.bisect_right(x), bisect.bisect_right(items, x))
+
+    def test_blocked_tiers(self):
+        plain = textgrid.IntervalTier('foo', maxTime=100.0)
+        blocked = textgrid.IntervalTier('foo', maxTime=100.0)
+        blocked.useBlocks(load=2)
+        for tier in (plain, blocked):
+            for i in range(0, 100, 2):
+                tier.add(i, i + 1, str(i))
+            tier.remove(50, 51, '50')
+            self.assertRaises(ValueError, tier.remove, 50, 51, '50')
+            tier.add(51, 52, '51')
+        self.assertIsInstance(blocked.intervals, textgrid.BlockedList)
+        self.assertEqual(repr(blocked.intervals), 'BlockedList({0})'.format(plain.intervals))
+        self.assertEqual(blocked.indexContaining(51.5), plain.indexContaining(51.5))
+        self.assertEqual(repr(blocked.crop(10.5, 20.5)), repr(plain.crop(10.5, 20.5)))
+        blocked.shift(1.0)
+        self.assertIsInstance(blocked.intervals, textgrid.BlockedList)
+        self.assertEqual(blocked[0].minTime, 1.0)
+        blocked.useBlocks(None)
+        self.assertIsInstance(blocked.intervals, list)
+        points = textgrid.PointTier('bar')
+        points.useBlocks(load=2)
+        for i in range(20, 0, -1):
+            points.add(i, str(i))
+        points.remove(5, '5')
+        self.assertEqual(points.indexNearest(5.2), 4)
+        self.assertListEqual(points.pointsNearest(5.2, 2), [points[4], points[3]])
+        self.assertEqual(points.indicesWithin(5, 1.5), range(3, 5))
+
+
+class TestCLI(unittest.TestCase):
+
+    def setUp(self):
+        import os
+        import shutil
+        import tempfile
+        self.directory = tempfile.mkdtemp()
+        self.corpus = os.path.join(self.directory, 'corpus')
+        os.makedirs(os.path.join(self.corpus, 'sub'))
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        shutil.copy(os.path.join(base_dir, 'tests', 'data', 'long_format.TextGrid'),
+                    os.path.join(self.corpus, 'sub'))
+        with open(os.path.join(self.corpus, 'baz.mlf'), 'w') as mlf_file:
+            mlf_file.write(mlf_data)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.directory)
+
+    def main(self, *args):
+        from contextlib import redirect_stdout
+        from textgrid.cli import main
+        output = StringIO()
+        with redirect_stdout(output):
+            status = main(list(args) + ['--processes', '1', '--quiet'])
+        return (status, output.getvalue().splitlines())
+
+    def test_convert(self):
+        import os
+        output = os.path.join(self.directory, 'output')
+        manifest = os.path.join(self.directory, 'manifest.jsonl')
+        self.assertEqual(self.main('convert', self.corpus, output, '--to', 'chronological',
+                                   '--manifest', manifest), (0, []))
+        tg = textgrid.TextGrid.fromFile(os.path.join(output, 'sub', 'long_format.TextGrid'))
+        self.assertEqual(repr(tg), repr(textgrid.TextGrid.fromFile(os.path.join(self.corpus, 'sub', 'long_format.TextGrid'))))
+        mlf = textgrid.MLF(os.path.join(self.corpus, 'baz.mlf'))
+        self.assertEqual(len(os.listdir(os.path.join(output, 'baz'))), len(mlf))
+        with open(manifest) as manifest_file:
+            self.assertEqual(len(manifest_file.readlines()), 2)
+        # nothing more to do
+        os.remove(os.path.join(output, 'sub', 'long_format.TextGrid'))
+        self.main('convert', self.corpus, output, '--manifest', manifest)
+        self.assertFalse(os.path.exists(os.path.join(output, 'sub', 'long_format.TextGrid')))
+
+    def test_stats(self):
+        import os
+        manifest = os.path.join(self.directory, 'manifest.jsonl')
+        (status, lines) = self.main('stats', self.corpus, '--tier', 'phone', '--manifest', manifest)
+        self.assertEqual(status, 0)
+        tg = textgrid.TextGrid.fromFile(os.path.join(self.corpus, 'sub', 'long_format.TextGrid'))
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[1].split('\t')[:2], ['phone', str(len(tg[0]))])
+        # totals include the results recorded by the earlier run
+        self.assertEqual(self.main('stats', self.corpus, '--tier', 'phone', '--manifest', manifest)[1], lines)
+
+    def test_grep_validate(self):
+        (status, lines) = self.main('grep', self.corpus, '^ay1$', '-i', '--tier', 'phone')
+        self.assertEqual(status, 0)
+        self.assertTrue(lines)
+        self.assertTrue(all(line.split('\t')[-1] == 'AY1' for line in lines))
+        self.assertEqual(self.main('validate', self.corpus), (0, []))
+        with open(self.corpus + '/bad.TextGrid', 'w') as tg_file:
+            tg_file.write('junk\n')
+        self.assertEqual(self.main('validate', self.corpus)[0], 1)
+
+    def test_validate_overlap(self):
+        import os
+        tg = textgrid.TextGrid(maxTime=3)
+        tier = textgrid.IntervalTier('words', 0, 3)
+        tier.intervals = [textgrid.Interval(0, 2, 'a'), textgrid.Interval(1, 3, 'b')]
+        tg.append(tier)
+        bad = os.path.join(self.corpus, 'bad.TextGrid')
+        tg.write(bad)
+        manifest = os.path.join(self.directory, 'manifest.jsonl')
+        (status, lines) = self.main('validate', self.corpus, '--manifest', manifest)
+        self.assertEqual(status, 1)
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0].split('\t')[:4], [bad, 'words', '1', 'overlap'])
+        # files with problems are not recorded, so are checked again
+        self.assertEqual(self.main('validate', self.corpus, '--manifest', manifest), (1, lines))
+
+
+class TestDurationStats(unittest.TestCase):
+
+    def setUp(self):
+        import os
+        self.data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests', 'data')
+        self.path = os.path.join(self.data_dir, 'long_format.TextGrid')
+        self.tg = textgrid.TextGrid.fromFile(self.path)
+
+    def test_duration_stats(self):
+        stats = textgrid.durationStats(self.path)
+        self.assertListEqual(sorted(stats), sorted(self.tg.getNames()))
+        for tier in self.tg:
+            durations = {}
+            for x in tier:
+                durations.setdefault(x.mark, []).append(round(x.duration(), 5))
+            self.assertEqual(sorted(stats[tier.name]), sorted(durations))
+            for (mark, mark_durations) in durations.items():
+                self.assertEqual(stats[tier.name][mark].count, len(mark_durations))
+                self.assertAlmostEqual(stats[tier.name][mark].total, sum(mark_durations))
+        stats = textgrid.durationStats(self.path, tiers=['word'])
+        self.assertListEqual(list(stats), ['word'])
+        self.tg.write('test_stats.TextGrid', format='chronological')
+        chronological = textgrid.durationStats('test_stats.TextGrid', tiers=['word'])
+        remove('test_stats.TextGrid')
+        self.assertEqual(repr(chronological), repr(stats))
+
+    def test_quoted_marks(self):
+        with open('test_stats.TextGrid', 'w') as tg_file:
+            tg_file.write(tg_with_quotes.replace('""Pat""', '""Pat""\n'))
+        stats = textgrid.durationStats('test_stats.TextGrid')
+        remove('test_stats.TextGrid')
+        self.assertListEqual(list(stats), ['words'])
+        self.assertListEqual(sorted(stats['words']), ['"Is anyone home?"', 'asked "Pat"\n'])
+
+    def test_quantiles(self):
+        stats = textgrid.DurationStats([0.3, 0.1, 0.2, 0.4])
+        self.assertAlmostEqual(stats.mean(), 0.25)
+        self.assertListEqual(stats.quantiles([0., 1.]), [0.1, 0.4])
+        self.assertAlmostEqual(stats.quantile(.5), 0.25)
+        stats.update(textgrid.DurationStats([0.5]))
+        self.assertEqual(len(stats), 5)
+        self.assertAlmostEqual(stats.quantile(.5), 0.3)
+        self.assertRaises(ValueError, stats.quantile, 2)
+        self.assertIsNone(textgrid.DurationStats().mean())
+
+    def test_corpus(self):
+        from textgrid.corpus import durationStats
+        stats = durationStats(self.data_dir, tiers=['phone'], processes=2)
+        single = textgrid.durationStats(self.path, tiers=['phone'])
+        sil = stats['phone']['sil']
+        self.assertEqual(sil.count, 2 * single['phone']['sil'].count)
+        self.assertEqual(len(single['phone']['sil']), single['phone']['sil'].count)
+
 
 
 if __name__ == '__main__':
@@ -1 +1,4 @@
-from .textgrid import TextGrid, MLF, IntervalTier, PointTier, Interval, Point
+from .textgrid import TextGrid, MLF, IntervalTier, PointTier, Interval, Point, \
+    TickIntervalTier, TickPointTier, Vocabulary, BlockedList, DurationStats, \
+    diff, iterJSONL, writeJSONL, toTicks, fromTicks, durationStats, \
+    mergeDurationStats
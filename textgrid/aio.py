@@ -0,0 +1,79 @@
+# aio.py: asyncio interface for reading and writing TextGrids
+#
+# Reading and writing are run in an executor so that they do not block the
+# event loop. By default this is the loop's default executor (a thread
+# pool); since parsing is CPU-bound, a concurrent.futures.ProcessPoolExecutor
+# may be passed instead, in which case the worker processes also do the
+# file I/O.
+
+import asyncio
+import collections
+
+from .textgrid import TextGrid, DEFAULT_TEXTGRID_PRECISION
+
+DEFAULT_CONCURRENCY = 8
+
+
+def _read(f, name, round_digits):
+    tg = TextGrid(name=name)
+    tg.read(f, round_digits)
+    return tg
+
+
+def _write(tg, f, null):
+    tg.write(f, null)
+
+
+async def read(f, name=None, round_digits=DEFAULT_TEXTGRID_PRECISION,
+               executor=None):
+    """
+    Read the Praat-formatted TextGrid file indicated by string f and
+    return it as a TextGrid, without blocking the event loop
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, _read, f, name,
+                                      round_digits)
+
+
+async def write(tg, f, null='', executor=None):
+    """
+    Write TextGrid tg into a Praat-format TextGrid file named by string f,
+    without blocking the event loop
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(executor, _write, tg, f, null)
+
+
+async def iterMany(paths, round_digits=DEFAULT_TEXTGRID_PRECISION,
+                   executor=None, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Asynchronously iterate over the TextGrids read from the files in
+    paths, in order. At most concurrency files are read at once, and no
+    more are started until the consumer catches up, so that arbitrarily
+    many paths can be streamed in bounded memory.
+    """
+    if concurrency < 1:
+        raise ValueError(concurrency)
+    loop = asyncio.get_running_loop()
+    pending = collections.deque()
+    try:
+        for f in paths:
+            pending.append(loop.run_in_executor(executor, _read, f, None,
+                                                round_digits))
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def readMany(paths, round_digits=DEFAULT_TEXTGRID_PRECISION,
+                   executor=None, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Read the TextGrid files in paths, at most concurrency at once, and
+    return a list of TextGrids in the same order
+    """
+    return [tg async for tg in iterMany(paths, round_digits, executor,
+                                        concurrency)]
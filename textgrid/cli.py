@@ -0,0 +1,316 @@
+# cli.py: command-line tools for directories of TextGrid and MLF files
+#
+# Usage: python -m textgrid {convert,validate,stats,grep} ... (or the
+# textgrid console script); see python -m textgrid --help.
+#
+# Every command runs over all files below a directory which match the glob
+# patterns, in a pool of processes, streaming progress to stderr. If a
+# manifest is given, each file is recorded there (in JSON Lines, along with
+# its result) once it has been processed without problems, and files already
+# recorded are skipped, so that an interrupted run can simply be repeated
+# (and files which failed or had problems are processed again).
+
+import os
+import re
+import sys
+import json
+import codecs
+import argparse
+
+from .corpus import iterPaths
+from .exceptions import TextGridError
+from .textgrid import TextGrid, MLF, IntervalTier, TEXTGRID_FORMATS
+
+CONVERT_FORMATS = TEXTGRID_FORMATS + ('json',)
+DEFAULT_PATTERNS = ('*.TextGrid', '*.mlf')
+
+_ERRORS = (TextGridError, ValueError, EOFError, UnicodeError, OSError)
+
+
+def _readGrids(path, samplerate, check=True):
+    if path.lower().endswith('.mlf'):
+        return list(MLF(path, samplerate))
+    tg = TextGrid()
+    tg.read(path, check=check)
+    return [tg]
+
+
+# workers, which are run in the pool, and return JSON-serializable results
+
+def _convert(path, options):
+    """
+    Writes the TextGrids in the file at path below the output directory,
+    returning their paths
+    """
+    extension = '.json' if options.to == 'json' else '.TextGrid'
+    relative = os.path.relpath(path, options.directory)
+    (base, junk) = os.path.splitext(os.path.join(options.output, relative))
+    output = []
+    for tg in _readGrids(path, options.samplerate):
+        if path.lower().endswith('.mlf'):
+            # as MLF.write does, but in a directory named for the MLF
+            (root, junk) = os.path.splitext(os.path.basename(tg.name))
+            target = os.path.join(base, root + extension)
+        else:
+            target = base + extension
+        directory = os.path.dirname(target)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+        if options.to == 'json':
+            with codecs.open(target, 'w', 'UTF-8') as sink:
+                sink.write(tg.toJSON())
+        else:
+            tg.write(target, format=options.to)
+        output.append(target)
+    return output
+
+
+def _validate(path, options):
+    """
+    Returns a list of lines describing the problems with the TextGrids in
+    the file at path
+    """
+    output = []
+    # read unchecked, since a checked read stops at the first problem
+    for tg in _readGrids(path, options.samplerate, check=False):
+        for (kind, k, i, item) in tg.validate():
+            output.append('{0}\t{1}\t{2}\t{3}\t{4}'.format(
+                path, tg[k].name, '' if i is None else i, kind, item))
+    return output
+
+
+def _stats(path, options):
+    """
+    Returns a dictionary mapping the name of each tier in the file at path
+    to its numbers of Intervals and Points and total duration of Intervals
+    """
+    output = {}
+    for tg in _readGrids(path, options.samplerate):
+        for tier in tg:
+            if options.tier and tier.name not in options.tier:
+                continue
+            counts = output.setdefault(tier.name, [0, 0, 0.])
+            if isinstance(tier, IntervalTier):
+                counts[0] += len(tier)
+                counts[2] += sum(x.duration() for x in tier)
+            else:
+                counts[1] += len(tier)
+    return output
+
+
+def _grep(path, options):
+    """
+    Returns a list of lines describing the Intervals and Points in the
+    file at path whose marks match the regular expression
+    """
+    regex = re.compile(options.regex, re.I if options.ignore_case else 0)
+    output = []
+    for tg in _readGrids(path, options.samplerate):
+        for tier in tg:
+            if options.tier and tier.name not in options.tier:
+                continue
+            for x in tier:
+                if regex.search(x.mark):
+                    (minTime, maxTime) = (x.minTime, x.maxTime) if \
+                        isinstance(tier, IntervalTier) else (x.time, x.time)
+                    output.append('{0}\t{1}\t{2}\t{3}\t{4}'.format(
+                        path, tier.name, minTime, maxTime, x.mark))
+    return output
+
+
+def _run(worker, path, options):
+    """
+    Runs worker on path (in a worker process), returning the path, the
+    result, and an error message if the file could not be processed
+    """
+    try:
+        return (path, worker(path, options), None)
+    except _ERRORS as err:
+        return (path, None, str(err) or err.__class__.__name__)
+
+
+# reporters, which are run in the main process, and return True unless
+# there is something wrong with the file
+
+def _accept(result, totals):
+    return True
+
+
+def _printProblems(result, totals):
+    for line in result:
+        print(line)
+    return not result
+
+
+def _printMatches(result, totals):
+    for line in result:
+        print(line)
+    return True
+
+
+def _addStats(result, totals):
+    for (name, counts) in result.items():
+        old = totals.setdefault(name, [0, 0, 0.])
+        for (i, count) in enumerate(counts):
+            old[i] += count
+    return True
+
+
+def _printStats(totals):
+    print('tier\tintervals\tpoints\tduration\tmean')
+    for (name, (intervals, points, duration)) in sorted(totals.items()):
+        mean = duration / intervals if intervals else 0.
+        print('{0}\t{1}\t{2}\t{3}\t{4}'.format(name, intervals, points,
+                                               duration, mean))
+
+
+COMMANDS = {'convert': (_convert, _accept),
+            'validate': (_validate, _printProblems),
+            'stats': (_stats, _addStats),
+            'grep': (_grep, _printMatches)}
+
+
+def _readManifest(path):
+    """
+    Returns a dictionary mapping each file recorded in the manifest at path
+    to its result
+    """
+    done = {}
+    if path is None or not os.path.exists(path):
+        return done
+    with codecs.open(path, 'r', 'UTF-8') as source:
+        for line in source:
+            try:
+                (done_path, result) = json.loads(line)
+            except ValueError:  # e.g., the last line of an interrupted run
+                continue
+            done[done_path] = result
+    return done
+
+
+def run(worker, report, options, totals=None):
+    """
+    Runs worker over the files below options.directory in a pool of
+    options.processes processes (or in this process, if it is 1), passing
+    each result in order to report, and recording the files processed
+    without problems in options.manifest (if given). Returns the number of files which failed
+    or were reported to have problems.
+    """
+    done = _readManifest(options.manifest)
+    if totals is not None:
+        # results from earlier runs count towards the totals
+        for result in done.values():
+            report(result, totals)
+    paths = set()
+    for pattern in options.pattern or DEFAULT_PATTERNS:
+        paths.update(iterPaths(options.directory, pattern))
+    paths = [path for path in sorted(paths) if path not in done]
+    manifest = None
+    if options.manifest is not None:
+        manifest = codecs.open(options.manifest, 'a', 'UTF-8')
+    workers = [worker] * len(paths)
+    optionses = [options] * len(paths)
+    failures = 0
+    try:
+        if options.processes == 1:
+            results = map(_run, workers, paths, optionses)
+            failures = _report(results, report, totals, manifest, options,
+                               len(paths))
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(options.processes) as executor:
+                results = executor.map(_run, workers, paths, optionses)
+                failures = _report(results, report, totals, manifest,
+                                   options, len(paths))
+    finally:
+        if manifest is not None:
+            manifest.close()
+    return failures
+
+
+def _report(results, report, totals, manifest, options, n):
+    failures = 0
+    for (i, (path, result, error)) in enumerate(results, 1):
+        if error is not None:
+            failures += 1
+            print('{0}: {1}'.format(path, error), file=sys.stderr)
+            continue
+        if not report(result, totals):
+            failures += 1
+        elif manifest is not None:
+            print(json.dumps([path, result]), file=manifest)
+            manifest.flush()
+        if not options.quiet:
+            print('[{0}/{1}] {2}'.format(i, n, path), file=sys.stderr)
+            sys.stderr.flush()
+    return failures
+
+
+def parser():
+    """
+    Returns the argument parser for the command-line tools
+    """
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('directory',
+                        help='directory to search for TextGrid and MLF files')
+    common.add_argument('--pattern', action='append',
+                        help='glob pattern for the files to process (may be '
+                             'repeated; default: {0})'.format(
+                                 ', '.join(DEFAULT_PATTERNS)))
+    common.add_argument('--processes', type=int, default=None,
+                        help='number of processes (default: one per CPU)')
+    common.add_argument('--manifest',
+                        help='file recording the files processed, to '
+                             'resume an interrupted run')
+    common.add_argument('--samplerate', type=float, default=10e6,
+                        help='sample rate of MLF files (default: 10e6)')
+    common.add_argument('--quiet', action='store_true',
+                        help="don't report progress")
+    tiers = argparse.ArgumentParser(add_help=False)
+    tiers.add_argument('--tier', action='append',
+                       help='only consider tiers with this name (may be '
+                            'repeated)')
+    parser = argparse.ArgumentParser(
+        prog='textgrid',
+        description='Process directories of TextGrid and MLF files.')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+    convert = commands.add_parser(
+        'convert', parents=[common],
+        help='convert files to TextGrids in the given format, one per '
+             'TextGrid (so MLF files give a directory of them)')
+    convert.add_argument('output', help='directory to write to')
+    convert.add_argument('--to', choices=CONVERT_FORMATS, default='long',
+                         help='output format (default: long)')
+    validate = commands.add_parser(
+        'validate', parents=[common],
+        help='check files for Intervals and Points out of order, '
+             'overlapping or out of bounds, printing one line per problem')
+    stats = commands.add_parser(
+        'stats', parents=[common, tiers],
+        help='print the numbers of Intervals and Points and total '
+             'durations, by tier name')
+    grep = commands.add_parser(
+        'grep', parents=[common, tiers],
+        help='print the Intervals and Points whose marks match a regular '
+             'expression')
+    grep.add_argument('regex', help='regular expression')
+    grep.add_argument('-i', '--ignore-case', action='store_true')
+    return parser
+
+
+def main(argv=None):
+    """
+    Runs the command-line tools with the given arguments (by default, those
+    of this process), returning the exit status: 0 if every file was
+    processed without problems, and 1 otherwise
+    """
+    options = parser().parse_args(argv)
+    (worker, report) = COMMANDS[options.command]
+    if options.command == 'stats':
+        totals = {}
+        failures = run(worker, report, options, totals)
+        _printStats(totals)
+    else:
+        failures = run(worker, report, options)
+    return 1 if failures else 0
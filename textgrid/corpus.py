@@ -0,0 +1,256 @@
+# corpus.py: utilities for working with whole directories of TextGrids
+
+import os
+import fnmatch
+import logging
+import sqlite3
+
+from .exceptions import TextGridError
+from .textgrid import TextGrid, IntervalTier, DEFAULT_TEXTGRID_PRECISION, \
+    durationStats as _fileDurationStats, mergeDurationStats
+
+
+def iterPaths(directory, pattern='*.TextGrid'):
+    """
+    Iterates over the paths of all files below directory whose names
+    match the given glob pattern, in sorted order
+    """
+    for (root, dirs, files) in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if fnmatch.fnmatch(name, pattern):
+                yield os.path.join(root, name)
+
+
+def findDuplicates(directory, pattern='*.TextGrid',
+                   precision=DEFAULT_TEXTGRID_PRECISION):
+    """
+    Reads the TextGrid files below directory matching the glob pattern,
+    one at a time, and returns a list of groups (lists of paths, in sorted
+    order) of files whose TextGrids have the same fingerprint at the given
+    precision, i.e., the same tiers, marks and times. Near-duplicates, whose
+    times differ slightly, are found with a lower precision. Files which
+    cannot be parsed are logged and skipped.
+    """
+    groups = {}
+    for path in iterPaths(directory, pattern):
+        try:
+            tg = TextGrid.fromFile(path)
+        except (TextGridError, ValueError, EOFError, UnicodeError) as err:
+            logging.warning('Could not read %s: %s', path, err)
+            continue
+        groups.setdefault(tg.fingerprint(precision), []).append(path)
+    return sorted(paths for paths in groups.values() if len(paths) > 1)
+
+
+def _durationStats(path, tiers):
+    """
+    Computes the durationStats of the file at path (in a worker process),
+    returning a pair of the path and the result, or of the path and an
+    error message if it could not be parsed
+    """
+    try:
+        return (path, _fileDurationStats(path, tiers))
+    except (TextGridError, ValueError, EOFError, UnicodeError) as err:
+        return (path, str(err))
+
+
+def durationStats(directory, pattern='*.TextGrid', tiers=None,
+                  processes=None):
+    """
+    Computes the duration statistics of each mark in each IntervalTier (or
+    only those whose names are in tiers) over all TextGrid files below
+    directory matching the glob pattern, as textgrid.durationStats does
+    for one file. Files are read in parallel by a pool of processes (or in
+    this process, if processes is 1), and their partial results merged.
+    Files which cannot be parsed are logged and skipped.
+    """
+    paths = list(iterPaths(directory, pattern))
+    tierses = [tiers] * len(paths)
+    if processes == 1:
+        return _mergeResults(map(_durationStats, paths, tierses))
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(processes) as executor:
+        return _mergeResults(executor.map(_durationStats, paths, tierses))
+
+
+def _mergeResults(results):
+    partials = []
+    for (path, result) in results:
+        if not isinstance(result, dict):
+            logging.warning('Could not read %s: %s', path, result)
+            continue
+        partials.append(result)
+    return mergeDurationStats(partials)
+
+
+class MarkIndex(object):
+    """
+    A persistent inverted index from (tier name, mark) to the Intervals and
+    Points bearing that mark, over a corpus of TextGrid files. The index is
+    stored in an SQLite database at path, and is updated incrementally:
+    only files which are new or have changed (according to their size and
+    modification time) since they were last indexed are read again.
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.executescript('''
+                CREATE TABLE IF NOT EXISTS files (
+                    id INTEGER PRIMARY KEY,
+                    path TEXT UNIQUE NOT NULL,
+                    mtime REAL NOT NULL,
+                    size INTEGER NOT NULL);
+                CREATE TABLE IF NOT EXISTS postings (
+                    file INTEGER NOT NULL REFERENCES files(id),
+                    tier TEXT,
+                    mark TEXT NOT NULL,
+                    tier_index INTEGER NOT NULL,
+                    item_index INTEGER NOT NULL,
+                    xmin REAL NOT NULL,
+                    xmax REAL NOT NULL);
+                CREATE INDEX IF NOT EXISTS postings_mark
+                    ON postings (mark, tier);
+                CREATE INDEX IF NOT EXISTS postings_file
+                    ON postings (file);
+            ''')
+
+    def __str__(self):
+        return '<MarkIndex {0}, {1} files>'.format(self.path, len(self))
+
+    def __len__(self):
+        return self.connection.execute(
+            'SELECT COUNT(*) FROM files').fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def _remove(self, file_id):
+        self.connection.execute('DELETE FROM postings WHERE file = ?',
+                                (file_id,))
+        self.connection.execute('DELETE FROM files WHERE id = ?', (file_id,))
+
+    def _add(self, path, stat):
+        tg = TextGrid.fromFile(path)
+        cursor = self.connection.execute(
+            'INSERT INTO files (path, mtime, size) VALUES (?, ?, ?)',
+            (path, stat.st_mtime, stat.st_size))
+        file_id = cursor.lastrowid
+        rows = []
+        for (k, tier) in enumerate(tg):
+            if isinstance(tier, IntervalTier):
+                for (i, x) in enumerate(tier):
+                    rows.append((file_id, tier.name, x.mark, k, i,
+                                 x.minTime, x.maxTime))
+            else:
+                for (i, x) in enumerate(tier):
+                    rows.append((file_id, tier.name, x.mark, k, i,
+                                 x.time, x.time))
+        self.connection.executemany(
+            'INSERT INTO postings VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+
+    def update(self, directory, pattern='*.TextGrid'):
+        """
+        Brings the index up to date with the TextGrid files below
+        directory matching the glob pattern: new and changed files are
+        (re)indexed, and files which no longer exist are dropped. Files
+        which cannot be parsed are logged and skipped. Returns the number
+        of files (re)indexed.
+        """
+        directory = os.path.abspath(directory)
+        known = {}
+        for (file_id, path, mtime, size) in self.connection.execute(
+                'SELECT id, path, mtime, size FROM files'):
+            if path.startswith(os.path.join(directory, '')):
+                known[path] = (file_id, mtime, size)
+        n = 0
+        with self.connection:
+            for path in iterPaths(directory, pattern):
+                stat = os.stat(path)
+                old = known.pop(path, None)
+                if old is not None:
+                    if old[1:] == (stat.st_mtime, stat.st_size):
+                        continue
+                    self._remove(old[0])
+                try:
+                    self._add(path, stat)
+                except (TextGridError, ValueError, EOFError,
+                        UnicodeError) as err:
+                    logging.warning('Could not index %s: %s', path, err)
+                    continue
+                n += 1
+            for (file_id, mtime, size) in known.values():
+                self._remove(file_id)
+        return n
+
+    def query(self, mark, tier=None):
+        """
+        Returns a list of (path, tier index, item index, minTime, maxTime)
+        tuples for every Interval (or Point, for which minTime and maxTime
+        are both its time) bearing the given mark, optionally restricted to
+        tiers with the given name
+        """
+        sql = 'SELECT files.path, tier_index, item_index, xmin, xmax ' \
+              'FROM postings JOIN files ON postings.file = files.id ' \
+              'WHERE mark = ?'
+        args = (mark,)
+        if tier is not None:
+            sql += ' AND tier = ?'
+            args += (tier,)
+        sql += ' ORDER BY files.path, tier_index, item_index'
+        return self.connection.execute(sql, args).fetchall()
+
+    def marks(self, tier=None):
+        """
+        Returns a dictionary mapping each indexed mark (optionally only
+        those in tiers with the given name) to its number of tokens
+        """
+        if tier is None:
+            cursor = self.connection.execute(
+                'SELECT mark, COUNT(*) FROM postings GROUP BY mark')
+        else:
+            cursor = self.connection.execute(
+                'SELECT mark, COUNT(*) FROM postings WHERE tier = ? '
+                'GROUP BY mark', (tier,))
+        return dict(cursor.fetchall())
+
+
+def memoryReport(directory, pattern='*.TextGrid', deep=True):
+    """
+    Reads the TextGrid files below directory matching the glob pattern,
+    one at a time, and returns a dictionary summarizing the memory they
+    would use if loaded: the numbers of 'files' and Intervals and Points
+    ('count'), the total bytes of 'objects', 'times', 'marks' and
+    overall ('total'), as estimated by TextGrid.memoryUsage; the 'largest'
+    file, as a (path, total) pair; and totals by tier name under 'tiers'.
+    Files which cannot be parsed are logged and skipped.
+    """
+    keys = ('count', 'objects', 'times', 'marks', 'total')
+    report = dict((key, 0) for key in keys)
+    report.update(files=0, largest=None, tiers={})
+    for path in iterPaths(directory, pattern):
+        try:
+            usage = TextGrid.fromFile(path).memoryUsage(deep)
+        except (TextGridError, ValueError, EOFError, UnicodeError) as err:
+            logging.warning('Could not read %s: %s', path, err)
+            continue
+        report['files'] += 1
+        for key in keys:
+            report[key] += usage[key]
+        if report['largest'] is None or usage['total'] > report['largest'][1]:
+            report['largest'] = (path, usage['total'])
+        for tier in usage['tiers']:
+            totals = report['tiers'].setdefault(
+                tier['name'], dict((key, 0) for key in keys))
+            for key in keys:
+                totals[key] += tier[key]
+    return report
@@ -0,0 +1,230 @@
+# shm.py: corpora of TextGrids in shared memory, for pools of processes
+#
+# A corpus is loaded once into a block of shared memory in a packed,
+# columnar layout:
+#
+#     8 bytes: the length n of the metadata
+#     n bytes: JSON metadata (names, bounds, counts and offsets of the grids
+#              and tiers, and the vocabulary of marks), padded to 8 bytes
+#     float64 array of times (the minTimes then maxTimes of each
+#              IntervalTier, the times of each PointTier)
+#     int32 array of mark codes (one per Interval or Point)
+#
+# Other processes attach to the block by name, and get read-only TextGrid
+# and tier views which read times and marks straight out of shared memory,
+# so memory use does not grow with the number of processes.
+
+import json
+import struct
+
+from array import array
+from multiprocessing import shared_memory
+
+from .textgrid import TextGrid, IntervalTier, PointTier, Interval, Point, \
+    Vocabulary
+
+_LENGTH = struct.Struct('<Q')
+
+
+def _pad(n):
+    return (n + 7) // 8 * 8
+
+
+class _SharedIntervals(object):
+    """
+    A read-only sequence of Intervals backed by shared memory
+    """
+
+    def __init__(self, times, codes, marks, offset, code_offset, n):
+        self.times = times
+        self.codes = codes
+        self.marks = marks
+        self.offset = offset
+        self.code_offset = code_offset
+        self.n = n
+
+    def __len__(self):
+        return self.n
+
+    def __iter__(self):
+        for i in range(self.n):
+            yield self[i]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.n))]
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError(i)
+        return Interval(self.times[self.offset + i],
+                        self.times[self.offset + self.n + i],
+                        self.marks[self.codes[self.code_offset + i]])
+
+
+class _SharedPoints(_SharedIntervals):
+    """
+    A read-only sequence of Points backed by shared memory
+    """
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.n))]
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError(i)
+        return Point(self.times[self.offset + i],
+                     self.marks[self.codes[self.code_offset + i]])
+
+
+class SharedCorpus(object):
+    """
+    A list of TextGrids stored in shared memory. The creating process
+    calls SharedCorpus.create(grids), and passes the name of the result to
+    worker processes, which call SharedCorpus(name) to attach to it.
+    Indexing a SharedCorpus gives a TextGrid whose tiers are read-only
+    views over the shared memory; they must not be used after close().
+
+    """
+
+    def __init__(self, name):
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:  # track is new in Python 3.13
+            self.shm = shared_memory.SharedMemory(name=name)
+        self._attach()
+
+    def _attach(self):
+        buf = self.shm.buf
+        (n,) = _LENGTH.unpack_from(buf, 0)
+        start = _LENGTH.size
+        self.metadata = json.loads(bytes(buf[start:start + n]).decode('UTF-8'))
+        start += _pad(n)
+        end = start + 8 * self.metadata['ntimes']
+        self.times = buf[start:end].toreadonly().cast('d')
+        start = end
+        end = start + 4 * self.metadata['ncodes']
+        self.codes = buf[start:end].toreadonly().cast('i')
+        self.vocabulary = Vocabulary(self.metadata['vocabulary'])
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def __str__(self):
+        return '<SharedCorpus {0}, {1} TextGrids>'.format(self.name, len(self))
+
+    def __len__(self):
+        return len(self.metadata['grids'])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, i):
+        """
+        Return a view of the ith TextGrid
+        """
+        grid = self.metadata['grids'][i]
+        tg = TextGrid(grid['name'], grid['xmin'], grid['xmax'])
+        marks = self.vocabulary.marks
+        for tier in grid['tiers']:
+            if tier['class'] == 'IntervalTier':
+                view = IntervalTier(tier['name'], tier['xmin'], tier['xmax'])
+                view.intervals = _SharedIntervals(self.times, self.codes,
+                                                  marks, tier['times'],
+                                                  tier['codes'], tier['size'])
+            else:
+                view = PointTier(tier['name'], tier['xmin'], tier['xmax'])
+                view.points = _SharedPoints(self.times, self.codes, marks,
+                                            tier['times'], tier['codes'],
+                                            tier['size'])
+            view.vocabulary = self.vocabulary
+            tg.tiers.append(view)
+        return tg
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Detach from the shared memory
+        """
+        self.times.release()
+        self.codes.release()
+        self.shm.close()
+
+    def unlink(self):
+        """
+        Free the shared memory; this should be called once, by the
+        creating process, after all processes have closed it
+        """
+        self.shm.unlink()
+
+    # alternative constructor
+
+    @classmethod
+    def create(cls, grids, name=None):
+        """
+        Packs the given TextGrids into a new block of shared memory
+        (optionally with the given name), returning a SharedCorpus
+        attached to it
+        """
+        vocabulary = Vocabulary()
+        encode = vocabulary.encode
+        metadata = {'grids': []}
+        ntimes = 0
+        ncodes = 0
+        for tg in grids:
+            grid = {'name': tg.name, 'xmin': tg.minTime, 'xmax': tg.maxTime,
+                    'tiers': []}
+            for tier in tg:
+                if isinstance(tier, IntervalTier):
+                    cls_name = 'IntervalTier'
+                    times = array('d', [x.minTime for x in tier])
+                    times.extend(x.maxTime for x in tier)
+                else:
+                    cls_name = 'TextTier'
+                    times = array('d', [x.time for x in tier])
+                grid['tiers'].append({
+                    'class': cls_name, 'name': tier.name,
+                    'xmin': tier.minTime, 'xmax': tier.maxTime,
+                    'size': len(tier), 'times': ntimes, 'codes': ncodes,
+                    # removed below, once copied into shared memory
+                    '_times': times,
+                    '_codes': array('i', [encode(x.mark) for x in tier])})
+                ntimes += len(times)
+                ncodes += len(tier)
+            metadata['grids'].append(grid)
+        metadata['ntimes'] = ntimes
+        metadata['ncodes'] = ncodes
+        metadata['vocabulary'] = vocabulary.marks
+        columns = [tier for grid in metadata['grids']
+                   for tier in grid['tiers']]
+        arrays = [(tier.pop('_times'), tier.pop('_codes'))
+                  for tier in columns]
+        header = json.dumps(metadata).encode('UTF-8')
+        start = _LENGTH.size + _pad(len(header))
+        size = start + 8 * ntimes + 4 * ncodes
+        shm = shared_memory.SharedMemory(name=name, create=True,
+                                         size=max(size, 1))
+        buf = shm.buf
+        _LENGTH.pack_into(buf, 0, len(header))
+        buf[_LENGTH.size:_LENGTH.size + len(header)] = header
+        offset = start
+        for (times, codes) in arrays:
+            data = times.tobytes()
+            buf[offset:offset + len(data)] = data
+            offset += len(data)
+        for (times, codes) in arrays:
+            data = codes.tobytes()
+            buf[offset:offset + len(data)] = data
+            offset += len(data)
+        corpus = cls.__new__(cls)
+        corpus.shm = shm
+        corpus._attach()
+        return corpus
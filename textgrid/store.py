@@ -0,0 +1,312 @@
+# store.py: an SQLite-backed store for corpora of TextGrids and MLFs
+
+import os
+import logging
+import sqlite3
+
+from .corpus import iterPaths
+from .exceptions import TextGridError
+from .textgrid import TextGrid, MLF, IntervalTier, PointTier, Interval, Point
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS grids (
+    id INTEGER PRIMARY KEY,
+    source INTEGER NOT NULL REFERENCES sources(id),
+    name TEXT,
+    xmin REAL,
+    xmax REAL);
+CREATE TABLE IF NOT EXISTS tiers (
+    id INTEGER PRIMARY KEY,
+    grid INTEGER NOT NULL REFERENCES grids(id),
+    position INTEGER NOT NULL,
+    class TEXT NOT NULL,
+    name TEXT,
+    xmin REAL,
+    xmax REAL);
+CREATE TABLE IF NOT EXISTS intervals (
+    tier INTEGER NOT NULL REFERENCES tiers(id),
+    position INTEGER NOT NULL,
+    xmin REAL NOT NULL,
+    xmax REAL NOT NULL,
+    mark TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS points (
+    tier INTEGER NOT NULL REFERENCES tiers(id),
+    position INTEGER NOT NULL,
+    time REAL NOT NULL,
+    mark TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS grids_source ON grids (source);
+CREATE INDEX IF NOT EXISTS tiers_grid ON tiers (grid, position);
+CREATE INDEX IF NOT EXISTS tiers_name ON tiers (name);
+CREATE INDEX IF NOT EXISTS intervals_tier ON intervals (tier, position);
+CREATE INDEX IF NOT EXISTS intervals_mark ON intervals (mark);
+CREATE INDEX IF NOT EXISTS intervals_duration ON intervals (xmax - xmin);
+CREATE INDEX IF NOT EXISTS points_tier ON points (tier, position);
+CREATE INDEX IF NOT EXISTS points_mark ON points (mark);
+'''
+
+DEFAULT_BATCH_SIZE = 100
+
+
+def _parse(path, samplerate):
+    """
+    Parses the TextGrid or MLF file at path (in a worker process),
+    returning a pair of the path and a list of TextGrids, or of the path
+    and an error message if it could not be parsed
+    """
+    try:
+        if path.lower().endswith('.mlf'):
+            return (path, list(MLF(path, samplerate)))
+        return (path, [TextGrid.fromFile(path)])
+    except (TextGridError, ValueError, EOFError, UnicodeError) as err:
+        return (path, str(err))
+
+
+class CorpusStore(object):
+    """
+    Stores a corpus of TextGrids (read from Praat TextGrid files or HTK
+    MLF files) in a normalized SQLite database at path, with tables of
+    sources (files), grids, tiers, intervals and points, for ad hoc
+    querying. Query results may be retrieved as columns, or rebuilt into
+    TextGrid and tier objects.
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+
+    def __str__(self):
+        return '<CorpusStore {0}, {1} TextGrids>'.format(self.path, len(self))
+
+    def __len__(self):
+        return self.connection.execute(
+            'SELECT COUNT(*) FROM grids').fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    # ingestion
+
+    def _removeSource(self, source_id):
+        self.connection.execute(
+            'DELETE FROM intervals WHERE tier IN (SELECT tiers.id FROM '
+            'tiers JOIN grids ON tiers.grid = grids.id WHERE source = ?)',
+            (source_id,))
+        self.connection.execute(
+            'DELETE FROM points WHERE tier IN (SELECT tiers.id FROM '
+            'tiers JOIN grids ON tiers.grid = grids.id WHERE source = ?)',
+            (source_id,))
+        self.connection.execute(
+            'DELETE FROM tiers WHERE grid IN '
+            '(SELECT id FROM grids WHERE source = ?)', (source_id,))
+        self.connection.execute('DELETE FROM grids WHERE source = ?',
+                                (source_id,))
+        self.connection.execute('DELETE FROM sources WHERE id = ?',
+                                (source_id,))
+
+    def _insertGrid(self, source_id, tg):
+        execute = self.connection.execute
+        grid_id = execute(
+            'INSERT INTO grids (source, name, xmin, xmax) VALUES (?, ?, ?, ?)',
+            (source_id, tg.name, tg.minTime, tg.maxTime)).lastrowid
+        for (k, tier) in enumerate(tg):
+            if isinstance(tier, IntervalTier):
+                tier_id = execute(
+                    'INSERT INTO tiers (grid, position, class, name, xmin, '
+                    'xmax) VALUES (?, ?, ?, ?, ?, ?)',
+                    (grid_id, k, 'IntervalTier', tier.name, tier.minTime,
+                     tier.maxTime)).lastrowid
+                self.connection.executemany(
+                    'INSERT INTO intervals VALUES (?, ?, ?, ?, ?)',
+                    ((tier_id, i, x.minTime, x.maxTime, x.mark)
+                     for (i, x) in enumerate(tier)))
+            else:
+                tier_id = execute(
+                    'INSERT INTO tiers (grid, position, class, name, xmin, '
+                    'xmax) VALUES (?, ?, ?, ?, ?, ?)',
+                    (grid_id, k, 'TextTier', tier.name, tier.minTime,
+                     tier.maxTime)).lastrowid
+                self.connection.executemany(
+                    'INSERT INTO points VALUES (?, ?, ?, ?)',
+                    ((tier_id, i, x.time, x.mark)
+                     for (i, x) in enumerate(tier)))
+        return grid_id
+
+    def _pending(self, paths):
+        """
+        Returns the paths which are new or have changed since they were
+        ingested, removing the stale data for the latter
+        """
+        known = dict((path, (source_id, mtime, size)) for
+                     (source_id, path, mtime, size) in self.connection.execute(
+                         'SELECT id, path, mtime, size FROM sources'))
+        pending = []
+        with self.connection:
+            for path in paths:
+                stat = os.stat(path)
+                old = known.get(path)
+                if old is not None:
+                    if old[1:] == (stat.st_mtime, stat.st_size):
+                        continue
+                    self._removeSource(old[0])
+                pending.append(path)
+        return pending
+
+    def ingest(self, directory, patterns=('*.TextGrid', '*.mlf'),
+               samplerate=10e6, processes=None,
+               batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Ingests all TextGrid and MLF files below directory matching any of
+        the glob patterns. Files are parsed in parallel by a pool of
+        processes (or in this process, if processes is 1), and written to
+        the database in batches of batch_size files, each in a single
+        transaction. Ingestion is resumable: files which have already been
+        ingested and have not changed since are skipped, so an interrupted
+        run can simply be repeated. Files which cannot be parsed are logged
+        and skipped. Returns the number of files ingested.
+        """
+        paths = []
+        for pattern in patterns:
+            paths.extend(iterPaths(os.path.abspath(directory), pattern))
+        pending = self._pending(sorted(set(paths)))
+        samplerates = [samplerate] * len(pending)
+        if processes == 1:
+            results = map(_parse, pending, samplerates)
+            return self._store(results, batch_size)
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(processes) as executor:
+            results = executor.map(_parse, pending, samplerates,
+                                   chunksize=batch_size)
+            return self._store(results, batch_size)
+
+    def _store(self, results, batch_size):
+        n = 0
+        for (path, grids) in results:
+            if not isinstance(grids, list):
+                logging.warning('Could not ingest %s: %s', path, grids)
+                continue
+            stat = os.stat(path)
+            source_id = self.connection.execute(
+                'INSERT INTO sources (path, mtime, size) VALUES (?, ?, ?)',
+                (path, stat.st_mtime, stat.st_size)).lastrowid
+            for tg in grids:
+                self._insertGrid(source_id, tg)
+            n += 1
+            if n % batch_size == 0:
+                self.connection.commit()
+        self.connection.commit()
+        return n
+
+    # queries
+
+    def query(self, sql, args=()):
+        """
+        Runs an arbitrary SQL query, returning a list of rows
+        """
+        return self.connection.execute(sql, args).fetchall()
+
+    def columns(self, sql, args=()):
+        """
+        Runs an arbitrary SQL query, returning a dictionary mapping each
+        column name to a list of its values
+        """
+        cursor = self.connection.execute(sql, args)
+        names = [d[0] for d in cursor.description]
+        rows = cursor.fetchall()
+        return dict((name, [row[i] for row in rows])
+                    for (i, name) in enumerate(names))
+
+    def intervals(self, tier=None, mark=None, min_duration=None,
+                  max_duration=None):
+        """
+        Returns, as columns (path, grid, tier, position, xmin, xmax, mark),
+        the Intervals in tiers with the given name, bearing the given mark
+        and with durations in the given range (each criterion being
+        optional)
+        """
+        sql = 'SELECT sources.path AS path, grids.id AS grid, ' \
+              'tiers.position AS tier, intervals.position AS position, ' \
+              'intervals.xmin AS xmin, intervals.xmax AS xmax, ' \
+              'intervals.mark AS mark FROM intervals ' \
+              'JOIN tiers ON intervals.tier = tiers.id ' \
+              'JOIN grids ON tiers.grid = grids.id ' \
+              'JOIN sources ON grids.source = sources.id WHERE 1'
+        args = ()
+        if tier is not None:
+            sql += ' AND tiers.name = ?'
+            args += (tier,)
+        if mark is not None:
+            sql += ' AND intervals.mark = ?'
+            args += (mark,)
+        if min_duration is not None:
+            sql += ' AND intervals.xmax - intervals.xmin >= ?'
+            args += (min_duration,)
+        if max_duration is not None:
+            sql += ' AND intervals.xmax - intervals.xmin <= ?'
+            args += (max_duration,)
+        sql += ' ORDER BY grids.id, tiers.position, intervals.position'
+        return self.columns(sql, args)
+
+    def getTier(self, tier_id):
+        """
+        Rebuilds the tier with the given id
+        """
+        row = self.connection.execute(
+            'SELECT class, name, xmin, xmax FROM tiers WHERE id = ?',
+            (tier_id,)).fetchone()
+        if row is None:
+            raise KeyError(tier_id)
+        (cls, name, minTime, maxTime) = row
+        if cls == 'IntervalTier':
+            tier = IntervalTier(name, minTime, maxTime)
+            tier.intervals = [Interval(xmin, xmax, mark) for
+                              (xmin, xmax, mark) in self.connection.execute(
+                                  'SELECT xmin, xmax, mark FROM intervals '
+                                  'WHERE tier = ? ORDER BY position',
+                                  (tier_id,))]
+        else:
+            tier = PointTier(name, minTime, maxTime)
+            tier.points = [Point(time, mark) for
+                           (time, mark) in self.connection.execute(
+                               'SELECT time, mark FROM points WHERE tier = ? '
+                               'ORDER BY position', (tier_id,))]
+        return tier
+
+    def getTextGrid(self, grid_id):
+        """
+        Rebuilds the TextGrid with the given id
+        """
+        row = self.connection.execute(
+            'SELECT name, xmin, xmax FROM grids WHERE id = ?',
+            (grid_id,)).fetchone()
+        if row is None:
+            raise KeyError(grid_id)
+        tg = TextGrid(*row)
+        for (tier_id,) in self.connection.execute(
+                'SELECT id FROM tiers WHERE grid = ? ORDER BY position',
+                (grid_id,)).fetchall():
+            tg.tiers.append(self.getTier(tier_id))
+        return tg
+
+    def getTextGrids(self, path):
+        """
+        Rebuilds the TextGrids read from the file at path
+        """
+        rows = self.connection.execute(
+            'SELECT grids.id FROM grids JOIN sources ON grids.source = '
+            'sources.id WHERE sources.path = ? ORDER BY grids.id',
+            (os.path.abspath(path),)).fetchall()
+        return [self.getTextGrid(grid_id) for (grid_id,) in rows]
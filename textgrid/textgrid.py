@@ -30,18 +30,35 @@
 from __future__ import print_function
 
 import re
+import json
+import heapq
+import hashlib
 import codecs
 import os.path
 import logging
 
-from sys import stderr
-from bisect import bisect_left
+from sys import stderr, getsizeof
+from array import array
+from bisect import bisect_left, bisect_right
+from operator import attrgetter, itemgetter
+from io import StringIO
 
 from .exceptions import TextGridError
 
 DEFAULT_TEXTGRID_PRECISION = 5
 DEFAULT_MLF_PRECISION = 5
 
+CROP_MODES = ('truncate', 'contained', 'overlapping')
+
+TEXTGRID_FORMATS = ('long', 'chronological')
+CHRONOLOGICAL_HEADER = '"Praat chronological TextGrid text file"'
+
+MERGE_POLICIES = ('first', 'longest', 'split', 'collect')
+
+DEFAULT_TICK_RESOLUTION = 1e-7  # HTK's units of 100ns
+
+DEFAULT_BLOCK_LOAD = 500
+
 
 def _getMark(text, short):
     """
@@ -101,6 +118,299 @@ def detectEncoding(f):
     return encoding
 
 
+class Vocabulary(object):
+    """
+    Maps marks to integer codes and back. A Vocabulary may be private to a
+    tier or TextGrid, or shared by many of them (e.g., by a whole corpus);
+    marks read through a Vocabulary are interned, so each distinct mark is
+    only stored once no matter how many Intervals or Points bear it.
+
+    """
+
+    def __init__(self, marks=()):
+        self.marks = []
+        self.codes = {}
+        for mark in marks:
+            self.encode(mark)
+
+    def __repr__(self):
+        return 'Vocabulary({0})'.format(self.marks)
+
+    def __iter__(self):
+        return iter(self.marks)
+
+    def __len__(self):
+        return len(self.marks)
+
+    def __contains__(self, mark):
+        return mark in self.codes
+
+    def encode(self, mark):
+        """
+        Returns the code for mark, assigning it the next code if it is new
+        """
+        code = self.codes.get(mark)
+        if code is None:
+            code = len(self.marks)
+            self.marks.append(mark)
+            self.codes[mark] = code
+        return code
+
+    def decode(self, code):
+        """
+        Returns the mark with the given code
+        """
+        return self.marks[code]
+
+    def intern(self, mark):
+        """
+        Returns the canonical copy of mark, adding it if it is new
+        """
+        return self.marks[self.encode(mark)]
+
+
+class BlockedList(object):
+    """
+    A sorted sequence of Intervals or Points, stored as a list of blocks
+    of at most twice load items each, along with their keys (start times).
+    Inserting or removing an item only shifts the items of one block;
+    items are found by binary search over the blocks and then within one,
+    and by position through a binary indexed (Fenwick) tree of the block
+    sizes, so edits and lookups take (nearly) logarithmic time rather than
+    the linear time of a list. Indexing, slicing (which gives a list),
+    iteration and the other list methods used by the tiers all work as
+    they do for lists. The items are not checked for order.
+
+    """
+
+    def __init__(self, items=(), key=attrgetter('minTime'),
+                 load=DEFAULT_BLOCK_LOAD):
+        if load < 1:
+            raise ValueError(load)
+        self.key = key
+        self.load = load
+        items = list(items)
+        self._blocks = [items[i:i + load] for i in
+                        range(0, len(items), load)]
+        self._keys = [[key(x) for x in block] for block in self._blocks]
+        self._lasts = [block[-1] for block in self._blocks]
+        self._len = len(items)
+        self._tree = None
+
+    def __repr__(self):
+        return 'BlockedList({0})'.format(list(self))
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for block in self._blocks:
+            for x in block:
+                yield x
+
+    def __reversed__(self):
+        for block in reversed(self._blocks):
+            for x in reversed(block):
+                yield x
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def _locate(self, i):
+        """
+        Returns the index of the block holding the ith item, and its index
+        within that block
+        """
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError(i)
+        tree = self._getTree()
+        n = len(tree) - 1
+        k = 0
+        bit = 1 << n.bit_length()
+        while bit:
+            if k + bit <= n and tree[k + bit] <= i:
+                k += bit
+                i -= tree[k]
+            bit >>= 1
+        return (k, i)
+
+    def _getTree(self):
+        """
+        Returns the Fenwick tree of the block sizes, which is rebuilt
+        (in linear time) only after blocks are split or removed
+        """
+        if self._tree is None:
+            tree = [0] + [len(block) for block in self._blocks]
+            for k in range(1, len(tree)):
+                parent = k + (k & -k)
+                if parent < len(tree):
+                    tree[parent] += tree[k]
+            self._tree = tree
+        return self._tree
+
+    def _resize(self, k, delta):
+        """
+        Records that the kth block grew by delta items
+        """
+        tree = self._tree
+        if tree is None:
+            return
+        k += 1
+        while k < len(tree):
+            tree[k] += delta
+            k += k & -k
+
+    def _offset(self, k):
+        """
+        Returns the index of the first item of the kth block
+        """
+        tree = self._getTree()
+        offset = 0
+        while k:
+            offset += tree[k]
+            k -= k & -k
+        return offset
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            (start, stop, step) = i.indices(self._len)
+            if step != 1:
+                return [self[j] for j in range(start, stop, step)]
+            output = []
+            if start >= stop:
+                return output
+            (k, j) = self._locate(start)
+            while len(output) < stop - start:
+                output.extend(self._blocks[k][j:j + stop - start -
+                                              len(output)])
+                k += 1
+                j = 0
+            return output
+        (k, j) = self._locate(i)
+        return self._blocks[k][j]
+
+    def __setitem__(self, i, x):
+        (k, j) = self._locate(i)
+        self._blocks[k][j] = x
+        self._keys[k][j] = self.key(x)
+        self._lasts[k] = self._blocks[k][-1]
+
+    def __delitem__(self, i):
+        (k, j) = self._locate(i)
+        del self._blocks[k][j]
+        del self._keys[k][j]
+        if self._blocks[k]:
+            self._lasts[k] = self._blocks[k][-1]
+            self._resize(k, -1)
+        else:
+            del self._blocks[k]
+            del self._keys[k]
+            del self._lasts[k]
+            self._tree = None
+        self._len -= 1
+
+    def pop(self, i=-1):
+        x = self[i]
+        del self[i]
+        return x
+
+    def insert(self, i, x):
+        if i < 0:
+            i = max(0, i + self._len)
+        if not self._blocks:
+            self._blocks.append([])
+            self._keys.append([])
+            self._lasts.append(None)
+            self._tree = None
+        if i >= self._len:
+            (k, j) = (len(self._blocks) - 1, len(self._blocks[-1]))
+        else:
+            (k, j) = self._locate(i)
+        block = self._blocks[k]
+        keys = self._keys[k]
+        block.insert(j, x)
+        keys.insert(j, self.key(x))
+        self._lasts[k] = block[-1]
+        if len(block) > 2 * self.load:
+            self._blocks[k:k + 1] = [block[:self.load], block[self.load:]]
+            self._keys[k:k + 1] = [keys[:self.load], keys[self.load:]]
+            self._lasts[k:k + 1] = [block[self.load - 1], block[-1]]
+            self._tree = None
+        else:
+            self._resize(k, 1)
+        self._len += 1
+
+    def append(self, x):
+        self.insert(self._len, x)
+
+    def extend(self, items):
+        for x in items:
+            self.insert(self._len, x)
+
+    def bisect_left(self, x):
+        """
+        Returns the index of the first item which is not less than x (as
+        bisect.bisect_left would), searching first among the last items
+        of the blocks, and then within one block
+        """
+        k = bisect_left(self._lasts, x)
+        if k == len(self._blocks):
+            return self._len
+        return self._offset(k) + bisect_left(self._blocks[k], x)
+
+    def bisect_right(self, x):
+        """
+        Returns the index of the first item which is greater than x (as
+        bisect.bisect_right would)
+        """
+        k = bisect_right(self._lasts, x)
+        if k == len(self._blocks):
+            return self._len
+        return self._offset(k) + bisect_right(self._blocks[k], x)
+
+    def keys(self):
+        """
+        Returns a read-only sequence view of the keys of the items
+        """
+        return _BlockedKeys(self)
+
+
+def _bisectLeft(items, x):
+    """
+    bisect_left, using the faster search of a BlockedList if items is one
+    """
+    if isinstance(items, BlockedList):
+        return items.bisect_left(x)
+    return bisect_left(items, x)
+
+
+def _bisectRight(items, x):
+    """
+    bisect_right, using the faster search of a BlockedList if items is one
+    """
+    if isinstance(items, BlockedList):
+        return items.bisect_right(x)
+    return bisect_right(items, x)
+
+
+class _BlockedKeys(object):
+    """
+    A read-only sequence of the keys of the items of a BlockedList
+    """
+
+    def __init__(self, items):
+        self.items = items
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, i):
+        (k, j) = self.items._locate(i)
+        return self.items._keys[k][j]
+
+
 class Point(object):
     """
     Represents a point in time with an associated textual mark, as stored
@@ -162,9 +472,59 @@ class Point(object):
 
     def __iadd__(self, other):
         self.time += other
+        return self
 
     def __isub__(self, other):
         self.time -= other
+        return self
+
+
+def _tickRate(resolution):
+    """
+    Returns the (integral) number of ticks per second at the given
+    resolution
+    """
+    rate = round(1. / resolution)
+    if rate < 1 or abs(rate * resolution - 1.) > 1e-9:
+        raise ValueError('Resolution {0} does not evenly divide a '
+                         'second'.format(resolution))
+    return rate
+
+
+def toTicks(times, resolution=DEFAULT_TICK_RESOLUTION):
+    """
+    Converts times in seconds to an array of integer ticks at the given
+    resolution, rounding each to the nearest tick
+    """
+    rate = _tickRate(resolution)
+    return array('q', [int(round(t * rate)) for t in times])
+
+
+def fromTicks(ticks, resolution=DEFAULT_TICK_RESOLUTION):
+    """
+    Converts integer ticks at the given resolution to a list of times in
+    seconds (the inverse of toTicks)
+    """
+    rate = float(_tickRate(resolution))
+    return [t / rate for t in ticks]
+
+
+def _parseTicks(text, rate):
+    """
+    Parses a number of seconds written in decimal notation directly into
+    integer ticks at the given rate (per second), rounding to the nearest
+    tick; the conversion is exact, since it does not go through a float
+    """
+    text = text.strip()
+    if 'e' in text or 'E' in text:
+        return int(round(float(text) * rate))
+    (whole, junk, fraction) = text.partition('.')
+    negative = whole.startswith('-')
+    ticks = int(whole.lstrip('+-') or '0') * rate
+    if fraction:
+        scale = 10 ** len(fraction)
+        ticks += (2 * int(fraction) * rate + scale) // (2 * scale)
+    return -ticks if negative else ticks
 
 
 def decode(string):
@@ -270,10 +630,12 @@ class Interval(object):
     def __iadd__(self, other):
         self.minTime += other
         self.maxTime += other
+        return self
 
     def __isub__(self, other):
         self.minTime -= other
         self.maxTime -= other
+        return self
 
     def overlaps(self, other):
         """
@@ -300,6 +662,72 @@ class Interval(object):
         return (self.minTime, self.maxTime)
 
 
+def _memoryUsage(tier, items, attrs, deep, seen):
+    """
+    Estimates the bytes used by a tier whose items have the given time
+    attributes. Objects whose ids are in the set seen (e.g., marks interned
+    in a Vocabulary shared with another tier) are not counted again.
+    """
+    usage = {'name': tier.name, 'class': tier.__class__.__name__,
+             'count': len(items), 'objects': getsizeof(tier) +
+             getsizeof(tier.__dict__) + getsizeof(items), 'times': 0,
+             'marks': 0}
+    for x in items:
+        usage['objects'] += getsizeof(x) + getsizeof(x.__dict__)
+        if not deep:
+            continue
+        for attr in attrs:
+            t = getattr(x, attr)
+            if id(t) not in seen:
+                seen.add(id(t))
+                usage['times'] += getsizeof(t)
+        if id(x.mark) not in seen:
+            seen.add(id(x.mark))
+            usage['marks'] += getsizeof(x.mark)
+    usage['total'] = usage['objects'] + usage['times'] + usage['marks']
+    return usage
+
+
+def _formatTime(t, precision):
+    if t is None:
+        return 'None'
+    return '{0:.{1}f}'.format(round(t, precision) + 0., precision)
+
+
+def _fingerprint(tier, items, attrs, precision, cache):
+    """
+    Returns a hash of the class, name and bounds of a tier and the times
+    (rounded to precision) and marks of its items, cached in the tier (if
+    cache is True) until it is changed through its methods
+    """
+    key = (precision, tier.name, tier.minTime, tier.maxTime, id(items),
+           len(items))
+    if cache:
+        cached = tier._fingerprints.get(key)
+        if cached is not None:
+            return cached
+    digest = hashlib.blake2b(digest_size=16)
+    name = '' if tier.name is None else tier.name
+    digest.update('{0}\t{1}:{2}\t{3}\t{4}\n'.format(
+        tier.__class__.__name__, len(name), name,
+        _formatTime(tier.minTime, precision),
+        _formatTime(tier.maxTime, precision)).encode('UTF-8'))
+    for x in items:
+        digest.update('{0}\t{1}:{2}\n'.format(
+            '\t'.join(_formatTime(getattr(x, attr), precision)
+                      for attr in attrs),
+            len(x.mark), x.mark).encode('UTF-8'))
+    if cache:
+        tier._fingerprints = {key: digest.hexdigest()}
+    return digest.hexdigest()
+
+
+def _mergeBounds(tiers):
+    minTime = min(tier.minTime for tier in tiers)
+    maxTimes = [tier.maxTime for tier in tiers if tier.maxTime is not None]
+    return (minTime, max(maxTimes) if maxTimes else None)
+
+
 class PointTier(object):
     """
     Represents Praat PointTiers (also called TextTiers) as list of Points
@@ -313,12 +741,17 @@ class PointTier(object):
         self.minTime = minTime
         self.maxTime = maxTime
         self.points = []
+        self.vocabulary = None
+        self._timesCache = None
+        self._fingerprints = {}
+        self._shared = False
 
     def __eq__(self, other):
         if not hasattr(other, 'points'):
             return False
         else:
-            return all([a == b for a, b in zip(self.points, other.points)])
+            return len(self.points) == len(other.points) and \
+                   all(a == b for a, b in zip(self.points, other.points))
 
     def __str__(self):
         return '<PointTier {0}, {1} points>'.format(self.name, len(self))
@@ -346,11 +779,35 @@ class PointTier(object):
             raise ValueError(self.minTime)  # too early
         if self.maxTime and point > self.maxTime:
             raise ValueError(self.maxTime)  # too late
-        i = bisect_left(self.points, point)
+        i = _bisectLeft(self.points, point)
         if i < len(self.points) and self.points[i].time == point.time:
             raise ValueError(point)  # we already got one right there
+        self._touch()
         self.points.insert(i, point)
 
+    def addPoints(self, points):
+        """
+        adds many Points (or (time, mark) pairs), in any order, to the
+        PointTier at once. They are sorted once and merged with the
+        existing Points, and all conflicts (Points out of bounds, or two
+        Points at the same time) are reported together in a single
+        ValueError, in which case the PointTier is left unchanged.
+        """
+        new = [p if isinstance(p, Point) else Point(*p) for p in points]
+        conflicts = [p for p in new if p.time < self.minTime or
+                     (self.maxTime and p.time > self.maxTime)]
+        # Timsort merges the two sorted runs in linear time
+        merged = sorted(self.points + new, key=attrgetter('time'))
+        prev = None
+        for point in merged:
+            if prev is not None and prev.time == point.time:
+                conflicts.append((prev, point))
+            prev = point
+        if conflicts:
+            raise ValueError(conflicts)
+        self._touch(copy=False)
+        self.points = self._store(merged)
+
     def remove(self, time, mark):
         """
         removes a constructed Point i from the PointTier
@@ -358,13 +815,332 @@ class PointTier(object):
         self.removePoint(Point(time, mark))
 
     def removePoint(self, point):
-        self.points.remove(point)
+        """
+        removes the Point at the same time as point, found by binary search
+        """
+        i = _bisectLeft(self.points, point.time)
+        if i == len(self.points) or self.points[i] != point:
+            raise ValueError(point)
+        self._touch()
+        del self.points[i]
+
+    def _times(self):
+        """
+        Returns an array of the times of the Points, which is cached until
+        the Points are added, removed or replaced (or a view of the times,
+        if the Points are stored in a BlockedList)
+        """
+        if isinstance(self.points, BlockedList):
+            return self.points.keys()
+        cache = self._timesCache
+        if cache is None or cache[0] is not self.points or \
+                cache[1] != len(self.points):
+            times = array('d', [p.time for p in self.points])
+            self._timesCache = (self.points, len(self.points), times)
+            return times
+        return cache[2]
+
+    def indexNearest(self, time):
+        """
+        Returns the index of the Point nearest to the given time (the
+        earlier one, in case of a tie), or None if there are no Points
+        """
+        times = self._times()
+        i = bisect_left(times, time)
+        if i == len(times):
+            return i - 1 if i else None
+        if i and time - times[i - 1] <= times[i] - time:
+            return i - 1
+        return i
+
+    def pointNearest(self, time):
+        """
+        Returns the Point nearest to the given time, or None if there are
+        no Points
+        """
+        i = self.indexNearest(time)
+        if i is not None:
+            return self.points[i]
+
+    def indicesNearest(self, time, k):
+        """
+        Returns a list of the indices of the (up to) k Points nearest to
+        the given time, nearest first
+        """
+        times = self._times()
+        j = bisect_left(times, time)
+        i = j - 1
+        output = []
+        while len(output) < k:
+            if i >= 0 and (j == len(times) or
+                           time - times[i] <= times[j] - time):
+                output.append(i)
+                i -= 1
+            elif j < len(times):
+                output.append(j)
+                j += 1
+            else:
+                break
+        return output
+
+    def pointsNearest(self, time, k):
+        """
+        Returns a list of the (up to) k Points nearest to the given time,
+        nearest first
+        """
+        return [self.points[i] for i in self.indicesNearest(time, k)]
+
+    def indicesWithin(self, time, delta):
+        """
+        Returns the range of indices of the Points within delta seconds of
+        the given time (inclusive)
+        """
+        times = self._times()
+        return range(bisect_left(times, time - delta),
+                     bisect_right(times, time + delta))
+
+    def pointsWithin(self, time, delta):
+        """
+        Returns a list of the Points within delta seconds of the given
+        time (inclusive)
+        """
+        return [self.points[i] for i in self.indicesWithin(time, delta)]
+
+    def indexNearestEach(self, times):
+        """
+        Returns a list with the index of the Point nearest to each of the
+        given times. If the times are in order, this is done in a single
+        linear pass; otherwise each is looked up by binary search.
+        """
+        if any(b < a for (a, b) in zip(times, times[1:])):
+            return [self.indexNearest(time) for time in times]
+        mine = self._times()
+        if not mine:
+            return [None] * len(times)
+        output = []
+        i = 0
+        last = len(mine) - 1
+        for time in times:
+            while i < last and mine[i + 1] - time < time - mine[i]:
+                i += 1
+            output.append(i)
+        return output
+
+    def indicesWithinEach(self, times, delta):
+        """
+        Returns a list with the range of indices of the Points within delta
+        seconds of each of the given times. If the times are in order, this
+        is done in a single linear pass; otherwise each is looked up by
+        binary search.
+        """
+        if any(b < a for (a, b) in zip(times, times[1:])):
+            return [self.indicesWithin(time, delta) for time in times]
+        mine = self._times()
+        output = []
+        i = j = 0
+        for time in times:
+            while i < len(mine) and mine[i] < time - delta:
+                i += 1
+            j = max(i, j)
+            while j < len(mine) and mine[j] <= time + delta:
+                j += 1
+            output.append(range(i, j))
+        return output
+
+    def copy(self):
+        """
+        Returns a copy of the PointTier which shares its list of Points
+        until either tier is first changed (by add, remove, shift, etc.),
+        when the changed tier gets a list of its own; copying is thus
+        cheap, however many Points there are. The Points themselves are
+        shared, as they are by crop, so they should be replaced rather
+        than modified in place.
+        """
+        pt = PointTier(self.name, self.minTime, self.maxTime)
+        pt.points = self.points
+        pt.vocabulary = self.vocabulary
+        self._shared = pt._shared = True
+        return pt
+
+    def _touch(self, copy=True):
+        """
+        Called before the PointTier is changed, to clear its cached
+        fingerprints and times, and to give it its own list of Points if it
+        shares one with a copy (unless copy is False, when the list is about
+        to be replaced anyway)
+        """
+        self._fingerprints = {}
+        self._timesCache = None
+        if self._shared:
+            if copy:
+                self.points = self._store(list(self.points))
+            self._shared = False
+
+    def useBlocks(self, load=DEFAULT_BLOCK_LOAD):
+        """
+        Stores the Points in a BlockedList with blocks of about load
+        Points, so that adding, removing and finding Points take
+        logarithmic rather than linear time, which pays off for long tiers
+        which are edited interactively; if load is None, the Points are
+        stored in a list again
+        """
+        self._touch(copy=False)
+        if load is None:
+            self.points = list(self.points)
+        else:
+            self.points = BlockedList(self.points, attrgetter('time'), load)
+
+    def _store(self, points):
+        """
+        Returns the list points in the same kind of storage as the Points
+        """
+        if isinstance(self.points, BlockedList):
+            return BlockedList(points, self.points.key, self.points.load)
+        return points
+
+    def crop(self, start, end, mode='truncate', rebase=False):
+        """
+        Returns a new PointTier spanning start to end, holding the Points
+        of this PointTier which lie in that window (the mode is accepted
+        for compatibility with IntervalTier.crop, but does not matter for
+        Points). The window is found by binary search, and unless rebase
+        is True (in which case times are shifted so the window begins at
+        zero), the result shares its Point objects with this PointTier.
+        """
+        if mode not in CROP_MODES:
+            raise ValueError(mode)
+        if start >= end:
+            raise ValueError(start, end)
+        i = _bisectLeft(self.points, start)
+        j = _bisectRight(self.points, end)
+        if rebase:
+            pt = PointTier(self.name, 0., end - start)
+            pt.points = [Point(p.time - start, p.mark)
+                         for p in self.points[i:j]]
+        else:
+            pt = PointTier(self.name, start, end)
+            pt.points = self.points[i:j]
+        pt.vocabulary = self.vocabulary
+        return pt
+
+    def shift(self, offset):
+        """
+        Shifts the PointTier and all its Points by offset seconds. Points
+        are replaced rather than modified, so Points shared with other
+        tiers (e.g., by crop) are unaffected.
+        """
+        self.minTime += offset
+        if self.maxTime is not None:
+            self.maxTime += offset
+        self._touch(copy=False)
+        self.points = self._store([Point(p.time + offset, p.mark)
+                                   for p in self.points])
+
+    def scale(self, factor):
+        """
+        Multiplies all times in the PointTier by the positive factor
+        """
+        if factor <= 0:
+            raise ValueError(factor)
+        self.minTime *= factor
+        if self.maxTime is not None:
+            self.maxTime *= factor
+        self._touch(copy=False)
+        self.points = self._store([Point(p.time * factor, p.mark)
+                                   for p in self.points])
+
+    def _concat(self, other, offset):
+        """
+        Appends the Points of other, shifted by offset, checking only the
+        seam between the two
+        """
+        points = [Point(p.time + offset, p.mark) for p in other.points]
+        if self.points and points and points[0].time <= self.points[-1].time:
+            raise ValueError(self.points[-1], points[0])
+        self._touch()
+        self.points.extend(points)
+
+    def validate(self):
+        """
+        Checks, in a single pass, that the Points are in order, that no
+        two have the same time, and that they lie within the bounds of
+        the PointTier. Returns a list of (kind, i, point) tuples, one for
+        each problem found, where i is the index of the offending point
+        and kind is one of 'order', 'duplicate' or 'bounds'.
+        """
+        issues = []
+        prev = None
+        for (i, point) in enumerate(self.points):
+            if point.time < self.minTime or \
+                    (self.maxTime is not None and point.time > self.maxTime):
+                issues.append(('bounds', i, point))
+            if prev is not None:
+                if point.time < prev.time:
+                    issues.append(('order', i, point))
+                elif point.time == prev.time:
+                    issues.append(('duplicate', i, point))
+            prev = point
+        return issues
+
+    def memoryUsage(self, deep=True, seen=None):
+        """
+        Returns a dictionary estimating the memory used by the PointTier, in
+        bytes: 'objects' for the tier and its Points themselves, 'times'
+        for their times (including the cached array of times) and 'marks'
+        for their marks, with the 'total' and the 'count' of Points. If
+        deep is False, times and marks are not counted. Marks shared
+        between Points (as when read with a Vocabulary) count only once.
+        """
+        if seen is None:
+            seen = set()
+        usage = _memoryUsage(self, self.points, ('time',), deep, seen)
+        if deep and self._timesCache is not None:
+            usage['times'] += getsizeof(self._timesCache[2])
+            usage['total'] += getsizeof(self._timesCache[2])
+        return usage
+
+    def fingerprint(self, precision=DEFAULT_TEXTGRID_PRECISION, cache=False):
+        """
+        Returns a stable hash (as a hexadecimal string) of the name,
+        bounds, and times (rounded to precision) and marks of the Points of
+        the PointTier, computed without serializing it. If cache is True,
+        it is cached until the tier is changed through its methods; the
+        cached value is stale if Points are changed in place (e.g., by
+        setting point.mark), so only cache if they will not be.
+        """
+        return _fingerprint(self, self.points, ('time',), precision, cache)
+
+    def encodeMarks(self, vocabulary=None):
+        """
+        Returns a pair of an array of integer codes, one for each Point, and
+        the Vocabulary mapping them to marks. By default this is the
+        tier's own Vocabulary (if it was read with one), or a new one.
+        """
+        if vocabulary is None:
+            vocabulary = self.vocabulary
+        if vocabulary is None:
+            vocabulary = Vocabulary()
+        encode = vocabulary.encode
+        return (array('i', [encode(x.mark) for x in self.points]), vocabulary)
+
+    def toTicks(self, resolution=DEFAULT_TICK_RESOLUTION):
+        """
+        Returns an array of the times of the Points as integer ticks at the
+        given resolution (by default, HTK's 100ns), on which comparisons and
+        bisection are exact
+        """
+        return toTicks([p.time for p in self.points], resolution)
 
-    def read(self, f, round_digits=DEFAULT_TEXTGRID_PRECISION):
+    def read(self, f, round_digits=DEFAULT_TEXTGRID_PRECISION,
+             vocabulary=None):
         """
         Read the Points contained in the Praat-formated PointTier/TextTier
-        file indicated by string f
+        file indicated by string f. Marks are interned through the given
+        (or a new) Vocabulary, which becomes that of the PointTier.
         """
+        if vocabulary is None:
+            vocabulary = Vocabulary()
+        self.vocabulary = vocabulary
         encoding = detectEncoding(f)
         with codecs.open(f, 'r', encoding=encoding) as source:
             file_type, short = parse_header(source)
@@ -374,10 +1150,11 @@ class PointTier(object):
             self.minTime = parse_line(source.readline(), short, round_digits)
             self.maxTime = parse_line(source.readline(), short, round_digits)
             n = int(parse_line(source.readline(), short, round_digits))
+            self._touch()
             for i in range(n):
                 source.readline().rstrip()  # header
                 itim = parse_line(source.readline(), short, round_digits)
-                imrk = _getMark(source, short)
+                imrk = vocabulary.intern(_getMark(source, short))
                 self.points.append(Point(itim, imrk))
 
     def write(self, f):
@@ -412,6 +1189,57 @@ class PointTier(object):
         pt.read(f)
         return pt
 
+    @classmethod
+    def fromTicks(cls, ticks, codes, vocabulary,
+                  resolution=DEFAULT_TICK_RESOLUTION, name=None, minTime=0.,
+                  maxTime=None):
+        """
+        Builds a PointTier from an array of times in integer ticks at the
+        given resolution and an array of mark codes (the inverse of toTicks
+        and encodeMarks)
+        """
+        pt = cls(name, minTime, maxTime)
+        pt.vocabulary = vocabulary
+        decode = vocabulary.decode
+        pt.points = [Point(time, decode(code)) for (time, code) in
+                     zip(fromTicks(ticks, resolution), codes)]
+        return pt
+
+    @classmethod
+    def merge(cls, tiers, on_conflict='first', name=None):
+        """
+        Merges PointTiers (e.g., from several annotators, or from chunks
+        decoded in parallel) into a new PointTier, by a k-way merge in
+        O(n log k) time. Points at the same time conflict: with
+        on_conflict='first', the one from the earliest tier is kept;
+        with 'collect', all conflicting pairs (among all the Points at
+        the same time) are reported together in a single ValueError. The
+        name and Vocabulary default to those of the first tier.
+        """
+        if on_conflict not in ('first', 'collect'):
+            raise ValueError(on_conflict)
+        tiers = list(tiers)
+        _checkTiers(tiers, 'PointTier.merge')
+        if not tiers:
+            raise ValueError('No tiers to merge')
+        (minTime, maxTime) = _mergeBounds(tiers)
+        pt = cls(tiers[0].name if name is None else name, minTime, maxTime)
+        pt.vocabulary = tiers[0].vocabulary
+        points = pt.points
+        conflicts = []
+        same = []  # the Points so far at the time of the last one kept
+        for point in heapq.merge(*[tier.points for tier in tiers],
+                                 key=attrgetter('time')):
+            if points and point.time == points[-1].time:
+                conflicts.extend((prev, point) for prev in same)
+                same.append(point)
+                continue
+            points.append(point)
+            same = [point]
+        if conflicts and on_conflict == 'collect':
+            raise ValueError(conflicts)
+        return pt
+
 
 class IntervalTier(object):
     """
@@ -427,12 +1255,16 @@ class IntervalTier(object):
         self.maxTime = maxTime
         self.intervals = []
         self.strict = True
+        self.vocabulary = None
+        self._fingerprints = {}
+        self._shared = False
 
     def __eq__(self, other):
         if not hasattr(other, 'intervals'):
             return False
         else:
-            return all([a == b for a, b in zip(self.intervals, other.intervals)])
+            return len(self.intervals) == len(other.intervals) and \
+                   all(a == b for a, b in zip(self.intervals, other.intervals))
 
     def __str__(self):
         return '<IntervalTier {0}, {1} intervals>'.format(self.name,
@@ -461,17 +1293,84 @@ class IntervalTier(object):
         if self.maxTime and interval.maxTime > self.maxTime:  # too late
             # raise ValueError, self.maxTime
             raise ValueError(self.maxTime)
-        i = bisect_left(self.intervals, interval)
+        i = _bisectLeft(self.intervals, interval)
         if i != len(self.intervals) and self.intervals[i] == interval:
             raise ValueError(self.intervals[i])
         interval.strict = self.strict
+        self._touch()
         self.intervals.insert(i, interval)
 
+    def addIntervals(self, intervals):
+        """
+        Adds many Intervals (or (minTime, maxTime, mark) triples), in any
+        order, to the IntervalTier at once. They are sorted once and merged
+        with the existing Intervals, and bounds and overlaps are checked in
+        a single sweep. All conflicts (including triples without a
+        positive duration) are reported together in a single ValueError,
+        in which case the IntervalTier is left unchanged. If the tier is
+        not strict, overlaps are allowed (with one warning).
+        """
+        new = []
+        conflicts = []
+        for interval in intervals:
+            if not isinstance(interval, Interval):
+                if interval[0] >= interval[1]:  # no positive duration
+                    conflicts.append(tuple(interval))
+                    continue
+                interval = Interval(*interval)
+            if interval.minTime < self.minTime or \
+                    (self.maxTime and interval.maxTime > self.maxTime):
+                conflicts.append(interval)
+            interval.strict = self.strict
+            new.append(interval)
+        # Timsort merges the two sorted runs in linear time
+        merged = sorted(self.intervals + new,
+                        key=attrgetter('minTime', 'maxTime'))
+        overlaps = 0
+        # a heap of the Intervals not yet ended, by maxTime, so that each
+        # Interval is compared with every earlier one it overlaps
+        open_intervals = []
+        for (i, interval) in enumerate(merged):
+            while open_intervals and \
+                    open_intervals[0][0] <= interval.minTime:
+                heapq.heappop(open_intervals)
+            for (maxTime, j, prev) in sorted(open_intervals,
+                                             key=itemgetter(1)):
+                if self.strict or interval.bounds() == prev.bounds():
+                    conflicts.append((prev, interval))
+                else:
+                    overlaps += 1
+            heapq.heappush(open_intervals, (interval.maxTime, i, interval))
+        if conflicts:
+            raise ValueError(conflicts)
+        if overlaps:
+            logging.warning('%d overlapping intervals in tier %s',
+                            overlaps, self.name)
+        self._touch(copy=False)
+        self.intervals = self._store(merged)
+
     def remove(self, minTime, maxTime, mark):
         self.removeInterval(Interval(minTime, maxTime, mark))
 
     def removeInterval(self, interval):
-        self.intervals.remove(interval)
+        """
+        Removes the Interval with the same bounds as interval, found by
+        binary search (or by a linear scan, if the tier is not strict, and
+        so may have overlapping Intervals)
+        """
+        intervals = self.intervals
+        if self.strict:
+            i = _bisectLeft(intervals, interval.minTime)
+        else:
+            i = 0
+        while i < len(intervals) and \
+                intervals[i].minTime <= interval.minTime:
+            if intervals[i] == interval:
+                self._touch()
+                del self.intervals[i]
+                return
+            i += 1
+        raise ValueError(interval)
 
     def indexContaining(self, time):
         """
@@ -479,7 +1378,7 @@ class IntervalTier(object):
         or None if the time point is outside the bounds of this tier. The
         argument can be a numeric type, or a Point object.
         """
-        i = bisect_left(self.intervals, time)
+        i = _bisectLeft(self.intervals, time)
         if i != len(self.intervals):
             if self.intervals[i].minTime <= time <= \
                     self.intervals[i].maxTime:
@@ -495,11 +1394,287 @@ class IntervalTier(object):
         if i is not None:
             return self.intervals[i]
 
-    def read(self, f, round_digits=DEFAULT_TEXTGRID_PRECISION):
+    def copy(self):
+        """
+        Returns a copy of the IntervalTier which shares its list of
+        Intervals until either tier is first changed (by add, remove,
+        shift, etc.), when the changed tier gets a list of its own; copying
+        is thus cheap, however many Intervals there are. The Intervals
+        themselves are shared, as they are by crop, so they should be
+        replaced rather than modified in place.
+        """
+        it = IntervalTier(self.name, self.minTime, self.maxTime)
+        it.intervals = self.intervals
+        it.strict = self.strict
+        it.vocabulary = self.vocabulary
+        self._shared = it._shared = True
+        return it
+
+    def _touch(self, copy=True):
+        """
+        Called before the IntervalTier is changed, to clear its cached
+        fingerprints, and to give it its own list of Intervals if it shares
+        one with a copy (unless copy is False, when the list is about to be
+        replaced anyway)
+        """
+        self._fingerprints = {}
+        if self._shared:
+            if copy:
+                self.intervals = self._store(list(self.intervals))
+            self._shared = False
+
+    def useBlocks(self, load=DEFAULT_BLOCK_LOAD):
+        """
+        Stores the Intervals in a BlockedList with blocks of about load
+        Intervals, so that adding, removing and finding Intervals take
+        logarithmic rather than linear time, which pays off for long tiers
+        which are edited interactively; if load is None, the Intervals are
+        stored in a list again
+        """
+        self._touch(copy=False)
+        if load is None:
+            self.intervals = list(self.intervals)
+        else:
+            self.intervals = BlockedList(self.intervals,
+                                         attrgetter('minTime'), load)
+
+    def _store(self, intervals):
+        """
+        Returns the list intervals in the same kind of storage as the
+        Intervals
+        """
+        if isinstance(self.intervals, BlockedList):
+            return BlockedList(intervals, self.intervals.key,
+                               self.intervals.load)
+        return intervals
+
+    def crop(self, start, end, mode='truncate', rebase=False):
+        """
+        Returns a new IntervalTier spanning start to end. With the
+        'truncate' mode, Intervals overlapping the window are kept, with
+        those straddling its edges cut off at start and end; with
+        'contained', only Intervals lying entirely within the window are
+        kept; and with 'overlapping', all Intervals overlapping the window
+        are kept as they are (and the tier bounds widened to fit them).
+        The window is found by binary search, and unless rebase is True (in
+        which case times are shifted so the window begins at zero), the
+        result shares its (uncut) Interval objects with this IntervalTier.
+        """
+        if mode not in CROP_MODES:
+            raise ValueError(mode)
+        if start >= end:
+            raise ValueError(start, end)
+        intervals = self.intervals
+        # first Interval ending after start
+        i = _bisectLeft(intervals, start)
+        if i < len(intervals) and intervals[i].maxTime == start:
+            i += 1
+        # first Interval beginning at or after end
+        j = _bisectRight(intervals, end)
+        if j > i and intervals[j - 1].minTime == end:
+            j -= 1
+        if mode == 'contained':
+            while i < j and intervals[i].minTime < start:
+                i += 1
+            while j > i and intervals[j - 1].maxTime > end:
+                j -= 1
+        output = intervals[i:j]
+        minTime = start
+        maxTime = end
+        if output and mode == 'truncate':
+            first = output[0]
+            if first.minTime < start:
+                output[0] = Interval(start, first.maxTime, first.mark)
+                output[0].strict = self.strict
+            last = output[-1]
+            if last.maxTime > end:
+                output[-1] = Interval(output[-1].minTime, end, last.mark)
+                output[-1].strict = self.strict
+        elif output and mode == 'overlapping':
+            minTime = min(start, output[0].minTime)
+            maxTime = max(end, output[-1].maxTime)
+        if rebase:
+            output = [Interval(x.minTime - start, x.maxTime - start, x.mark)
+                      for x in output]
+            for interval in output:
+                interval.strict = self.strict
+            minTime -= start
+            maxTime -= start
+        it = IntervalTier(self.name, minTime, maxTime)
+        it.strict = self.strict
+        it.intervals = output
+        it.vocabulary = self.vocabulary
+        return it
+
+    def shift(self, offset):
+        """
+        Shifts the IntervalTier and all its Intervals by offset seconds.
+        Intervals are replaced rather than modified, so Intervals shared
+        with other tiers (e.g., by crop) are unaffected.
+        """
+        self.minTime += offset
+        if self.maxTime is not None:
+            self.maxTime += offset
+        self._touch(copy=False)
+        self.intervals = self._store(self._shifted(self.intervals, offset))
+
+    def scale(self, factor):
+        """
+        Multiplies all times in the IntervalTier by the positive factor
+        """
+        if factor <= 0:
+            raise ValueError(factor)
+        self.minTime *= factor
+        if self.maxTime is not None:
+            self.maxTime *= factor
+        output = [Interval(x.minTime * factor, x.maxTime * factor, x.mark)
+                  for x in self.intervals]
+        if not self.strict:
+            for interval in output:
+                interval.strict = False
+        self._touch(copy=False)
+        self.intervals = self._store(output)
+
+    def _shifted(self, intervals, offset):
+        output = [Interval(x.minTime + offset, x.maxTime + offset, x.mark)
+                  for x in intervals]
+        if not self.strict:
+            for interval in output:
+                interval.strict = False
+        return output
+
+    def _concat(self, other, offset):
+        """
+        Appends the Intervals of other, shifted by offset, checking only
+        the seam between the two
+        """
+        intervals = self._shifted(other.intervals, offset)
+        if self.intervals and intervals and \
+                intervals[0].minTime < self.intervals[-1].maxTime:
+            if self.strict:
+                raise ValueError(self.intervals[-1], intervals[0])
+            logging.warning('Overlap at seam of tier %s: (%f, %f)', self.name,
+                            intervals[0].minTime, self.intervals[-1].maxTime)
+        self._touch()
+        self.intervals.extend(intervals)
+
+    def validate(self):
+        """
+        Checks, in a single pass, that the Intervals have positive
+        durations, are in order, do not overlap, and lie within the bounds
+        of the IntervalTier. Returns a list of (kind, i, interval) tuples,
+        one for each problem found, where i is the index of the offending
+        interval and kind is one of 'duration', 'order', 'overlap' or
+        'bounds'.
+        """
+        issues = []
+        prev = None
+        for (i, interval) in enumerate(self.intervals):
+            if interval.minTime >= interval.maxTime:
+                issues.append(('duration', i, interval))
+            if interval.minTime < self.minTime or \
+                    (self.maxTime is not None and
+                     interval.maxTime > self.maxTime):
+                issues.append(('bounds', i, interval))
+            if prev is not None:
+                if interval.minTime < prev.minTime:
+                    issues.append(('order', i, interval))
+                elif interval.minTime < prev.maxTime:
+                    issues.append(('overlap', i, interval))
+            prev = interval
+        return issues
+
+    def toFrames(self, frame_shift, window=None, null='', vocabulary=None):
+        """
+        Rasterizes the IntervalTier into frames every frame_shift seconds,
+        each window seconds long (by default, the same as the shift), as
+        in HTK. Each frame is labeled with the mark of the Interval
+        containing its center, or null if there is none. Returns a pair of
+        an array of the integer codes of these labels, one per frame, and
+        the Vocabulary mapping codes to marks (by default the tier's own
+        Vocabulary, or a new one).
+        """
+        window = frame_shift if window is None else window
+        if vocabulary is None:
+            vocabulary = self.vocabulary
+        if vocabulary is None:
+            vocabulary = Vocabulary()
+        (minTime, maxTime) = self.bounds()
+        n = max(0, int((maxTime - minTime - window) / frame_shift + 1e-6) + 1)
+        codes = array('i', [vocabulary.encode(null)]) * n
+        intervals = self.intervals
+        j = 0
+        code = None
+        for k in range(n):
+            center = minTime + k * frame_shift + window / 2.
+            while j < len(intervals) and intervals[j].maxTime <= center:
+                j += 1
+                code = None
+            if j < len(intervals) and intervals[j].minTime <= center:
+                if code is None:
+                    code = vocabulary.encode(intervals[j].mark)
+                codes[k] = code
+        return (codes, vocabulary)
+
+    def memoryUsage(self, deep=True, seen=None):
+        """
+        Returns a dictionary estimating the memory used by the IntervalTier,
+        in bytes: 'objects' for the tier and its Intervals themselves,
+        'times' for their start and end times and 'marks' for their marks,
+        with the 'total' and the 'count' of Intervals. If deep is False,
+        times and marks are not counted. Marks shared between Intervals (as
+        when read with a Vocabulary) count only once.
+        """
+        if seen is None:
+            seen = set()
+        return _memoryUsage(self, self.intervals, ('minTime', 'maxTime'),
+                            deep, seen)
+
+    def fingerprint(self, precision=DEFAULT_TEXTGRID_PRECISION, cache=False):
+        """
+        Returns a stable hash (as a hexadecimal string) of the name,
+        bounds, and times (rounded to precision) and marks of the
+        Intervals of the IntervalTier, computed without serializing it. If
+        cache is True, it is cached until the tier is changed through its
+        methods; the cached value is stale if Intervals are changed in
+        place (e.g., by setting interval.mark, or by interval += d), so
+        only cache if they will not be.
+        """
+        return _fingerprint(self, self.intervals, ('minTime', 'maxTime'),
+                            precision, cache)
+
+    def encodeMarks(self, vocabulary=None):
+        """
+        Returns a pair of an array of integer codes, one for each Interval, and
+        the Vocabulary mapping them to marks. By default this is the
+        tier's own Vocabulary (if it was read with one), or a new one.
+        """
+        if vocabulary is None:
+            vocabulary = self.vocabulary
+        if vocabulary is None:
+            vocabulary = Vocabulary()
+        encode = vocabulary.encode
+        return (array('i', [encode(x.mark) for x in self.intervals]), vocabulary)
+
+    def toTicks(self, resolution=DEFAULT_TICK_RESOLUTION):
+        """
+        Returns a pair of arrays of the start and end times of the
+        Intervals as integer ticks at the given resolution (by default,
+        HTK's 100ns), on which comparisons and bisection are exact
+        """
+        return (toTicks([x.minTime for x in self.intervals], resolution),
+                toTicks([x.maxTime for x in self.intervals], resolution))
+
+    def read(self, f, round_digits=DEFAULT_TEXTGRID_PRECISION,
+             vocabulary=None):
         """
         Read the Intervals contained in the Praat-formated IntervalTier
-        file indicated by string f
+        file indicated by string f. Marks are interned through the given
+        (or a new) Vocabulary, which becomes that of the IntervalTier.
         """
+        if vocabulary is None:
+            vocabulary = Vocabulary()
+        self.vocabulary = vocabulary
         encoding = detectEncoding(f)
         with codecs.open(f, 'r', encoding=encoding) as source:
             file_type, short = parse_header(source)
@@ -509,11 +1684,12 @@ class IntervalTier(object):
             self.minTime = parse_line(source.readline(), short, round_digits)
             self.maxTime = parse_line(source.readline(), short, round_digits)
             n = int(parse_line(source.readline(), short, round_digits))
+            self._touch()
             for i in range(n):
                 source.readline().rstrip()  # header
                 imin = parse_line(source.readline(), short, round_digits)
                 imax = parse_line(source.readline(), short, round_digits)
-                imrk = _getMark(source, short)
+                imrk = vocabulary.intern(_getMark(source, short))
                 self.intervals.append(Interval(imin, imax, imrk))
 
     def _fillInTheGaps(self, null):
@@ -532,6 +1708,36 @@ class IntervalTier(object):
             output.append(Interval(prev_t, self.maxTime, null))
         return output
 
+    def iterFilled(self, null=''):
+        """
+        Iterates over (minTime, maxTime, mark) triples for the Intervals
+        of this tier, with the temporal gaps between them (and up to the
+        tier bounds) filled in by triples whose mark is null. Unlike
+        _fillInTheGaps, no Interval objects are created.
+        """
+        prev_t = self.minTime
+        for interval in self.intervals:
+            if prev_t < interval.minTime:
+                yield (prev_t, interval.minTime, null)
+            yield (interval.minTime, interval.maxTime, interval.mark)
+            prev_t = interval.maxTime
+        if self.maxTime is not None and prev_t < self.maxTime:
+            yield (prev_t, self.maxTime, null)
+
+    def _countFilled(self):
+        """
+        Returns the number of triples iterFilled would produce
+        """
+        prev_t = self.minTime
+        n = len(self.intervals)
+        for interval in self.intervals:
+            if prev_t < interval.minTime:
+                n += 1
+            prev_t = interval.maxTime
+        if self.maxTime is not None and prev_t < self.maxTime:
+            n += 1
+        return n
+
     def write(self, f, null=''):
         """
         Write the current state into a Praat-format IntervalTier file. f
@@ -544,22 +1750,21 @@ class IntervalTier(object):
         print('xmin = {0}'.format(self.minTime), file=sink)
         print('xmax = {0}'.format(self.maxTime if self.maxTime \
                                       else self.intervals[-1].maxTime), file=sink)
-        # compute the number of intervals and make the empty ones
-        output = self._fillInTheGaps(null)
+        # compute the number of intervals, counting the empty ones
+        print('intervals: size = {0}'.format(self._countFilled()), file=sink)
         # write it all out
-        print('intervals: size = {0}'.format(len(output)), file=sink)
-        for (i, interval) in enumerate(output, 1):
+        for (i, (minTime, maxTime, mark)) in enumerate(self.iterFilled(null),
+                                                       1):
             print('intervals [{0}]'.format(i), file=sink)
-            print('\txmin = {0}'.format(interval.minTime), file=sink)
-            print('\txmax = {0}'.format(interval.maxTime), file=sink)
-            mark = _formatMark(interval.mark)
-            print('\ttext = "{0}"'.format(mark), file=sink)
+            print('\txmin = {0}'.format(minTime), file=sink)
+            print('\txmax = {0}'.format(maxTime), file=sink)
+            print('\ttext = "{0}"'.format(_formatMark(mark)), file=sink)
         sink.close()
 
     def bounds(self):
         return (self.minTime, self.maxTime or self.intervals[-1].maxTime)
 
-    # alternative constructor
+    # alternative constructors
 
     @classmethod
     def fromFile(cls, f, name=None):
@@ -568,9 +1773,662 @@ class IntervalTier(object):
         it.read(f)
         return it
 
-
-def parse_line(line, short, to_round):
-    line = line.strip()
+    @classmethod
+    def fromFrames(cls, codes, vocabulary, frame_shift, window=None, null='',
+                   name=None, minTime=0., round_digits=DEFAULT_MLF_PRECISION):
+        """
+        Builds an IntervalTier from frame labels (the inverse of toFrames)
+        by run-length encoding the codes: each run of frames with the same
+        label becomes an Interval, except for runs labeled null, which
+        become gaps. Boundaries fall midway between the centers of
+        adjacent frames, and are rounded to round_digits, as MLF.read does.
+        """
+        window = frame_shift if window is None else window
+        offset = minTime + (window - frame_shift) / 2.
+        n = len(codes)
+        maxTime = round(minTime + (n - 1) * frame_shift + window,
+                        round_digits) if n else minTime
+        it = cls(name, minTime, maxTime)
+        it.vocabulary = vocabulary
+        start = 0
+        for k in range(1, n + 1):
+            if k < n and codes[k] == codes[start]:
+                continue
+            mark = vocabulary.decode(codes[start])
+            if mark != null:
+                imin = round(offset + start * frame_shift, round_digits) \
+                    if start else minTime
+                imax = round(offset + k * frame_shift, round_digits) \
+                    if k < n else maxTime
+                it.intervals.append(Interval(imin, imax, mark))
+            start = k
+        return it
+
+    @classmethod
+    def fromTicks(cls, starts, ends, codes, vocabulary,
+                  resolution=DEFAULT_TICK_RESOLUTION, name=None, minTime=0.,
+                  maxTime=None):
+        """
+        Builds an IntervalTier from arrays of start and end times in
+        integer ticks at the given resolution and an array of mark codes
+        (the inverse of toTicks and encodeMarks)
+        """
+        it = cls(name, minTime, maxTime)
+        it.vocabulary = vocabulary
+        decode = vocabulary.decode
+        it.intervals = [Interval(start, end, decode(code)) for
+                        (start, end, code) in
+                        zip(fromTicks(starts, resolution),
+                            fromTicks(ends, resolution), codes)]
+        return it
+
+    @classmethod
+    def merge(cls, tiers, on_conflict='first', name=None):
+        """
+        Merges IntervalTiers (e.g., from several annotators, or from chunks
+        decoded in parallel) into a new IntervalTier, in one pass of a
+        k-way merge in O(n log k) time. Intervals are taken in order of
+        start time, then of tier, and each overlap between an Interval
+        and the last one kept is resolved according to on_conflict (one
+        of MERGE_POLICIES):
+
+        'first': keep the Interval already kept, and drop the new one
+        'longest': keep whichever of the two is longer
+        'split': the new Interval takes over from its start, cutting the
+            one already kept short; whatever of that one extends past the
+            end of the new Interval is kept as well, where it does not
+            overlap anything else
+        'collect': report all overlapping pairs among the Intervals
+            merged (whether or not they would be kept) together in a
+            single ValueError
+
+        The name and Vocabulary default to those of the first tier.
+        Intervals are shared with the tiers merged, except for those cut
+        by 'split'.
+        """
+        if on_conflict not in MERGE_POLICIES:
+            raise ValueError(on_conflict)
+        tiers = list(tiers)
+        _checkTiers(tiers, 'IntervalTier.merge')
+        if not tiers:
+            raise ValueError('No tiers to merge')
+        (minTime, maxTime) = _mergeBounds(tiers)
+        it = cls(tiers[0].name if name is None else name, minTime, maxTime)
+        it.vocabulary = tiers[0].vocabulary
+        intervals = it.intervals
+        conflicts = []
+        # the heap holds the next Interval of each tier, along with the
+        # remainders of Intervals cut by 'split'
+        heap = []
+        for (k, tier) in enumerate(tiers):
+            source = iter(tier.intervals)
+            interval = next(source, None)
+            if interval is not None:
+                heap.append((interval.minTime, k, 0, interval, source))
+        heapq.heapify(heap)
+        n = 0
+        # for 'collect', the Intervals not yet ended, by maxTime
+        open_intervals = []
+        while heap:
+            (minTime, k, j, interval, source) = heap[0]
+            following = None if source is None else next(source, None)
+            if following is None:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (following.minTime, k, 0, following,
+                                         source))
+            if on_conflict == 'collect':
+                while open_intervals and \
+                        open_intervals[0][0] <= interval.minTime:
+                    heapq.heappop(open_intervals)
+                conflicts.extend((prev, interval) for (maxTime, i, prev) in
+                                 sorted(open_intervals, key=itemgetter(1)))
+                n += 1
+                heapq.heappush(open_intervals, (interval.maxTime, n,
+                                                interval))
+                intervals.append(interval)
+                continue
+            if not intervals or interval.minTime >= intervals[-1].maxTime:
+                intervals.append(interval)
+                continue
+            prev = intervals[-1]
+            if on_conflict == 'longest':
+                if interval.duration() > prev.duration():
+                    intervals[-1] = interval
+            elif on_conflict == 'split':
+                if j:  # a remainder gives way to what is already kept
+                    if interval.maxTime > prev.maxTime:
+                        n += 1
+                        heapq.heappush(heap, (prev.maxTime, k, n,
+                                              Interval(prev.maxTime,
+                                                       interval.maxTime,
+                                                       interval.mark), None))
+                    continue
+                if prev.maxTime > interval.maxTime:
+                    n += 1
+                    heapq.heappush(heap, (interval.maxTime, k, n,
+                                          Interval(interval.maxTime,
+                                                   prev.maxTime, prev.mark),
+                                          None))
+                if prev.minTime < interval.minTime:
+                    intervals[-1] = Interval(prev.minTime, interval.minTime,
+                                             prev.mark)
+                else:
+                    intervals[-1] = interval
+                    continue
+                intervals.append(interval)
+        if conflicts:
+            raise ValueError(conflicts)
+        return it
+
+
+class _TickTier(object):
+    """
+    The bounds, marks and conversions shared by TickIntervalTier and
+    TickPointTier, whose times are stored as integer ticks at a fixed
+    resolution; minTime and maxTime are views of the bounds in seconds
+    """
+
+    def __init__(self, name, minTime, maxTime, resolution):
+        self.name = name
+        self.resolution = resolution
+        self.rate = _tickRate(resolution)
+        self.minTick = self._tick(minTime)
+        self.maxTick = None if maxTime is None else self._tick(maxTime)
+        self.marks = []
+        self.vocabulary = None
+        self.strict = True
+
+    def __len__(self):
+        return len(self.marks)
+
+    def _tick(self, time):
+        """
+        Returns the number of ticks nearest to time, in seconds (or to the
+        time of a Point)
+        """
+        return int(round(getattr(time, 'time', time) * self.rate))
+
+    def _time(self, tick):
+        return tick / float(self.rate)
+
+    @property
+    def minTime(self):
+        return self._time(self.minTick)
+
+    @minTime.setter
+    def minTime(self, time):
+        self.minTick = self._tick(time)
+
+    @property
+    def maxTime(self):
+        return None if self.maxTick is None else self._time(self.maxTick)
+
+    @maxTime.setter
+    def maxTime(self, time):
+        self.maxTick = None if time is None else self._tick(time)
+
+    def encodeMarks(self, vocabulary=None):
+        """
+        Returns a pair of an array of integer codes, one for each mark, and
+        the Vocabulary mapping them to marks. By default this is the
+        tier's own Vocabulary (if it was read with one), or a new one.
+        """
+        if vocabulary is None:
+            vocabulary = self.vocabulary
+        if vocabulary is None:
+            vocabulary = Vocabulary()
+        encode = vocabulary.encode
+        return (array('i', [encode(mark) for mark in self.marks]), vocabulary)
+
+    def _ticksAt(self, ticks, resolution):
+        """
+        Returns a copy of the array of ticks, converted to the given
+        resolution if need be
+        """
+        if resolution is None or _tickRate(resolution) == self.rate:
+            return array('q', ticks)
+        return toTicks(fromTicks(ticks, self.resolution), resolution)
+
+
+class TickPointTier(_TickTier):
+    """
+    Represents Praat PointTiers as a list of marks and an array of their
+    times in integer ticks at a fixed resolution (by default, HTK's
+    100ns), on which adding, removing, lookups and comparisons work
+    directly, so that they are exact. Points, with times in seconds, are
+    made on demand when the tier is indexed or iterated over, as a view;
+    changing them does not change the tier. Read TextGrids with a
+    resolution to get these in place of PointTiers (see TextGrid.read),
+    and use toPointTier for what else a PointTier can do.
+    """
+
+    def __init__(self, name=None, minTime=0., maxTime=None,
+                 resolution=DEFAULT_TICK_RESOLUTION):
+        _TickTier.__init__(self, name, minTime, maxTime, resolution)
+        self.times = array('q')
+
+    def __eq__(self, other):
+        if not isinstance(other, TickPointTier):
+            return False
+        return self.rate == other.rate and self.times == other.times and \
+            self.marks == other.marks
+
+    def __str__(self):
+        return '<TickPointTier {0}, {1} points>'.format(self.name, len(self))
+
+    def __repr__(self):
+        return 'TickPointTier({0}, {1})'.format(self.name, list(self))
+
+    def __iter__(self):
+        for (tick, mark) in zip(self.times, self.marks):
+            yield Point(self._time(tick), mark)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return Point(self._time(self.times[i]), self.marks[i])
+
+    def add(self, time, mark):
+        self.addTicks(self._tick(time), mark)
+
+    def addPoint(self, point):
+        self.addTicks(self._tick(point.time), point.mark)
+
+    def addTicks(self, tick, mark):
+        """
+        Adds a Point at the given time in ticks, maintaining order
+        """
+        if tick < self.minTick:
+            raise ValueError(self.minTime)  # too early
+        if self.maxTick is not None and tick > self.maxTick:
+            raise ValueError(self.maxTime)  # too late
+        i = bisect_left(self.times, tick)
+        if i < len(self.times) and self.times[i] == tick:
+            raise ValueError(self[i])  # we already got one right there
+        self.times.insert(i, tick)
+        self.marks.insert(i, mark)
+
+    def remove(self, time, mark):
+        self.removeTicks(self._tick(time))
+
+    def removePoint(self, point):
+        self.removeTicks(self._tick(point.time))
+
+    def removeTicks(self, tick):
+        """
+        Removes the Point at the given time in ticks
+        """
+        i = bisect_left(self.times, tick)
+        if i == len(self.times) or self.times[i] != tick:
+            raise ValueError(self._time(tick))
+        del self.times[i]
+        del self.marks[i]
+
+    def indexNearest(self, time):
+        """
+        Returns the index of the Point nearest to the given time (the
+        earlier one, in case of a tie), or None if there are no Points
+        """
+        times = self.times
+        tick = self._tick(time)
+        i = bisect_left(times, tick)
+        if i == len(times):
+            return i - 1 if i else None
+        if i and tick - times[i - 1] <= times[i] - tick:
+            return i - 1
+        return i
+
+    def pointNearest(self, time):
+        """
+        Returns the Point nearest to the given time, or None if there are
+        no Points
+        """
+        i = self.indexNearest(time)
+        if i is not None:
+            return self[i]
+
+    def indicesWithin(self, time, delta):
+        """
+        Returns the range of indices of the Points within delta seconds of
+        the given time (inclusive)
+        """
+        (tick, delta) = (self._tick(time), self._tick(delta))
+        return range(bisect_left(self.times, tick - delta),
+                     bisect_right(self.times, tick + delta))
+
+    def pointsWithin(self, time, delta):
+        """
+        Returns a list of the Points within delta seconds of the given
+        time (inclusive)
+        """
+        return [self[i] for i in self.indicesWithin(time, delta)]
+
+    def copy(self):
+        """
+        Returns a copy of the TickPointTier
+        """
+        pt = TickPointTier(self.name, resolution=self.resolution)
+        (pt.minTick, pt.maxTick) = (self.minTick, self.maxTick)
+        pt.times = array('q', self.times)
+        pt.marks = list(self.marks)
+        pt.vocabulary = self.vocabulary
+        return pt
+
+    def shift(self, offset):
+        """
+        Shifts the PointTier and all its Points by offset seconds (rounded
+        to the nearest tick)
+        """
+        offset = self._tick(offset)
+        self.minTick += offset
+        if self.maxTick is not None:
+            self.maxTick += offset
+        self.times = array('q', [tick + offset for tick in self.times])
+
+    def validate(self):
+        """
+        As PointTier.validate, comparing ticks
+        """
+        issues = []
+        prev = None
+        for (i, tick) in enumerate(self.times):
+            if tick < self.minTick or \
+                    (self.maxTick is not None and tick > self.maxTick):
+                issues.append(('bounds', i, self[i]))
+            if prev is not None:
+                if tick < prev:
+                    issues.append(('order', i, self[i]))
+                elif tick == prev:
+                    issues.append(('duplicate', i, self[i]))
+            prev = tick
+        return issues
+
+    def toTicks(self, resolution=None):
+        """
+        Returns a copy of the array of the times of the Points in ticks, at
+        the given resolution (by default, that of the tier)
+        """
+        return self._ticksAt(self.times, resolution)
+
+    def bounds(self):
+        maxTick = self.maxTick
+        if maxTick is None:
+            maxTick = self.times[-1]
+        return (self.minTime, self._time(maxTick))
+
+    def toPointTier(self):
+        """
+        Returns a PointTier of the Points of the TickPointTier
+        """
+        pt = PointTier(self.name, self.minTime, self.maxTime)
+        pt.points = list(self)
+        pt.vocabulary = self.vocabulary
+        return pt
+
+    # alternative constructors
+
+    @classmethod
+    def fromPointTier(cls, tier, resolution=DEFAULT_TICK_RESOLUTION):
+        """
+        Builds a TickPointTier from a PointTier, rounding its times to the
+        nearest tick at the given resolution
+        """
+        pt = cls(tier.name, tier.minTime, tier.maxTime, resolution)
+        pt.times = tier.toTicks(resolution)
+        pt.marks = [point.mark for point in tier]
+        pt.vocabulary = tier.vocabulary
+        return pt
+
+
+class TickIntervalTier(_TickTier):
+    """
+    Represents Praat IntervalTiers as a list of marks and parallel arrays
+    of their start and end times in integer ticks at a fixed resolution
+    (by default, HTK's 100ns), on which adding, removing, lookups and
+    comparisons work directly, so that they are exact. Intervals, with
+    times in seconds, are made on demand when the tier is indexed or
+    iterated over, as a view; changing them does not change the tier.
+    Overlapping Intervals are never allowed: a TickIntervalTier is
+    always strict, whatever its strict attribute (which is set by
+    TextGrid.append), since lookups bisect on its end times. Read
+    TextGrids with a resolution to get these in place of IntervalTiers
+    (see TextGrid.read), and use toIntervalTier for what else an
+    IntervalTier can do; TextGrid methods which need that raise a
+    TypeError for TextGrids with these tiers.
+    """
+
+    def __init__(self, name=None, minTime=0., maxTime=None,
+                 resolution=DEFAULT_TICK_RESOLUTION):
+        _TickTier.__init__(self, name, minTime, maxTime, resolution)
+        self.starts = array('q')
+        self.ends = array('q')
+
+    def __eq__(self, other):
+        if not isinstance(other, TickIntervalTier):
+            return False
+        return self.rate == other.rate and self.starts == other.starts and \
+            self.ends == other.ends and self.marks == other.marks
+
+    def __str__(self):
+        return '<TickIntervalTier {0}, {1} intervals>'.format(self.name,
+                                                              len(self))
+
+    def __repr__(self):
+        return 'TickIntervalTier({0}, {1})'.format(self.name, list(self))
+
+    def __iter__(self):
+        time = self._time
+        for (start, end, mark) in zip(self.starts, self.ends, self.marks):
+            yield Interval(time(start), time(end), mark)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return Interval(self._time(self.starts[i]), self._time(self.ends[i]),
+                        self.marks[i])
+
+    def add(self, minTime, maxTime, mark):
+        self.addTicks(self._tick(minTime), self._tick(maxTime), mark)
+
+    def addInterval(self, interval):
+        self.add(interval.minTime, interval.maxTime, interval.mark)
+
+    def addTicks(self, start, end, mark):
+        """
+        Adds an Interval from start to end, in ticks, maintaining order
+        """
+        if start >= end:
+            raise ValueError(self._time(start), self._time(end))
+        if start < self.minTick:  # too early
+            raise ValueError(self.minTime)
+        if self.maxTick is not None and end > self.maxTick:  # too late
+            raise ValueError(self.maxTime)
+        # the first Interval ending after this one starts must not start
+        # before it ends
+        i = bisect_right(self.ends, start)
+        if i < len(self.starts) and self.starts[i] < end:
+            raise ValueError(self[i])
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+        self.marks.insert(i, mark)
+
+    def remove(self, minTime, maxTime, mark):
+        self.removeTicks(self._tick(minTime), self._tick(maxTime))
+
+    def removeInterval(self, interval):
+        self.remove(interval.minTime, interval.maxTime, interval.mark)
+
+    def removeTicks(self, start, end):
+        """
+        Removes the Interval from start to end, in ticks
+        """
+        i = bisect_left(self.starts, start)
+        if i == len(self.starts) or self.starts[i] != start or \
+                self.ends[i] != end:
+            raise ValueError(self._time(start), self._time(end))
+        del self.starts[i]
+        del self.ends[i]
+        del self.marks[i]
+
+    def indexContaining(self, time):
+        """
+        Returns the index of the interval containing the given time point,
+        or None if the time point is outside the bounds of this tier. The
+        argument can be a numeric type, or a Point object.
+        """
+        tick = self._tick(time)
+        i = bisect_left(self.ends, tick)
+        if i != len(self.ends) and self.starts[i] <= tick:
+            return i
+
+    def intervalContaining(self, time):
+        """
+        Returns the interval containing the given time point, or None if
+        the time point is outside the bounds of this tier. The argument
+        can be a numeric type, or a Point object.
+        """
+        i = self.indexContaining(time)
+        if i is not None:
+            return self[i]
+
+    def copy(self):
+        """
+        Returns a copy of the TickIntervalTier
+        """
+        it = TickIntervalTier(self.name, resolution=self.resolution)
+        (it.minTick, it.maxTick) = (self.minTick, self.maxTick)
+        it.starts = array('q', self.starts)
+        it.ends = array('q', self.ends)
+        it.marks = list(self.marks)
+        it.vocabulary = self.vocabulary
+        return it
+
+    def shift(self, offset):
+        """
+        Shifts the IntervalTier and all its Intervals by offset seconds
+        (rounded to the nearest tick)
+        """
+        offset = self._tick(offset)
+        self.minTick += offset
+        if self.maxTick is not None:
+            self.maxTick += offset
+        self.starts = array('q', [tick + offset for tick in self.starts])
+        self.ends = array('q', [tick + offset for tick in self.ends])
+
+    def validate(self):
+        """
+        As IntervalTier.validate, comparing ticks; since there can be no
+        Interval without a positive duration, problems of that kind give
+        a (minTime, maxTime, mark) triple in its place
+        """
+        issues = []
+        prev = None
+        for (i, (start, end)) in enumerate(zip(self.starts, self.ends)):
+            if start >= end:
+                issues.append(('duration', i, (self._time(start),
+                                               self._time(end),
+                                               self.marks[i])))
+                prev = (start, end)
+                continue
+            if start < self.minTick or \
+                    (self.maxTick is not None and end > self.maxTick):
+                issues.append(('bounds', i, self[i]))
+            if prev is not None:
+                if start < prev[0]:
+                    issues.append(('order', i, self[i]))
+                elif start < prev[1]:
+                    issues.append(('overlap', i, self[i]))
+            prev = (start, end)
+        return issues
+
+    def iterFilled(self, null=''):
+        """
+        Iterates over (minTime, maxTime, mark) triples for the Intervals
+        of this tier, with the gaps between them (and up to the tier
+        bounds) filled in by triples whose mark is null, as for
+        IntervalTier.iterFilled; the gaps are found on the ticks
+        """
+        time = self._time
+        prev = self.minTick
+        for (start, end, mark) in zip(self.starts, self.ends, self.marks):
+            if prev < start:
+                yield (time(prev), time(start), null)
+            yield (time(start), time(end), mark)
+            prev = end
+        if self.maxTick is not None and prev < self.maxTick:
+            yield (time(prev), time(self.maxTick), null)
+
+    def _countFilled(self):
+        """
+        Returns the number of triples iterFilled would produce
+        """
+        prev = self.minTick
+        n = len(self.starts)
+        for (start, end) in zip(self.starts, self.ends):
+            if prev < start:
+                n += 1
+            prev = end
+        if self.maxTick is not None and prev < self.maxTick:
+            n += 1
+        return n
+
+    def toTicks(self, resolution=None):
+        """
+        Returns a pair of copies of the arrays of start and end times of
+        the Intervals in ticks, at the given resolution (by default, that
+        of the tier)
+        """
+        return (self._ticksAt(self.starts, resolution),
+                self._ticksAt(self.ends, resolution))
+
+    def bounds(self):
+        maxTick = self.maxTick
+        if maxTick is None:
+            maxTick = self.ends[-1]
+        return (self.minTime, self._time(maxTick))
+
+    def toIntervalTier(self):
+        """
+        Returns an IntervalTier of the Intervals of the TickIntervalTier
+        """
+        it = IntervalTier(self.name, self.minTime, self.maxTime)
+        it.intervals = list(self)
+        it.vocabulary = self.vocabulary
+        return it
+
+    # alternative constructors
+
+    @classmethod
+    def fromIntervalTier(cls, tier, resolution=DEFAULT_TICK_RESOLUTION):
+        """
+        Builds a TickIntervalTier from an IntervalTier, rounding its times
+        to the nearest tick at the given resolution
+        """
+        it = cls(tier.name, tier.minTime, tier.maxTime, resolution)
+        (it.starts, it.ends) = tier.toTicks(resolution)
+        it.marks = [interval.mark for interval in tier]
+        it.vocabulary = tier.vocabulary
+        return it
+
+
+def _checkTiers(tiers, operation):
+    """
+    Raises a TypeError if any of the tiers stores its times as ticks,
+    which operation does not support
+    """
+    for tier in tiers:
+        if isinstance(tier, _TickTier):
+            raise TypeError('{0} does not support {1} {2}; convert it with '
+                            '{3}() first'.format(
+                                operation, tier.__class__.__name__, tier.name,
+                                'toIntervalTier' if
+                                isinstance(tier, TickIntervalTier) else
+                                'toPointTier'))
+
+
+def parse_line(line, short, to_round):
+    line = line.strip()
     if short:
         if '"' in line:
             return line[1:-1]
@@ -594,6 +2452,207 @@ def parse_header(source):
     return (file_type, short)
 
 
+def _iterChronological(text):
+    """
+    Iterates over the tokens of a Praat chronological TextGrid file:
+    strings (with their double-quotes, and possibly spanning lines) and
+    numbers, skipping the "!" comments which run to the end of a line
+    """
+    for m in re.finditer(r'"(?:[^"]|"")*"|![^\n]*|[^\s"!]+', text):
+        token = m.group()
+        if not token.startswith('!'):
+            yield token
+
+
+def _readTextGridHeader(source, round_digits):
+    """
+    Reads the header of a Praat-formatted TextGrid file from source,
+    returning whether it is in the short format, its bounds, and the
+    number of tiers
+    """
+    file_type, short = parse_header(source)
+    if file_type != 'TextGrid':
+        raise TextGridError('The file could not be parsed as a TextGrid as it is lacking a proper header.')
+
+    first_line_beside_header = source.readline()
+    try:
+        parse_line(first_line_beside_header, short, round_digits)
+    except Exception:
+        short = True
+
+    minTime = parse_line(first_line_beside_header, short, round_digits)
+    maxTime = parse_line(source.readline(), short, round_digits)
+    source.readline()  # more header junk
+    if short:
+        m = int(source.readline().strip())  # will be self.n
+    else:
+        m = int(source.readline().strip().split()[2])  # will be self.n
+    if not short:
+        source.readline()
+    return (short, minTime, maxTime, m)
+
+
+def _readTier(source, short, round_digits, vocabulary, strict=True,
+              check=True):
+    """
+    Read one tier of a Praat-formatted TextGrid file from source
+    """
+    if not short:
+        source.readline()
+    if parse_line(source.readline(), short, round_digits) == 'IntervalTier':
+        inam = parse_line(source.readline(), short, round_digits)
+        imin = parse_line(source.readline(), short, round_digits)
+        imax = parse_line(source.readline(), short, round_digits)
+        itie = IntervalTier(inam, imin, imax)
+        itie.strict = strict
+        itie.vocabulary = vocabulary
+        n = int(parse_line(source.readline(), short, round_digits))
+        for j in range(n):
+            if not short:
+                source.readline().rstrip().split()  # header junk
+            jmin = parse_line(source.readline(), short, round_digits)
+            jmax = parse_line(source.readline(), short, round_digits)
+            jmrk = vocabulary.intern(_getMark(source, short))
+            if jmin >= jmax:  # null
+                continue
+            if check:
+                itie.addInterval(Interval(jmin, jmax, jmrk))
+            else:
+                itie.intervals.append(Interval(jmin, jmax, jmrk))
+    else:  # pointTier
+        inam = parse_line(source.readline(), short, round_digits)
+        imin = parse_line(source.readline(), short, round_digits)
+        imax = parse_line(source.readline(), short, round_digits)
+        itie = PointTier(inam, imin, imax)
+        itie.vocabulary = vocabulary
+        n = int(parse_line(source.readline(), short, round_digits))
+        for j in range(n):
+            if not short:
+                source.readline().rstrip()  # header junk
+            jtim = parse_line(source.readline(), short, round_digits)
+            jmrk = vocabulary.intern(_getMark(source, short))
+            if check:
+                itie.addPoint(Point(jtim, jmrk))
+            else:
+                itie.points.append(Point(jtim, jmrk))
+    return itie
+
+
+def _readTickTier(source, short, resolution, vocabulary, check=True):
+    """
+    Read one tier of a Praat-formatted TextGrid file from source into a
+    TickIntervalTier or TickPointTier, parsing times directly into ticks
+    """
+    rate = _tickRate(resolution)
+    intern = vocabulary.intern
+
+    def ticks():
+        line = source.readline()
+        return _parseTicks(line if short else line.rsplit('=', 1)[1], rate)
+
+    if not short:
+        source.readline()
+    if parse_line(source.readline(), short, None) == 'IntervalTier':
+        itie = TickIntervalTier(parse_line(source.readline(), short, None),
+                                resolution=resolution)
+        itie.minTick = ticks()
+        itie.maxTick = ticks()
+        itie.vocabulary = vocabulary
+        (starts, ends, marks) = (itie.starts, itie.ends, itie.marks)
+        n = int(parse_line(source.readline(), short, None))
+        for j in range(n):
+            if not short:
+                source.readline()  # header junk
+            start = ticks()
+            end = ticks()
+            mark = intern(_getMark(source, short))
+            if start >= end:  # null
+                continue
+            if check:
+                itie.addTicks(start, end, mark)
+            else:
+                starts.append(start)
+                ends.append(end)
+                marks.append(mark)
+    else:  # pointTier
+        itie = TickPointTier(parse_line(source.readline(), short, None),
+                             resolution=resolution)
+        itie.minTick = ticks()
+        itie.maxTick = ticks()
+        itie.vocabulary = vocabulary
+        (times, marks) = (itie.times, itie.marks)
+        n = int(parse_line(source.readline(), short, None))
+        for j in range(n):
+            if not short:
+                source.readline()  # header junk
+            tick = ticks()
+            mark = intern(_getMark(source, short))
+            if check:
+                itie.addTicks(tick, mark)
+            else:
+                times.append(tick)
+                marks.append(mark)
+    return itie
+
+
+def _toTickTier(tier, resolution):
+    """
+    Returns the TickIntervalTier or TickPointTier for the given tier
+    """
+    if isinstance(tier, IntervalTier):
+        return TickIntervalTier.fromIntervalTier(tier, resolution)
+    return TickPointTier.fromPointTier(tier, resolution)
+
+
+def _parseTier(text, short, round_digits, strict, check, resolution=None):
+    """
+    Parse one tier from the given text (in a worker process)
+    """
+    if resolution is not None:
+        return _readTickTier(StringIO(text), short, resolution, Vocabulary(),
+                             check)
+    return _readTier(StringIO(text), short, round_digits, Vocabulary(),
+                     strict, check)
+
+
+def _splitTiers(text, short, m):
+    """
+    Split the text of the m tiers of a Praat-formatted TextGrid file into
+    one string per tier, or return None if that cannot be done. In the
+    long format, tiers begin at their "item [i]:" headers; in the short
+    format, which has no such headers, the tiers are skipped over using
+    the number of Intervals or Points given in each tier's header.
+    """
+    if not short:
+        starts = [match.start() for match in
+                  re.finditer(r'^[ \t]*item \[\d+\]:[ \t]*$', text, re.M)]
+        if len(starts) != m:
+            return None
+        starts.append(len(text))
+        return [text[starts[i]:starts[i + 1]] for i in range(m)]
+    lines = text.splitlines(True)
+    chunks = []
+    i = 0
+    try:
+        for k in range(m):
+            start = i
+            lines_per_entry = 2 if lines[i].strip() == '"IntervalTier"' else 1
+            n = int(lines[i + 4])
+            i += 5
+            for j in range(n):
+                i += lines_per_entry
+                # marks may span lines, until the double-quotes balance
+                quotes = lines[i].count('"')
+                i += 1
+                while quotes % 2:
+                    quotes += lines[i].count('"')
+                    i += 1
+            chunks.append(''.join(lines[start:i]))
+    except (IndexError, ValueError):
+        return None
+    return chunks
+
+
 class TextGrid(object):
     """
     Represents Praat TextGrids as list of sequence types of tiers (e.g.,
@@ -622,7 +2681,8 @@ class TextGrid(object):
         if not hasattr(other, 'tiers'):
             return False
         else:
-            return all([a == b for a, b in zip(self.tiers, other.tiers)])
+            return len(self.tiers) == len(other.tiers) and \
+                   all(a == b for a, b in zip(self.tiers, other.tiers))
 
     def __str__(self):
         return '<TextGrid {0}, {1} Tiers>'.format(self.name, len(self))
@@ -671,8 +2731,9 @@ class TextGrid(object):
         if self.maxTime is not None and tier.maxTime is not None and tier.maxTime > self.maxTime:
             raise ValueError(self.maxTime)  # too late
         tier.strict = self.strict
-        for i in tier:
-            i.strict = self.strict
+        if not isinstance(tier, _TickTier):  # whose Intervals are views
+            for i in tier:
+                i.strict = self.strict
         self.tiers.append(tier)
 
     def extend(self, tiers):
@@ -689,104 +2750,336 @@ class TextGrid(object):
         """
         return (self.tiers.pop(i) if i else self.tiers.pop())
 
-    def read(self, f, round_digits=DEFAULT_TEXTGRID_PRECISION, encoding=None):
+    def copy(self):
+        """
+        Returns a copy of the TextGrid whose tiers are copies of its tiers,
+        sharing their Intervals and Points until they are changed (see
+        IntervalTier.copy), so that copying is cheap and unchanged tiers
+        cost nothing
+        """
+        tg = TextGrid(self.name, self.minTime, self.maxTime, self.strict)
+        tg.tiers = [tier.copy() for tier in self.tiers]
+        return tg
+
+    def crop(self, start, end, mode='truncate', rebase=False):
+        """
+        Returns a new TextGrid spanning start to end, with every tier
+        cropped to that window. See IntervalTier.crop for the meaning of
+        mode and rebase.
+        """
+        _checkTiers(self.tiers, 'TextGrid.crop')
+        tiers = [tier.crop(start, end, mode, rebase) for tier in self.tiers]
+        offset = start if rebase else 0.
+        minTime = min([start - offset] + [t.minTime for t in tiers])
+        maxTime = max([end - offset] + [t.maxTime for t in tiers])
+        tg = TextGrid(self.name, minTime, maxTime, self.strict)
+        tg.tiers = tiers
+        return tg
+
+    def validate(self):
+        """
+        Checks every tier (see IntervalTier.validate and
+        PointTier.validate), and that each lies within the bounds of the
+        TextGrid. Returns a list of (kind, k, i, item) tuples, one for each
+        problem found, where k is the index of the tier, and i and item are
+        the index of and offending Interval or Point (or None and the tier
+        itself, for tiers out of bounds).
+        """
+        issues = []
+        for (k, tier) in enumerate(self.tiers):
+            if tier.minTime < self.minTime or \
+                    (self.maxTime is not None and tier.maxTime is not None and
+                     tier.maxTime > self.maxTime):
+                issues.append(('bounds', k, None, tier))
+            for (kind, i, item) in tier.validate():
+                issues.append((kind, k, i, item))
+        return issues
+
+    def shift(self, offset):
+        """
+        Shifts the TextGrid and all its tiers by offset seconds
+        """
+        self.minTime += offset
+        if self.maxTime is not None:
+            self.maxTime += offset
+        for tier in self.tiers:
+            tier.shift(offset)
+
+    def scale(self, factor):
+        """
+        Multiplies all times in the TextGrid by the positive factor
+        """
+        if factor <= 0:
+            raise ValueError(factor)
+        _checkTiers(self.tiers, 'TextGrid.scale')
+        self.minTime *= factor
+        if self.maxTime is not None:
+            self.maxTime *= factor
+        for tier in self.tiers:
+            tier.scale(factor)
+
+    def fingerprint(self, precision=DEFAULT_TEXTGRID_PRECISION, cache=False):
+        """
+        Returns a stable hash (as a hexadecimal string) of the name and
+        bounds of the TextGrid and the fingerprints of its tiers, in
+        order; TextGrids with the same fingerprint have the same content,
+        with times equal to the given precision. The tiers' fingerprints
+        are cached if cache is True (see IntervalTier.fingerprint).
+        """
+        _checkTiers(self.tiers, 'TextGrid.fingerprint')
+        digest = hashlib.blake2b(digest_size=16)
+        name = '' if self.name is None else self.name
+        digest.update('TextGrid\t{0}:{1}\t{2}\t{3}\n'.format(
+            len(name), name, _formatTime(self.minTime, precision),
+            _formatTime(self.maxTime, precision)).encode('UTF-8'))
+        for tier in self.tiers:
+            digest.update(tier.fingerprint(precision, cache).encode('UTF-8'))
+        return digest.hexdigest()
+
+    def memoryUsage(self, deep=True):
+        """
+        Returns a dictionary estimating the memory used by the TextGrid, in
+        bytes, as for the tiers' memoryUsage, and with a list of the
+        tiers' own reports under 'tiers'. Marks and times shared between
+        tiers are counted in the first tier using them, and the
+        Vocabularies of the tiers count towards 'marks'.
+        """
+        _checkTiers(self.tiers, 'TextGrid.memoryUsage')
+        seen = set()
+        tiers = [tier.memoryUsage(deep, seen) for tier in self.tiers]
+        usage = {'name': self.name, 'class': self.__class__.__name__,
+                 'count': sum(u['count'] for u in tiers),
+                 'objects': getsizeof(self) + getsizeof(self.__dict__) +
+                 getsizeof(self.tiers), 'tiers': tiers}
+        for key in ('objects', 'times', 'marks'):
+            usage[key] = usage.get(key, 0) + sum(u[key] for u in tiers)
+        if deep:
+            for tier in self.tiers:
+                vocabulary = tier.vocabulary
+                if vocabulary is None or id(vocabulary) in seen:
+                    continue
+                seen.add(id(vocabulary))
+                usage['marks'] += getsizeof(vocabulary.marks) + \
+                    getsizeof(vocabulary.codes)
+                for mark in vocabulary.marks:
+                    if id(mark) not in seen:
+                        seen.add(id(mark))
+                        usage['marks'] += getsizeof(mark)
+        usage['total'] = usage['objects'] + usage['times'] + usage['marks']
+        return usage
+
+    def _getMaxTime(self):
+        """
+        Return the maximum time, inferring it from the tiers if need be
+        """
+        if self.maxTime is not None:
+            return self.maxTime
+        return max(t.bounds()[1] for t in self.tiers if len(t) or t.maxTime)
+
+    def read(self, f, round_digits=DEFAULT_TEXTGRID_PRECISION, encoding=None,
+             vocabulary=None, check=True, processes=None, resolution=None):
         """
         Read the tiers contained in the Praat-formatted TextGrid file
         indicated by string f. Times are rounded to the specified precision.
+        Marks are interned through the given Vocabulary (which may be
+        shared across many TextGrids), or through a new one shared by the
+        tiers of this TextGrid. If check is False, Intervals and Points are
+        taken in file order without checking, which is much faster; call
+        validate() afterwards to check them all at once.
+
+        If processes is given, the file is first split into tiers, which
+        are then parsed in parallel by that many processes (or as many as
+        there are CPUs, if it is 0); this gives the same result as reading
+        sequentially, and pays off for very large TextGrids.
+
+        Files in Praat's chronological text format, in which the Intervals
+        and Points of all tiers are interleaved in time order, are also
+        read (sequentially).
+
+        If resolution is given (e.g., DEFAULT_TICK_RESOLUTION, HTK's
+        100ns), times are parsed directly into integer ticks at that
+        resolution, instead of being rounded to round_digits, and the
+        tiers are read as TickIntervalTiers and TickPointTiers. (Files in
+        the chronological format are read as usual, then converted.)
+        These are always strict, even if the TextGrid is not, so overlaps
+        raise a ValueError; read with check=False and call validate() to
+        find them all.
         """
+        if vocabulary is None:
+            vocabulary = Vocabulary()
         if encoding is None:
             encoding = detectEncoding(f)
         with codecs.open(f, 'r', encoding=encoding) as source:
-            file_type, short = parse_header(source)
-            if file_type != 'TextGrid':
-                raise TextGridError('The file could not be parsed as a TextGrid as it is lacking a proper header.')
+            if source.readline().strip().lstrip('\ufeff') == \
+                    CHRONOLOGICAL_HEADER:
+                self._readChronological(source.read(), round_digits,
+                                        vocabulary, check)
+                if resolution is not None:
+                    self.tiers = [_toTickTier(tier, resolution) for tier in
+                                  self.tiers]
+                return
+            source.seek(0)
+            if processes is not None:
+                source = StringIO(source.read())
+            (short, self.minTime, self.maxTime, m) = \
+                _readTextGridHeader(source, round_digits)
+            if processes is not None:
+                start = source.tell()
+                chunks = _splitTiers(source.read(), short, m)
+                if chunks is not None:
+                    self._readParallel(chunks, short, round_digits,
+                                       vocabulary, check, processes,
+                                       resolution)
+                    return
+                source.seek(start)  # couldn't split, so read sequentially
+            for i in range(m):  # loop over grids
+                if resolution is not None:
+                    self.append(_readTickTier(source, short, resolution,
+                                              vocabulary, check))
+                else:
+                    self.append(_readTier(source, short, round_digits,
+                                          vocabulary, self.strict, check))
+
+    def _readParallel(self, chunks, short, round_digits, vocabulary, check,
+                      processes, resolution=None):
+        """
+        Parse the given tier bodies in a pool of processes, and append the
+        tiers in order
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        n = len(chunks)
+        with ProcessPoolExecutor(processes or None) as executor:
+            tiers = list(executor.map(_parseTier, chunks, [short] * n,
+                                      [round_digits] * n, [self.strict] * n,
+                                      [check] * n, [resolution] * n))
+        intern = vocabulary.intern
+        for tier in tiers:
+            # re-intern the marks, which were interned separately in each
+            # process
+            if isinstance(tier, _TickTier):
+                tier.marks = [intern(mark) for mark in tier.marks]
+            else:
+                for item in tier:
+                    item.mark = intern(item.mark)
+            tier.vocabulary = vocabulary
+            self.append(tier)
 
-            first_line_beside_header = source.readline()
-            try:
-                parse_line(first_line_beside_header, short, round_digits)
-            except Exception:
-                short = True
+    def _readChronological(self, text, round_digits, vocabulary, check):
+        """
+        Read the tiers from the text following the header of a Praat
+        chronological TextGrid file
+        """
+        tokens = _iterChronological(text)
 
-            self.minTime = parse_line(first_line_beside_header, short, round_digits)
-            self.maxTime = parse_line(source.readline(), short, round_digits)
-            source.readline()  # more header junk
-            if short:
-                m = int(source.readline().strip())  # will be self.n
+        def number():
+            return round(float(next(tokens)), round_digits)
+
+        def string():
+            token = next(tokens)
+            if not token.startswith('"'):
+                raise ValueError('Bad entry: ' + token)
+            return token[1:-1].replace('""', '"')
+
+        try:
+            self.minTime = number()
+            self.maxTime = number()
+            for i in range(int(next(tokens))):
+                cls = string()
+                if cls == 'IntervalTier':
+                    tier = IntervalTier(string(), number(), number())
+                    tier.strict = self.strict
+                elif cls == 'TextTier':
+                    tier = PointTier(string(), number(), number())
+                else:
+                    raise TextGridError('Unknown tier class: ' + cls)
+                tier.vocabulary = vocabulary
+                self.append(tier)
+            for token in tokens:
+                tier = self.tiers[int(token) - 1]
+                if isinstance(tier, IntervalTier):
+                    jmin = number()
+                    jmax = number()
+                    jmrk = vocabulary.intern(string())
+                    if jmin >= jmax:  # null
+                        continue
+                    if check:
+                        tier.addInterval(Interval(jmin, jmax, jmrk))
+                    else:
+                        tier.intervals.append(Interval(jmin, jmax, jmrk))
+                else:
+                    jtim = number()
+                    jmrk = vocabulary.intern(string())
+                    if check:
+                        tier.addPoint(Point(jtim, jmrk))
+                    else:
+                        tier.points.append(Point(jtim, jmrk))
+        except StopIteration:
+            raise EOFError('Unexpected end of chronological TextGrid')
+
+    def iterEvents(self, null=None):
+        """
+        Iterates over (time, k, item) triples for the Intervals and Points
+        of all tiers, where k is the index of the item's tier, in order of
+        time (the start time, for Intervals) and then of k. This is a lazy
+        k-way merge of the tiers. If null is given, the gaps in
+        IntervalTiers are filled in by Intervals whose mark is null.
+        """
+        def events(k, tier):
+            if isinstance(tier, (IntervalTier, TickIntervalTier)):
+                if null is None:
+                    for interval in tier:
+                        yield (interval.minTime, k, interval)
+                else:
+                    for (minTime, maxTime, mark) in tier.iterFilled(null):
+                        yield (minTime, k, Interval(minTime, maxTime, mark))
             else:
-                m = int(source.readline().strip().split()[2])  # will be self.n
-            if not short:
-                source.readline()
-            for i in range(m):  # loop over grids
-                if not short:
-                    source.readline()
-                if parse_line(source.readline(), short, round_digits) == 'IntervalTier':
-                    inam = parse_line(source.readline(), short, round_digits)
-                    imin = parse_line(source.readline(), short, round_digits)
-                    imax = parse_line(source.readline(), short, round_digits)
-                    itie = IntervalTier(inam, imin, imax)
-                    itie.strict = self.strict
-                    n = int(parse_line(source.readline(), short, round_digits))
-                    for j in range(n):
-                        if not short:
-                            source.readline().rstrip().split()  # header junk
-                        jmin = parse_line(source.readline(), short, round_digits)
-                        jmax = parse_line(source.readline(), short, round_digits)
-                        jmrk = _getMark(source, short)
-                        if jmin < jmax:  # non-null
-                            itie.addInterval(Interval(jmin, jmax, jmrk))
-                    self.append(itie)
-                else:  # pointTier
-                    inam = parse_line(source.readline(), short, round_digits)
-                    imin = parse_line(source.readline(), short, round_digits)
-                    imax = parse_line(source.readline(), short, round_digits)
-                    itie = PointTier(inam)
-                    n = int(parse_line(source.readline(), short, round_digits))
-                    for j in range(n):
-                        source.readline().rstrip()  # header junk
-                        jtim = parse_line(source.readline(), short, round_digits)
-                        jmrk = _getMark(source, short)
-                        itie.addPoint(Point(jtim, jmrk))
-                    self.append(itie)
+                for point in tier:
+                    yield (point.time, k, point)
+        return heapq.merge(*[events(k, tier) for (k, tier) in
+                             enumerate(self.tiers)], key=itemgetter(0, 1))
 
-    def write(self, f, null=''):
+    def write(self, f, null='', format='long'):
         """
         Write the current state into a Praat-format TextGrid file. f may
         be a file object to write to, or a string naming a path to open
-        for writing.
+        for writing. format is one of TEXTGRID_FORMATS: Praat's 'long'
+        text format, or its 'chronological' one, in which the Intervals
+        and Points of all tiers are interleaved in time order.
         """
+        if format not in TEXTGRID_FORMATS:
+            raise ValueError(format)
         sink = f if hasattr(f, 'write') else codecs.open(f, 'w', 'UTF-8')
+        if format == 'chronological':
+            self._writeChronological(sink, null)
+            sink.close()
+            return
         print('File type = "ooTextFile"', file=sink)
         print('Object class = "TextGrid"\n', file=sink)
         print('xmin = {0}'.format(self.minTime), file=sink)
         # compute max time
-        maxT = self.maxTime
-        if not maxT:
-            maxT = max([t.maxTime if t.maxTime else t[-1].maxTime \
-                        for t in self.tiers])
+        maxT = self._getMaxTime()
         print('xmax = {0}'.format(maxT), file=sink)
         print('tiers? <exists>', file=sink)
         print('size = {0}'.format(len(self)), file=sink)
         print('item []:', file=sink)
         for (i, tier) in enumerate(self.tiers, 1):
             print('\titem [{0}]:'.format(i), file=sink)
-            if tier.__class__ == IntervalTier:
+            if tier.__class__ in (IntervalTier, TickIntervalTier):
                 print('\t\tclass = "IntervalTier"', file=sink)
                 print('\t\tname = "{0}"'.format(tier.name), file=sink)
                 print('\t\txmin = {0}'.format(tier.minTime), file=sink)
                 print('\t\txmax = {0}'.format(maxT), file=sink)
-                # compute the number of intervals and make the empty ones
-                output = tier._fillInTheGaps(null)
+                # compute the number of intervals, counting the empty ones
                 print('\t\tintervals: size = {0}'.format(
-                    len(output)), file=sink)
-                for (j, interval) in enumerate(output, 1):
+                    tier._countFilled()), file=sink)
+                for (j, (minTime, maxTime, mark)) in \
+                        enumerate(tier.iterFilled(null), 1):
                     print('\t\t\tintervals [{0}]:'.format(j), file=sink)
-                    print('\t\t\t\txmin = {0}'.format(
-                        interval.minTime), file=sink)
-                    print('\t\t\t\txmax = {0}'.format(
-                        interval.maxTime), file=sink)
-                    mark = _formatMark(interval.mark)
-                    print('\t\t\t\ttext = "{0}"'.format(mark), file=sink)
-            elif tier.__class__ == PointTier:  # PointTier
+                    print('\t\t\t\txmin = {0}'.format(minTime), file=sink)
+                    print('\t\t\t\txmax = {0}'.format(maxTime), file=sink)
+                    print('\t\t\t\ttext = "{0}"'.format(_formatMark(mark)),
+                          file=sink)
+            elif tier.__class__ in (PointTier, TickPointTier):  # PointTier
                 print('\t\tclass = "TextTier"', file=sink)
                 print('\t\tname = "{0}"'.format(tier.name), file=sink)
                 print('\t\txmin = {0}'.format(tier.minTime), file=sink)
@@ -799,7 +3092,57 @@ class TextGrid(object):
                     print('\t\t\t\tmark = "{0}"'.format(mark), file=sink)
         sink.close()
 
-    # alternative constructor
+    def _writeChronological(self, sink, null):
+        maxT = self._getMaxTime()
+        print(CHRONOLOGICAL_HEADER, file=sink)
+        print('{0} {1}   ! Time domain.'.format(self.minTime, maxT), file=sink)
+        print('{0}   ! Number of tiers.'.format(len(self)), file=sink)
+        for tier in self.tiers:
+            cls = 'IntervalTier' if isinstance(
+                tier, (IntervalTier, TickIntervalTier)) else 'TextTier'
+            # as in the long format, a name of None is written as such
+            name = _formatMark('{0}'.format(tier.name))
+            print('"{0}" "{1}" {2} {3}'.format(cls, name, tier.minTime, maxT),
+                  file=sink)
+        for (time, k, item) in self.iterEvents(null):
+            print('\n! {0}:'.format(self.tiers[k].name), file=sink)
+            if isinstance(item, Interval):
+                print('{0} {1} {2}'.format(k + 1, item.minTime, item.maxTime),
+                      file=sink)
+            else:
+                print('{0} {1}'.format(k + 1, item.time), file=sink)
+            print('"{0}"'.format(_formatMark(item.mark)), file=sink)
+
+    def toDict(self):
+        """
+        Returns the TextGrid as a dictionary of plain lists, numbers and
+        strings, laid out by column: each IntervalTier has lists 'xmins',
+        'xmaxs' and 'marks', and each PointTier lists 'times' and 'marks'.
+        """
+        tiers = []
+        for tier in self.tiers:
+            if isinstance(tier, (IntervalTier, TickIntervalTier)):
+                tiers.append({'class': 'IntervalTier', 'name': tier.name,
+                              'xmin': tier.minTime, 'xmax': tier.maxTime,
+                              'xmins': [x.minTime for x in tier],
+                              'xmaxs': [x.maxTime for x in tier],
+                              'marks': [x.mark for x in tier]})
+            else:
+                tiers.append({'class': 'TextTier', 'name': tier.name,
+                              'xmin': tier.minTime, 'xmax': tier.maxTime,
+                              'times': [x.time for x in tier],
+                              'marks': [x.mark for x in tier]})
+        return {'name': self.name, 'xmin': self.minTime,
+                'xmax': self.maxTime, 'tiers': tiers}
+
+    def toJSON(self):
+        """
+        Returns the TextGrid as a compact JSON string (see toDict)
+        """
+        return json.dumps(self.toDict(), separators=(',', ':'),
+                          ensure_ascii=False)
+
+    # alternative constructors
 
     @classmethod
     def fromFile(cls, f, name=None):
@@ -807,6 +3150,469 @@ class TextGrid(object):
         tg.read(f)
         return tg
 
+    @classmethod
+    def concat(cls, grids, name=None):
+        """
+        Concatenates the given TextGrids (e.g., consecutive chunks of a
+        recording) into a new TextGrid, in a single pass. Each TextGrid is
+        shifted to begin where the previous one ends, and tiers with the
+        same name and class are merged, in order of first appearance (the
+        nth tier of a given name in one TextGrid with the nth of that name
+        in the next). Only the seams between chunks are checked for
+        overlaps.
+        """
+        tg = None
+        merged = {}
+        for grid in grids:
+            _checkTiers(grid, 'TextGrid.concat')
+            if tg is None:
+                tg = cls(name, grid.minTime, None, grid.strict)
+                offset = 0.
+            else:
+                offset = tg.maxTime - grid.minTime
+            tg.maxTime = grid._getMaxTime() + offset
+            seen = {}
+            for tier in grid:
+                # tiers may share a name (e.g., one per speaker), so pair
+                # them by their position among the tiers of that name
+                key = (tier.__class__, tier.name)
+                key += (seen.setdefault(key, 0),)
+                seen[key[:2]] += 1
+                if key not in merged:
+                    merged[key] = tier.__class__(tier.name,
+                                                 tier.minTime + offset)
+                    merged[key].strict = tg.strict
+                    merged[key].vocabulary = tier.vocabulary
+                    tg.tiers.append(merged[key])
+                merged[key]._concat(tier, offset)
+            for tier in tg.tiers:
+                tier.maxTime = tg.maxTime
+        if tg is None:
+            raise ValueError('No TextGrids to concatenate')
+        return tg
+
+    @classmethod
+    def fromDict(cls, data, vocabulary=None):
+        """
+        Builds a TextGrid from a dictionary laid out as by toDict. Marks
+        are interned through the given (or a new) Vocabulary. As with
+        read(check=False), the tiers are not checked; see validate().
+        """
+        if vocabulary is None:
+            vocabulary = Vocabulary()
+        intern = vocabulary.intern
+        tg = cls(data['name'], data['xmin'], data['xmax'])
+        for tier in data['tiers']:
+            if tier['class'] == 'IntervalTier':
+                itie = IntervalTier(tier['name'], tier['xmin'], tier['xmax'])
+                itie.intervals = [Interval(xmin, xmax, intern(mark)) for
+                                  (xmin, xmax, mark) in zip(tier['xmins'],
+                                                            tier['xmaxs'],
+                                                            tier['marks'])]
+            else:
+                itie = PointTier(tier['name'], tier['xmin'], tier['xmax'])
+                itie.points = [Point(time, intern(mark)) for (time, mark) in
+                               zip(tier['times'], tier['marks'])]
+            itie.vocabulary = vocabulary
+            tg.tiers.append(itie)
+        return tg
+
+    @classmethod
+    def fromJSON(cls, string, vocabulary=None):
+        """
+        Builds a TextGrid from a JSON string as produced by toJSON
+        """
+        return cls.fromDict(json.loads(string), vocabulary)
+
+
+def _boundsDiffer(a, b, tol):
+    if a is None or b is None:
+        return a is not b
+    return abs(a - b) > tol
+
+
+def _diffIntervals(k, a, b, tol):
+    """
+    Linear merge over two sorted lists of Intervals, yielding the
+    differences between them
+    """
+    i = j = 0
+    while i < len(a) and j < len(b):
+        x = a[i]
+        y = b[j]
+        if abs(x.minTime - y.minTime) <= tol and \
+                abs(x.maxTime - y.maxTime) <= tol:
+            if x.mark != y.mark:
+                yield ('relabeled', k, x, y)
+            i += 1
+            j += 1
+        elif min(x.maxTime, y.maxTime) - max(x.minTime, y.minTime) > tol:
+            yield ('shifted', k, x, y)
+            i += 1
+            j += 1
+        elif x.minTime < y.minTime:
+            yield ('deleted', k, x, None)
+            i += 1
+        else:
+            yield ('inserted', k, None, y)
+            j += 1
+    for x in a[i:]:
+        yield ('deleted', k, x, None)
+    for y in b[j:]:
+        yield ('inserted', k, None, y)
+
+
+def _diffPoints(k, a, b, tol):
+    """
+    Linear merge over two sorted lists of Points, yielding the differences
+    between them. A Point counts as shifted (rather than deleted and
+    inserted) if it has the same mark as its counterpart and neither has a
+    neighbor which is a better match.
+    """
+    i = j = 0
+    while i < len(a) and j < len(b):
+        x = a[i]
+        y = b[j]
+        if abs(x.time - y.time) <= tol:
+            if x.mark != y.mark:
+                yield ('relabeled', k, x, y)
+            i += 1
+            j += 1
+        elif x.mark == y.mark and \
+                (i + 1 == len(a) or a[i + 1].time > y.time + tol) and \
+                (j + 1 == len(b) or b[j + 1].time > x.time + tol):
+            yield ('shifted', k, x, y)
+            i += 1
+            j += 1
+        elif x.time < y.time:
+            yield ('deleted', k, x, None)
+            i += 1
+        else:
+            yield ('inserted', k, None, y)
+            j += 1
+    for x in a[i:]:
+        yield ('deleted', k, x, None)
+    for y in b[j:]:
+        yield ('inserted', k, None, y)
+
+
+def _diffTextGrids(a, b, tol):
+    if _boundsDiffer(a.minTime, b.minTime, tol) or \
+            _boundsDiffer(a.maxTime, b.maxTime, tol):
+        yield ('bounds', None, a, b)
+    for k in range(max(len(a.tiers), len(b.tiers))):
+        x = a.tiers[k] if k < len(a.tiers) else None
+        y = b.tiers[k] if k < len(b.tiers) else None
+        if x is None or y is None or x.__class__ != y.__class__ or \
+                x.name != y.name:
+            yield ('tier', k, x, y)
+            continue
+        if _boundsDiffer(x.minTime, y.minTime, tol) or \
+                _boundsDiffer(x.maxTime, y.maxTime, tol):
+            yield ('bounds', k, x, y)
+        if isinstance(x, IntervalTier):
+            for d in _diffIntervals(k, x.intervals, y.intervals, tol):
+                yield d
+        else:
+            for d in _diffPoints(k, x.points, y.points, tol):
+                yield d
+
+
+def diff(a, b, tol=0., first=False):
+    """
+    Compare TextGrids a and b, returning a list of differences. Tiers are
+    paired up by position, and the Intervals or Points of each pair are
+    compared in a single linear merge; times which differ by no more than
+    tol are considered equal. Each difference is a tuple (kind, k, x, y)
+    where k is the tier index (None for the TextGrid itself), x is the
+    object from a and y is the corresponding object from b (or None).
+    The kinds are:
+
+    'bounds': the minimum or maximum time differs
+    'tier': the tiers differ in class or name, or one is missing
+    'inserted': y is an Interval/Point not in a
+    'deleted': x is an Interval/Point not in b
+    'shifted': x and y correspond, but their times differ
+    'relabeled': x and y have the same times but different marks
+
+    If first is True, comparison stops at the first difference, so that
+    diff(a, b, first=True) is a fast test of equality.
+    """
+    _checkTiers(a, 'diff')
+    _checkTiers(b, 'diff')
+    differences = _diffTextGrids(a, b, tol)
+    if first:
+        for d in differences:
+            return [d]
+        return []
+    return list(differences)
+
+
+def writeJSONL(f, grids):
+    """
+    Write the given TextGrids (any iterable, which is consumed one
+    TextGrid at a time) as JSON Lines, one TextGrid per line (see
+    TextGrid.toJSON). f may be a file object to write to, or a string
+    naming a path for writing. The number of TextGrids is returned.
+    """
+    sink = f if hasattr(f, 'write') else codecs.open(f, 'w', 'UTF-8')
+    n = 0
+    for grid in grids:
+        sink.write(grid.toJSON())
+        sink.write('\n')
+        n += 1
+    if sink is not f:
+        sink.close()
+    return n
+
+
+def iterJSONL(f, vocabulary=None):
+    """
+    Iterate over the TextGrids in a JSON Lines file written by writeJSONL,
+    reading one line at a time. f may be a file object or a string naming
+    a path. Marks are interned through the given (or a new) Vocabulary
+    shared by all the TextGrids.
+    """
+    if vocabulary is None:
+        vocabulary = Vocabulary()
+    source = f if hasattr(f, 'read') else codecs.open(f, 'r', 'UTF-8')
+    try:
+        for line in source:
+            if line.strip():
+                yield TextGrid.fromJSON(line, vocabulary)
+    finally:
+        if source is not f:
+            source.close()
+
+
+class DurationStats(object):
+    """
+    Summary statistics of a collection of durations: their count, total
+    and mean, and quantiles, computed from an array of all the durations.
+    DurationStats are cheap to pickle, and can be merged with update,
+    e.g., to combine those computed for different files in different
+    processes.
+
+    """
+
+    def __init__(self, durations=()):
+        self.durations = array('d', durations)
+        self.total = sum(self.durations)
+        self._sorted = False
+
+    def __repr__(self):
+        return 'DurationStats(count={0}, total={1}, mean={2})'.format(
+            len(self), self.total, self.mean())
+
+    def __len__(self):
+        return len(self.durations)
+
+    @property
+    def count(self):
+        return len(self.durations)
+
+    def add(self, duration):
+        self.durations.append(duration)
+        self.total += duration
+        self._sorted = False
+
+    def update(self, other):
+        """
+        Adds all the durations of other
+        """
+        self.durations.extend(other.durations)
+        self.total += other.total
+        self._sorted = False
+
+    def mean(self):
+        """
+        Returns the mean duration, or None if there are none
+        """
+        if self.durations:
+            return self.total / len(self.durations)
+
+    def quantile(self, q):
+        """
+        Returns the qth quantile (0 <= q <= 1) of the durations,
+        interpolating linearly between them; e.g., quantile(.5) is the
+        median
+        """
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs):
+        """
+        Returns a list of the given quantiles of the durations, sorting
+        them only once
+        """
+        if not self.durations:
+            raise ValueError('No durations')
+        if not self._sorted:
+            self.durations = array('d', sorted(self.durations))
+            self._sorted = True
+        durations = self.durations
+        output = []
+        for q in qs:
+            if not 0. <= q <= 1.:
+                raise ValueError(q)
+            position = q * (len(durations) - 1)
+            i = int(position)
+            if i == len(durations) - 1:
+                output.append(durations[i])
+            else:
+                fraction = position - i
+                output.append(durations[i] +
+                              (durations[i + 1] - durations[i]) * fraction)
+        return output
+
+
+def _addDuration(stats, mark, duration):
+    mark_stats = stats.get(mark)
+    if mark_stats is None:
+        mark_stats = stats[mark] = DurationStats()
+    mark_stats.add(duration)
+
+
+def _scanMark(source, short, skip=False):
+    """
+    Reads a mark as _getMark does, but without regular expressions (nor
+    checking the entry as closely): just the text between its first and
+    last double-quotes, after reading on until the number of
+    double-quotes is even. If skip is True, the mark is only read past.
+    """
+    line = source.readline()
+    quotes = line.count('"')
+    while quotes % 2:
+        next_line = source.readline()
+        if not next_line:
+            raise EOFError('Bad entry: ' + line[:20] + '...')
+        line += next_line
+        quotes += next_line.count('"')
+    if not quotes:
+        raise ValueError('Bad entry: ' + line)
+    if skip:
+        return None
+    return line[line.index('"') + 1:line.rindex('"')].replace('""', '"')
+
+
+def _aggregateTier(source, short, round_digits, tiers, stats):
+    """
+    Reads one tier of a Praat-formatted TextGrid file from source, adding
+    the durations of its Intervals (if it is an IntervalTier whose name is
+    in tiers, or if tiers is None) to stats
+    """
+    if not short:
+        source.readline()
+    is_interval = parse_line(source.readline(), short, round_digits) == \
+        'IntervalTier'
+    name = parse_line(source.readline(), short, round_digits)
+    source.readline()  # bounds
+    source.readline()
+    n = int(parse_line(source.readline(), short, round_digits))
+    if is_interval and (tiers is None or name in tiers):
+        marks = stats.setdefault(name, {})
+    else:
+        marks = None
+    readline = source.readline
+    for j in range(n):
+        if not short:
+            readline()  # header junk
+        if marks is None:  # skipped, so don't parse the times or mark
+            readline()
+            if is_interval:
+                readline()
+            _scanMark(source, short, skip=True)
+            continue
+        # a time is all that follows the "=" (if any) on its line
+        jmin = round(float(readline().rpartition('=')[2]), round_digits)
+        jmax = round(float(readline().rpartition('=')[2]), round_digits)
+        jmrk = _scanMark(source, short)
+        if jmin >= jmax:  # null
+            continue
+        _addDuration(marks, jmrk, round(jmax - jmin, round_digits))
+
+
+def _aggregateChronological(text, round_digits, tiers, stats):
+    """
+    Adds the durations of the Intervals in the text following the header
+    of a Praat chronological TextGrid file to stats
+    """
+    tokens = _iterChronological(text)
+    try:
+        next(tokens)  # bounds
+        next(tokens)
+        columns = []
+        for i in range(int(next(tokens))):
+            is_interval = next(tokens) == '"IntervalTier"'
+            name = next(tokens)[1:-1].replace('""', '"')
+            next(tokens)  # bounds
+            next(tokens)
+            if is_interval and (tiers is None or name in tiers):
+                columns.append((True, stats.setdefault(name, {})))
+            else:
+                columns.append((is_interval, None))
+        for token in tokens:
+            (is_interval, marks) = columns[int(token) - 1]
+            if marks is None:
+                if is_interval:
+                    next(tokens)
+                next(tokens)
+                next(tokens)
+                continue
+            jmin = round(float(next(tokens)), round_digits)
+            jmax = round(float(next(tokens)), round_digits)
+            jmrk = next(tokens)[1:-1].replace('""', '"')
+            if jmin >= jmax:  # null
+                continue
+            _addDuration(marks, jmrk, round(jmax - jmin, round_digits))
+    except StopIteration:
+        raise EOFError('Unexpected end of chronological TextGrid')
+
+
+def durationStats(f, tiers=None, round_digits=DEFAULT_TEXTGRID_PRECISION,
+                  encoding=None):
+    """
+    Computes DurationStats for each mark of each IntervalTier in the
+    Praat-formatted TextGrid file f (or only for the IntervalTiers whose
+    names are in tiers) while reading it, without building any TextGrid,
+    tier or Interval objects. Returns a dictionary mapping each tier name
+    to a dictionary mapping each mark to its DurationStats; these can be
+    combined (e.g., across a corpus) with mergeDurationStats.
+    """
+    if encoding is None:
+        encoding = detectEncoding(f)
+    if tiers is not None:
+        tiers = set(tiers)
+    stats = {}
+    # the io module's readline is much faster than that of codecs readers
+    with open(f, 'r', encoding=encoding) as source:
+        if source.readline().strip().lstrip('\ufeff') == \
+                CHRONOLOGICAL_HEADER:
+            _aggregateChronological(source.read(), round_digits, tiers,
+                                    stats)
+            return stats
+        source.seek(0)
+        (short, minTime, maxTime, m) = _readTextGridHeader(source,
+                                                           round_digits)
+        for i in range(m):
+            _aggregateTier(source, short, round_digits, tiers, stats)
+    return stats
+
+
+def mergeDurationStats(results):
+    """
+    Merges the dictionaries returned by durationStats (e.g., for many
+    files) into one, leaving them unchanged
+    """
+    merged = {}
+    for result in results:
+        for (name, marks) in result.items():
+            merged_marks = merged.setdefault(name, {})
+            for (mark, stats) in marks.items():
+                if mark not in merged_marks:
+                    merged_marks[mark] = DurationStats()
+                merged_marks[mark].update(stats)
+    return merged
+
 
 class MLF(object):
     """
@@ -816,10 +3622,12 @@ class MLF(object):
     used to write all the resulting TextGrids into separate files.
 
     Unlike other classes, this is always initialized from a text file.
+    Labels are interned through a Vocabulary shared by all the TextGrids.
     """
 
-    def __init__(self, f, samplerate=10e6):
+    def __init__(self, f, samplerate=10e6, vocabulary=None):
         self.grids = []
+        self.vocabulary = Vocabulary() if vocabulary is None else vocabulary
         self.read(f, samplerate)
 
     def __iter__(self):
@@ -843,6 +3651,7 @@ class MLF(object):
     def read(self, f, samplerate, round_digits=DEFAULT_MLF_PRECISION):
         source = open(f, 'r')  # HTK returns ostensible ASCII
 
+        intern = self.vocabulary.intern
         source.readline()  # header
         while True:  # loop over text
             name = re.match('\"(.*)\"', source.readline().rstrip())
@@ -850,7 +3659,9 @@ class MLF(object):
                 name = name.groups()[0]
                 grid = TextGrid(name)
                 phon = IntervalTier(name='phones')
+                phon.vocabulary = self.vocabulary
                 word = IntervalTier(name='words')
+                word.vocabulary = self.vocabulary
                 wmrk = ''
                 wsrt = 0.
                 wend = 0.
@@ -861,10 +3672,10 @@ class MLF(object):
                         pmax = round(float(line[1]) / samplerate, round_digits)
                         if pmin == pmax:
                             raise ValueError('null duration interval')
-                        phon.add(pmin, pmax, line[2])
+                        phon.add(pmin, pmax, intern(line[2]))
                         if wmrk:
                             word.add(wsrt, wend, wmrk)
-                        wmrk = decode(line[3])
+                        wmrk = intern(decode(line[3]))
                         wsrt = pmin
                         wend = pmax
                     elif len(line) == 3:  # just phone
@@ -873,11 +3684,11 @@ class MLF(object):
                         if line[2] == 'sp' and pmin != pmax:
                             if wmrk:
                                 word.add(wsrt, wend, wmrk)
-                            wmrk = decode(line[2])
+                            wmrk = intern(decode(line[2]))
                             wsrt = pmin
                             wend = pmax
                         elif pmin != pmax:
-                            phon.add(pmin, pmax, line[2])
+                            phon.add(pmin, pmax, intern(line[2]))
                         wend = pmax
                     else:  # it's a period
                         word.add(wsrt, wend, wmrk)
@@ -906,3 +3717,85 @@ class MLF(object):
             my_path = os.path.join(prefix, root + '.TextGrid')
             grid.write(codecs.open(my_path, 'w', 'UTF-8'))
         return len(self.grids)
+
+    @staticmethod
+    def writeMLF(f, grids, samplerate=10e6, phone_tier='phones',
+                 word_tier='words'):
+        """
+        Write the given TextGrids (any iterable, which is consumed one
+        TextGrid at a time) into a single HTK .mlf file, the inverse of
+        MLF.read. f may be a file object to write to, or a string naming a
+        path for writing. Each TextGrid's name is used as its label file
+        name; its phones are taken from the first tier named phone_tier,
+        and its words (if word_tier is not None) from the first tier named
+        word_tier. The first phone of each word also bears the word, words
+        marked 'sp' are written as (phoneless) short pauses, and times are
+        given in units of 1 / samplerate seconds. A ValueError is raised
+        if a TextGrid lacks either tier.
+
+        The number of TextGrids is returned.
+        """
+        sink = f if hasattr(f, 'write') else codecs.open(f, 'w', 'UTF-8')
+        print('#!MLF!#', file=sink)
+        try:
+            n = 0
+            for grid in grids:
+                name = grid.name if grid.name is not None else \
+                    '{0}.lab'.format(n)
+                print('"{0}"'.format(name), file=sink)
+                phones = MLF._getIntervals(grid, name, phone_tier)
+                words = MLF._getIntervals(grid, name, word_tier) if word_tier \
+                    else []
+                j = 0
+                for word in words:
+                    # phones not in any word
+                    while j < len(phones) and \
+                            phones[j].maxTime <= word.minTime:
+                        MLF._writeLine(sink, phones[j], samplerate)
+                        j += 1
+                    if word.mark == 'sp':
+                        MLF._writeLine(sink, word, samplerate)
+                        while j < len(phones) and \
+                                phones[j].minTime < word.maxTime:
+                            MLF._writeLine(sink, phones[j], samplerate)
+                            j += 1
+                        continue
+                    if j == len(phones) or phones[j].minTime >= word.maxTime:
+                        # a word without phones is its own phone
+                        MLF._writeLine(sink, word, samplerate, word.mark)
+                        continue
+                    MLF._writeLine(sink, phones[j], samplerate, word.mark)
+                    j += 1
+                    while j < len(phones) and \
+                            phones[j].minTime < word.maxTime:
+                        MLF._writeLine(sink, phones[j], samplerate)
+                        j += 1
+                for phone in phones[j:]:
+                    MLF._writeLine(sink, phone, samplerate)
+                print('.', file=sink)
+                n += 1
+        finally:
+            if sink is not f:
+                sink.close()
+        return n
+
+    @staticmethod
+    def _getIntervals(grid, name, tier_name):
+        """
+        Returns a list of the Intervals of the first tier of the TextGrid
+        with the given tier name
+        """
+        tier = grid.getFirst(tier_name)
+        if tier is None:
+            raise ValueError('TextGrid {0} has no tier {1}'.format(name,
+                                                                  tier_name))
+        return list(tier)
+
+    @staticmethod
+    def _writeLine(sink, interval, samplerate, word=None):
+        line = '{0} {1} {2}'.format(int(round(interval.minTime * samplerate)),
+                                    int(round(interval.maxTime * samplerate)),
+                                    interval.mark)
+        if word is not None:
+            line += ' ' + word
+        print(line, file=sink)